@@ -0,0 +1,477 @@
+"""
+Skrip Benchmark Standar dengan Baseline untuk Deteksi Regresi.
+
+Skrip ini dijalankan secara terpisah dari aplikasi utama (GUI), sama seperti
+`report_generator.py`, tetapi sepenuhnya headless (tanpa matplotlib) sehingga
+bisa dijalankan di server atau CI.
+
+Proses yang dilakukan:
+1. Memakai kumpulan posisi tetap dan berversi (BENCHMARK_SUITE), dikelompokkan
+   berdasarkan fase permainan: pembukaan, tengah, dan akhir.
+2. Untuk setiap fase dan depth, semua posisi dicari beberapa kali. Beberapa
+   putaran pemanasan (warmup) dibuang, lalu setiap percobaan dicatat.
+3. Dicatat median dan p95 waktu, jumlah node, node per detik (NPS), dan
+   faktor percabangan efektif (EBF) per fase dan depth.
+4. Hasil disimpan sebagai JSON dan/atau CSV.
+5. Jika baseline diberikan, hasil dibandingkan dengan baseline dan setiap
+   regresi di atas ambang batas dilaporkan (exit code 1). Jumlah node
+   dibandingkan langsung. Waktu dibandingkan setelah dibagi waktu beban
+   kerja kalibrasi (calibration_ms) yang tidak bergantung pada engine,
+   sehingga baseline yang direkam di mesin lain tetap bisa dipakai.
+
+Dengan `--cold-start`, yang diukur adalah waktu start-up engine headless
+(`engine_cli.py`) sebagai proses baru. Jika median-nya melebihi
+COLD_START_BUDGET_MS, atau engine ikut mengimpor salah satu HEAVY_MODULES,
+skrip keluar dengan exit code 1.
+
+Dengan `--scaling`, yang diukur adalah bagaimana engine berskala terhadap
+ukuran papan: untuk setiap geometri di SCALING_GEOMETRIES dicatat node per
+detik, jumlah bit bitboard, jumlah window, memori tabel geometri, dan memori
+puncak pencarian (tracemalloc).
+
+Contoh:
+    python benchmark.py --depths 2,4,6 --trials 5 --output-json hasil.json
+    python benchmark.py --baseline docs/benchmark_baseline.json --threshold 0.10
+    python benchmark.py --baseline docs/benchmark_baseline.json --nodes-only
+    python benchmark.py --cold-start --trials 10
+    python benchmark.py --scaling --depths 4,6 --trials 3 --output-csv skala.csv
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
+from src.geometry import BoardGeometry
+from src.bitboard import BitboardGame
+from src.minimax import get_best_move, tactical_moves
+from src.analyzer import PerformanceAnalyzer, percentile
+
+# Kumpulan posisi benchmark. Setiap posisi ditulis sebagai urutan kolom yang
+# dimainkan bergantian mulai dari Player, dan selalu giliran AI. Tidak ada
+# posisi yang langkahnya dipaksa oleh taktik. Naikkan `version` setiap kali
+# posisi diubah, karena hasil dari versi berbeda tidak bisa dibandingkan.
+BENCHMARK_SUITE = {
+    'version': 1,
+    'positions': {
+        'pembukaan': ["", "3", "15421", "6532345"],
+        'tengah': ["132112346512342", "4520020100564", "231263334210600", "13634225513540236"],
+        'akhir': ["40002523665302213340144", "613556060250245165521014063",
+                  "6315264345346311016410020", "163550036560521631012205430"],
+    },
+}
+
+# Opsi get_best_move selama benchmark: opening book dan solver endgame
+# dimatikan agar yang diukur adalah pencarian depth-terbatas itu sendiri.
+DEFAULT_ENGINE_OPTIONS = {'opening_book': False, 'endgame_threshold': None}
+
+# Ambang batas default: hasil dianggap regresi jika lebih buruk 10% dari baseline
+DEFAULT_THRESHOLD = 0.10
+
+# Jumlah iterasi beban kerja kalibrasi (Python murni, tanpa engine) yang
+# dipakai untuk menormalkan waktu terhadap kecepatan mesin
+CALIBRATION_LOOPS = 100000
+
+# Skrip engine headless yang diukur oleh benchmark cold start
+ENGINE_CLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'engine_cli.py')
+
+# Batas waktu cold start engine headless (ms): proses baru, "isready", lalu keluar
+COLD_START_BUDGET_MS = 150
+
+# Modul yang tidak boleh diimpor engine headless, bahkan setelah mencari
+HEAVY_MODULES = ('numpy', 'psutil', 'tkinter', 'customtkinter', 'matplotlib', 'tracemalloc', 'multiprocessing')
+
+# Kolom file CSV, sesuai urutan kunci setiap baris hasil
+RESULT_FIELDS = ['phase', 'depth', 'positions', 'trials', 'median_ms', 'p95_ms',
+                 'nodes', 'nps', 'ebf']
+
+# Geometri (baris, kolom, panjang garis) yang diukur oleh benchmark skala:
+# papan klasik 6x7, lalu varian lebih besar yang ingin ditawarkan
+SCALING_GEOMETRIES = ((6, 7, 4), (6, 8, 4), (7, 8, 4), (7, 9, 4), (7, 9, 5), (9, 9, 5))
+
+# Jumlah posisi per geometri (termasuk papan kosong), panjang maksimum
+# pembukaan acaknya, dan seed agar posisinya sama di setiap proses
+SCALING_POSITIONS = 4
+SCALING_MAX_PLIES = 9
+SCALING_SEED = 7
+
+# Kolom file CSV untuk benchmark skala
+SCALING_FIELDS = ['geometry', 'depth', 'positions', 'trials', 'median_ms', 'nodes', 'nps',
+                  'bitboard_bits', 'windows', 'table_kb', 'peak_memory_mb']
+
+def run_phase(positions, depth, trials, warmup, engine_options, game_options=None):
+    """
+    Mencari semua posisi satu fase pada `depth`. Setiap percobaan adalah
+    total waktu untuk seluruh posisi fase tersebut. `game_options` (rows,
+    columns, connect) dipakai untuk papan non-default.
+
+    Returns:
+        tuple: (list waktu per percobaan dalam ms, total node per percobaan).
+    """
+    analyzer = PerformanceAnalyzer()
+    times = []
+    nodes = 0
+    for trial in range(warmup + trials):
+        total_ms = 0.0
+        total_nodes = 0
+        for moves in positions:
+            game = Connect4Game.from_moves(moves, **(game_options or {}))
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                get_best_move(game, analyzer, depth=depth, **engine_options)
+            total_ms += (time.perf_counter() - start) * 1000
+            total_nodes += analyzer.nodes_evaluated
+        if trial >= warmup:
+            times.append(total_ms)
+            nodes = total_nodes
+    return times, nodes
+
+def measure_calibration(trials=7):
+    """
+    Waktu (ms) beban kerja Python murni yang tetap, terbaik dari `trials`
+    percobaan. Beban kerja ini tidak memakai engine, jadi hanya mencerminkan
+    kecepatan mesin dan interpreter.
+    """
+    best = None
+    for _ in range(trials):
+        start = time.perf_counter()
+        table, total = {}, 0
+        for i in range(CALIBRATION_LOOPS):
+            table[i & 1023] = i * 2654435761 % (1 << 32)
+            total += table.get((i * 7) & 1023, 0) >> 3
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        best = elapsed_ms if best is None else min(best, elapsed_ms)
+    return best
+
+def run_benchmark(depths, trials=5, warmup=1, phases=None, engine_options=None, suite=BENCHMARK_SUITE):
+    """
+    Menjalankan seluruh benchmark.
+
+    Args:
+        depths (list): Depth yang diuji.
+        trials (int): Jumlah percobaan yang dicatat per fase dan depth.
+        warmup (int): Jumlah percobaan pemanasan yang dibuang.
+        phases (list or None): Fase yang dijalankan (default: semua).
+        engine_options (dict or None): Argumen tambahan untuk get_best_move.
+
+    Returns:
+        dict: Metadata dan daftar baris hasil (lihat RESULT_FIELDS).
+    """
+    if engine_options is None:
+        engine_options = DEFAULT_ENGINE_OPTIONS
+    phases = phases or list(suite['positions'])
+    # Kalibrasi diambil sebelum setiap baris agar perubahan kecepatan mesin
+    # selama benchmark (misalnya turbo atau beban lain) ikut terwakili
+    calibrations = []
+    rows = []
+    for phase in phases:
+        positions = suite['positions'][phase]
+        for depth in depths:
+            calibrations.append(measure_calibration(3))
+            times, nodes = run_phase(positions, depth, trials, warmup, engine_options)
+            median_ms = statistics.median(times)
+            rows.append({
+                'phase': phase,
+                'depth': depth,
+                'positions': len(positions),
+                'trials': trials,
+                'median_ms': round(median_ms, 3),
+                'p95_ms': round(percentile(times, 0.95), 3),
+                'nodes': nodes,
+                'nps': round(nodes / (median_ms / 1000)) if median_ms > 0 else 0,
+                'ebf': round((nodes / len(positions)) ** (1.0 / depth), 3) if nodes > 0 else 0.0,
+            })
+            print(f"  {phase:<10} depth {depth}: median {median_ms:8.1f} ms, p95 {rows[-1]['p95_ms']:8.1f} ms, "
+                  f"{nodes} node, {rows[-1]['nps']} node/s, EBF {rows[-1]['ebf']:.2f}")
+    return {
+        'suite_version': suite['version'],
+        'python': platform.python_version(),
+        'calibration_ms': round(statistics.median(calibrations), 3),
+        'trials': trials,
+        'warmup': warmup,
+        'engine_options': {k: v for k, v in engine_options.items()},
+        'results': rows,
+    }
+
+def save_json(report, path):
+    """
+    Menyimpan laporan benchmark sebagai JSON.
+    """
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+def scaling_positions(rows, columns, connect, count=SCALING_POSITIONS, max_plies=SCALING_MAX_PLIES,
+                      seed=SCALING_SEED):
+    """
+    Posisi benchmark untuk satu geometri: papan kosong ditambah pembukaan
+    acak dengan seed tetap. Seperti BENCHMARK_SUITE, setiap posisi adalah
+    giliran AI (Player melangkah pertama) dan tidak dipaksa oleh taktik.
+
+    Returns:
+        list: Urutan kolom untuk setiap posisi.
+    """
+    rng = random.Random(seed)
+    positions = [[]]
+    while len(positions) < count:
+        game = BitboardGame(rows, columns, connect)
+        moves, piece = [], PLAYER_PIECE
+        for _ in range(rng.randrange(1, max_plies + 1, 2)):
+            col = rng.choice(game.get_valid_locations())
+            row = game.play(col, piece)
+            moves.append(col)
+            if game.winning_move_at(row, col, piece) is not None:
+                break
+            piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+        else:
+            winning, blocking, _ = tactical_moves(game, AI_PIECE)
+            if not winning and not blocking:
+                positions.append(moves)
+    return positions
+
+def geometry_table_kb(rows, columns, connect):
+    """
+    Memori (KB) yang dipakai tabel satu BoardGeometry, diukur dengan
+    tracemalloc pada objek baru (bukan dari cache get_geometry).
+    """
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        geometry = BoardGeometry(rows, columns, connect)
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del geometry
+    return size / 1024
+
+def peak_search_memory_mb(positions, depth, engine_options, game_options):
+    """
+    Memori puncak terbesar (MB, tracemalloc) dari satu pencarian per posisi.
+    Dijalankan terpisah dari pengukuran waktu karena tracemalloc
+    memperlambat pencarian.
+    """
+    analyzer = PerformanceAnalyzer()
+    peak = 0.0
+    for moves in positions:
+        game = Connect4Game.from_moves(moves, **game_options)
+        with contextlib.redirect_stdout(io.StringIO()):
+            get_best_move(game, analyzer, depth=depth, **dict(engine_options, track_memory=True))
+        peak = max(peak, analyzer.memory_usage_mb)
+    return peak
+
+def run_scaling(depths, trials=3, warmup=1, geometries=SCALING_GEOMETRIES, engine_options=None):
+    """
+    Menjalankan benchmark skala: untuk setiap geometri dan depth, posisi dari
+    scaling_positions dicari seperti pada run_phase.
+
+    Returns:
+        dict: Metadata dan daftar baris hasil (lihat SCALING_FIELDS).
+    """
+    if engine_options is None:
+        engine_options = DEFAULT_ENGINE_OPTIONS
+    rows = []
+    for board_rows, columns, connect in geometries:
+        game_options = {'rows': board_rows, 'columns': columns, 'connect': connect}
+        positions = scaling_positions(board_rows, columns, connect)
+        geometry = Connect4Game(**game_options).geometry
+        table_kb = geometry_table_kb(board_rows, columns, connect)
+        for depth in depths:
+            times, nodes = run_phase(positions, depth, trials, warmup, engine_options, game_options)
+            median_ms = statistics.median(times)
+            rows.append({
+                'geometry': f"{board_rows}x{columns} connect-{connect}",
+                'depth': depth,
+                'positions': len(positions),
+                'trials': trials,
+                'median_ms': round(median_ms, 3),
+                'nodes': nodes,
+                'nps': round(nodes / (median_ms / 1000)) if median_ms > 0 else 0,
+                'bitboard_bits': columns * geometry.column_height,
+                'windows': len(geometry.windows),
+                'table_kb': round(table_kb, 1),
+                'peak_memory_mb': round(peak_search_memory_mb(positions, depth, engine_options, game_options), 3),
+            })
+            row = rows[-1]
+            print(f"  {row['geometry']:<18} depth {depth}: median {median_ms:8.1f} ms, {nodes} node, "
+                  f"{row['nps']} node/s, {row['bitboard_bits']} bit, {row['windows']} window, "
+                  f"tabel {row['table_kb']:.1f} KB, memori puncak {row['peak_memory_mb']:.2f} MB")
+    return {
+        'python': platform.python_version(),
+        'trials': trials,
+        'warmup': warmup,
+        'engine_options': {k: v for k, v in engine_options.items()},
+        'results': rows,
+    }
+
+def save_csv(report, path, fields=RESULT_FIELDS):
+    """
+    Menyimpan baris hasil benchmark sebagai CSV.
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(report['results'])
+
+def _run_process_ms(command, stdin_text=''):
+    """
+    Menjalankan `command` sebagai proses baru dan mengembalikan waktu dinding (ms).
+    """
+    start = time.perf_counter()
+    subprocess.run(command, input=stdin_text, capture_output=True, text=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+def heavy_modules_loaded(commands="position 3342\ngo depth 4\ngo movetime 50\nquit\n"):
+    """
+    Menjalankan `commands` di engine headless pada proses baru, lalu
+    mengembalikan HEAVY_MODULES yang ikut terimpor.
+    """
+    code = (
+        "import io, json, runpy, sys\n"
+        f"cli = runpy.run_path({ENGINE_CLI_PATH!r}, run_name='engine_cli')\n"
+        f"cli['run'](io.StringIO({commands!r}), io.StringIO())\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def measure_cold_start(trials=5, warmup=1):
+    """
+    Mengukur waktu start-up engine headless sebagai proses baru (sampai
+    "readyok" lalu keluar), dibandingkan dengan interpreter Python kosong.
+
+    Returns:
+        dict: median/p95 cold start (ms), median interpreter kosong (ms),
+        selisih keduanya (waktu impor engine), dan modul berat yang terimpor.
+    """
+    engine_times, bare_times = [], []
+    for trial in range(warmup + trials):
+        engine_ms = _run_process_ms([sys.executable, ENGINE_CLI_PATH], "isready\nquit\n")
+        bare_ms = _run_process_ms([sys.executable, '-c', 'pass'])
+        if trial >= warmup:
+            engine_times.append(engine_ms)
+            bare_times.append(bare_ms)
+    median_ms = statistics.median(engine_times)
+    interpreter_ms = statistics.median(bare_times)
+    return {
+        'median_ms': round(median_ms, 3),
+        'p95_ms': round(percentile(engine_times, 0.95), 3),
+        'interpreter_ms': round(interpreter_ms, 3),
+        'import_ms': round(median_ms - interpreter_ms, 3),
+        'budget_ms': COLD_START_BUDGET_MS,
+        'heavy_modules': heavy_modules_loaded(),
+    }
+
+def compare_with_baseline(report, baseline, threshold=DEFAULT_THRESHOLD, metrics=('median_ms', 'nodes')):
+    """
+    Membandingkan laporan dengan baseline. Waktu median dan jumlah node yang
+    naik lebih dari `threshold` (misalnya 0.10 = 10%) dianggap regresi.
+    Jika kedua laporan memiliki calibration_ms, waktu median dibandingkan
+    dalam satuan waktu kalibrasi masing-masing, bukan milidetik. Dengan
+    metrics=('nodes',) hanya jumlah node (yang deterministik) dibandingkan,
+    cocok untuk mesin CI yang waktunya sangat bervariasi.
+
+    Returns:
+        list of str: Deskripsi setiap regresi (kosong jika tidak ada).
+
+    Raises:
+        ValueError: Jika versi kumpulan posisi berbeda dengan baseline.
+    """
+    if report['suite_version'] != baseline['suite_version']:
+        raise ValueError(f"Versi suite berbeda: {report['suite_version']} vs baseline {baseline['suite_version']}.")
+    baseline_rows = {(row['phase'], row['depth']): row for row in baseline['results']}
+    # Pembagi waktu: waktu kalibrasi jika keduanya punya, selain itu 1 (milidetik mentah)
+    if report.get('calibration_ms') and baseline.get('calibration_ms'):
+        scale, base_scale, unit = report['calibration_ms'], baseline['calibration_ms'], ' x kalibrasi'
+    else:
+        scale, base_scale, unit = 1.0, 1.0, ''
+    regressions = []
+    for row in report['results']:
+        base = baseline_rows.get((row['phase'], row['depth']))
+        if base is None:
+            continue
+        for metric, value, base_value in (('median_ms', row['median_ms'] / scale, base['median_ms'] / base_scale),
+                                          ('nodes', row['nodes'], base['nodes'])):
+            if metric in metrics and base_value > 0 and value > base_value * (1 + threshold):
+                change = 100.0 * (value / base_value - 1)
+                shown = (f"{base_value:.3f} -> {value:.3f}{unit}" if metric == 'median_ms' and unit
+                         else f"{base_value} -> {value}")
+                regressions.append(f"{row['phase']} depth {row['depth']}: {metric} {shown} (+{change:.1f}%)")
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark standar engine Connect-Four.")
+    parser.add_argument('--depths', default='2,4,6', help="Depth yang diuji, dipisah koma.")
+    parser.add_argument('--trials', type=int, default=5, help="Jumlah percobaan per fase dan depth.")
+    parser.add_argument('--warmup', type=int, default=1, help="Jumlah percobaan pemanasan yang dibuang.")
+    parser.add_argument('--phases', default=None, help="Fase yang dijalankan, dipisah koma (default: semua).")
+    parser.add_argument('--output-json', default=None, help="Simpan hasil sebagai JSON.")
+    parser.add_argument('--output-csv', default=None, help="Simpan hasil sebagai CSV.")
+    parser.add_argument('--baseline', default=None, help="File JSON baseline untuk perbandingan.")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Ambang regresi relatif (0.10 = 10%%).")
+    parser.add_argument('--nodes-only', action='store_true',
+                        help="Bandingkan hanya jumlah node dengan baseline, tanpa waktu.")
+    parser.add_argument('--cold-start', action='store_true',
+                        help="Ukur waktu start-up engine headless alih-alih pencarian.")
+    parser.add_argument('--scaling', action='store_true',
+                        help="Ukur node/detik dan memori untuk setiap ukuran papan di SCALING_GEOMETRIES.")
+    args = parser.parse_args()
+
+    if args.cold_start:
+        result = measure_cold_start(args.trials, args.warmup)
+        print(f"Cold start engine_cli.py: median {result['median_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms "
+              f"(interpreter kosong {result['interpreter_ms']:.1f} ms, impor engine {result['import_ms']:.1f} ms)")
+        failed = False
+        if result['median_ms'] > COLD_START_BUDGET_MS:
+            print(f"Melebihi batas cold start {COLD_START_BUDGET_MS} ms.")
+            failed = True
+        if result['heavy_modules']:
+            print(f"Modul berat ikut terimpor: {', '.join(result['heavy_modules'])}")
+            failed = True
+        sys.exit(1 if failed else 0)
+
+    depths = [int(d) for d in args.depths.split(',')]
+    if args.scaling:
+        print(f"Menjalankan benchmark skala untuk depth {depths}...")
+        report = run_scaling(depths, args.trials, args.warmup)
+        if args.output_json:
+            save_json(report, args.output_json)
+            print(f"Hasil JSON disimpan di: {args.output_json}")
+        if args.output_csv:
+            save_csv(report, args.output_csv, SCALING_FIELDS)
+            print(f"Hasil CSV disimpan di: {args.output_csv}")
+        sys.exit(0)
+
+    phases = args.phases.split(',') if args.phases else None
+    print(f"Menjalankan benchmark suite v{BENCHMARK_SUITE['version']} untuk depth {depths}...")
+    report = run_benchmark(depths, args.trials, args.warmup, phases)
+
+    if args.output_json:
+        save_json(report, args.output_json)
+        print(f"Hasil JSON disimpan di: {args.output_json}")
+    if args.output_csv:
+        save_csv(report, args.output_csv)
+        print(f"Hasil CSV disimpan di: {args.output_csv}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        metrics = ('nodes',) if args.nodes_only else ('median_ms', 'nodes')
+        regressions = compare_with_baseline(report, baseline, args.threshold, metrics)
+        if regressions:
+            print(f"Ditemukan {len(regressions)} regresi (ambang {args.threshold * 100:.0f}%):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("Tidak ada regresi terhadap baseline.")
@@ -0,0 +1,95 @@
+"""
+Skrip untuk Membuat Opening Book secara Offline.
+
+Skrip ini dijalankan secara terpisah dari aplikasi utama (GUI), sama seperti
+`report_generator.py`. Tujuannya adalah menghitung langkah terbaik untuk semua
+posisi awal permainan dengan pencarian yang jauh lebih dalam daripada yang
+sanggup dilakukan UI secara real-time.
+
+Proses yang dilakukan:
+1. Menyusun semua posisi unik (tanpa cerminan) sampai `--ply` bidak, dengan
+   AI sebagai pemain yang akan melangkah.
+2. Mencari setiap posisi dengan depth `--depth` secara paralel menggunakan
+   beberapa proses (`--workers`).
+3. Menulis hasilnya sebagai file biner terurut (lihat src/opening_book.py)
+   yang nantinya dibaca oleh `get_best_move` melalui memory map.
+
+Contoh:
+    python book_generator.py --ply 4 --depth 10 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import inf
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from src.game_logic import PLAYER_PIECE, AI_PIECE, mirror_column
+from src.bitboard import BitboardGame
+from src.minimax import IncrementalEvaluator, search_position, DEFAULT_SEARCH
+from src.transposition import TranspositionTable
+from src.move_ordering import MoveOrderer
+from src.opening_book import DEFAULT_BOOK_PATH, enumerate_book_positions, write_book
+
+# Ukuran Transposition Table untuk setiap posisi yang dicari oleh worker
+BOOK_TT_SIZE = 1 << 18
+
+def search_book_position(moves, depth, search=DEFAULT_SEARCH):
+    """
+    Dijalankan di proses worker: mencari satu posisi book.
+
+    Returns:
+        tuple: (key kanonik, langkah terbaik dalam orientasi kanonik, skor).
+    """
+    game = BitboardGame()
+    piece = AI_PIECE if len(moves) % 2 == 0 else PLAYER_PIECE
+    for col in moves:
+        game.play(col, piece)
+        piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    game.attach_evaluator(IncrementalEvaluator(game.board))
+
+    col, score = search_position(game, depth, -inf, inf, True, tt=TranspositionTable(BOOK_TT_SIZE),
+                                 orderer=MoveOrderer(), search=search, symmetry=True)
+    key, mirrored = game.canonical_hash()
+    return key, mirror_column(col) if mirrored else col, score
+
+def _search_book_position(args):
+    return search_book_position(*args)
+
+def generate_book(max_ply, depth, workers, output=DEFAULT_BOOK_PATH, search=DEFAULT_SEARCH):
+    """
+    Membuat file opening book untuk semua posisi sampai `max_ply` bidak.
+
+    Returns:
+        int: Jumlah entri yang ditulis.
+    """
+    positions = enumerate_book_positions(max_ply)
+    print(f"Membuat opening book: {len(positions)} posisi (ply <= {max_ply}), depth {depth}, {workers} worker...")
+
+    start_time = time.time()
+    entries = []
+    tasks = [(moves, depth, search) for moves in positions]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, entry in enumerate(executor.map(_search_book_position, tasks, chunksize=8), start=1):
+            entries.append(entry)
+            if i % 100 == 0 or i == len(tasks):
+                print(f"  {i}/{len(tasks)} posisi selesai ({time.time() - start_time:.1f} s)")
+
+    write_book(output, entries, depth, max_ply)
+    print(f"Opening book ditulis ke {output} ({os.path.getsize(output)} byte).")
+    return len(entries)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Membuat opening book Connect-Four.")
+    parser.add_argument('--ply', type=int, default=4, help="Jumlah bidak maksimum pada posisi book.")
+    parser.add_argument('--depth', type=int, default=10, help="Depth pencarian untuk setiap posisi.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Jumlah proses worker.")
+    parser.add_argument('--output', default=DEFAULT_BOOK_PATH, help="Lokasi file book.")
+    parser.add_argument('--search', default=DEFAULT_SEARCH, help="Mode pencarian ('minimax' atau 'pvs').")
+    args = parser.parse_args()
+
+    generate_book(args.ply, args.depth, args.workers, args.output, args.search)
@@ -0,0 +1,172 @@
+"""
+Engine Connect-Four Tanpa GUI dengan Protokol Teks lewat stdin/stdout.
+
+Skrip ini dijalankan secara terpisah dari aplikasi utama (GUI). Berbeda
+dengan `src/main.py`, skrip ini tidak mengimpor customtkinter, dan karena
+pencarian memakai BitboardGame dengan pengukuran memori dimatikan, NumPy
+dan psutil juga tidak pernah diimpor. Engine yang dijalankan sebagai proses
+baru untuk setiap permintaan pun siap dalam waktu singkat; lihat
+`python benchmark.py --cold-start` untuk mengukurnya.
+
+Protokol (satu perintah per baris):
+    position [moves]    Posisi dari urutan kolom yang sudah dimainkan,
+                        misalnya "position 3342". Tanpa moves: papan awal.
+                        "position startpos moves 3 3 4 2" juga diterima.
+    go depth N          Mencari sampai depth N.
+    go movetime T       Mencari dengan iterative deepening selama T ms.
+    isready             Dibalas "readyok".
+    newgame             Menghapus data pencarian dari permainan sebelumnya.
+    quit                Keluar.
+
+Balasan untuk "go":
+    info depth 8 score 12 nodes 10240 time 85
+    bestmove 3          ("bestmove none" jika permainan sudah selesai)
+
+Engine selalu mencari untuk pemain yang sedang mendapat giliran. Perintah
+yang tidak dikenal atau tidak valid dibalas dengan "info string <pesan>".
+
+Contoh:
+    printf 'position 3342\\ngo movetime 200\\nquit\\n' | python engine_cli.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from src.game_logic import PLAYER_PIECE, AI_PIECE, COLUMN_COUNT
+from src.bitboard import BitboardGame
+from src.minimax import get_best_move, DEFAULT_DEPTH
+from src.analyzer import PerformanceAnalyzer
+from src.engine_state import EngineState, DEFAULT_ENGINE_MEMORY_MB
+
+
+def parse_moves(tokens):
+    """
+    Membuat BitboardGame dari argumen perintah "position", dengan pemain
+    yang mendapat giliran sebagai AI_PIECE, karena get_best_move selalu
+    mencari untuk AI.
+
+    Returns:
+        tuple: (BitboardGame, True jika permainan sudah selesai).
+
+    Raises:
+        ValueError: Jika urutan langkah tidak valid.
+    """
+    moves = ''.join(token for token in tokens if token not in ('startpos', 'moves'))
+    if not all(c.isdigit() and int(c) < COLUMN_COUNT for c in moves):
+        raise ValueError(f"moves harus berupa kolom 0-{COLUMN_COUNT - 1}: {moves!r}")
+    game = BitboardGame()
+    # Pemain pertama dipilih agar giliran setelah langkah terakhir jatuh ke AI_PIECE
+    piece = AI_PIECE if len(moves) % 2 == 0 else PLAYER_PIECE
+    finished = False
+    for col in map(int, moves):
+        if finished or not game.is_valid_location(col):
+            raise ValueError(f"Langkah tidak valid di kolom {col}")
+        row = game.play(col, piece)
+        finished = game.winning_move_at(row, col, piece) is not None
+        piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    return game, finished or game.is_board_full()
+
+
+class EngineSession:
+    """
+    Status satu proses engine: posisi saat ini dan data pencarian yang
+    dipakai ulang antar perintah "go".
+    """
+    def __init__(self, out, opening_book=True, hash_mb=DEFAULT_ENGINE_MEMORY_MB):
+        """
+        Args:
+            out (file): Aliran keluaran balasan (biasanya sys.stdout).
+            opening_book (bool): Pakai opening book jika filenya ada.
+            hash_mb (float): Batas memori Transposition Table.
+        """
+        self.out = out
+        self.opening_book = opening_book
+        self.hash_mb = hash_mb
+        self.engine = None # Dibuat pada "go" pertama agar start-up tetap cepat
+        self.game, self.finished = BitboardGame(), False
+
+    def send(self, line):
+        self.out.write(line + '\n')
+        self.out.flush()
+
+    def handle(self, line):
+        """
+        Menjalankan satu baris perintah.
+
+        Returns:
+            bool: False jika engine harus berhenti ("quit").
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        try:
+            if command == 'quit':
+                return False
+            elif command == 'isready':
+                self.send('readyok')
+            elif command == 'newgame':
+                if self.engine is not None:
+                    self.engine.reset()
+                self.game, self.finished = BitboardGame(), False
+            elif command == 'position':
+                self.game, self.finished = parse_moves(args)
+            elif command == 'go':
+                self.go(args)
+            else:
+                self.send(f"info string perintah tidak dikenal: {command}")
+        except ValueError as e:
+            self.send(f"info string {e}")
+        return True
+
+    def go(self, args):
+        """
+        Mencari langkah terbaik untuk posisi saat ini, lalu membalas
+        "info ..." dan "bestmove ...".
+        """
+        options = {}
+        if len(args) == 2 and args[0] in ('depth', 'movetime') and args[1].isdigit() and int(args[1]) > 0:
+            options['depth' if args[0] == 'depth' else 'time_limit_ms'] = int(args[1])
+        elif args:
+            raise ValueError("Gunakan 'go depth N' atau 'go movetime T'")
+        else:
+            options['depth'] = DEFAULT_DEPTH
+        if self.finished:
+            self.send('bestmove none')
+            return
+
+        if self.engine is None:
+            self.engine = EngineState(self.hash_mb)
+        analyzer = PerformanceAnalyzer()
+        start = time.perf_counter()
+        col = get_best_move(self.game, analyzer, opening_book=self.opening_book, track_memory=None,
+                            verbose=False, engine=self.engine, **options)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        score = analyzer.history[-1]['score'] if analyzer.history else None
+        self.send(f"info depth {analyzer.search_depth} score {score if score is not None else 'none'} "
+                  f"nodes {analyzer.nodes_evaluated} time {elapsed_ms:.0f}")
+        self.send(f"bestmove {col}")
+
+
+def run(stream_in, stream_out, **options):
+    """
+    Membaca perintah dari `stream_in` sampai "quit" atau akhir input.
+    """
+    session = EngineSession(stream_out, **options)
+    for line in stream_in:
+        if not session.handle(line):
+            break
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Engine Connect-Four tanpa GUI (protokol teks stdin/stdout).")
+    parser.add_argument('--no-book', action='store_true', help="Jangan memakai opening book.")
+    parser.add_argument('--hash', type=float, default=DEFAULT_ENGINE_MEMORY_MB,
+                        help="Batas memori Transposition Table (MB).")
+    args = parser.parse_args()
+    run(sys.stdin, sys.stdout, opening_book=not args.no_book, hash_mb=args.hash)
@@ -0,0 +1,463 @@
+"""
+Layanan Engine Asyncio untuk Banyak Permainan Sekaligus.
+
+Skrip ini dijalankan secara terpisah dari aplikasi utama (GUI), sama seperti
+`tournament.py`. Engine disajikan sebagai layanan lokal (TCP atau Unix
+socket) dengan protokol JSON-lines: setiap baris yang dikirim klien adalah
+satu objek JSON permintaan, dan setiap baris balasan adalah satu objek JSON.
+
+Permintaan:
+    {"id": 1, "op": "move", "session": "g1", "moves": "3342", "time_ms": 200}
+    {"id": 2, "op": "move", "session": "g2", "moves": "", "depth": 6}
+    {"id": 3, "op": "stats"}
+    {"id": 4, "op": "ping"}
+
+Balasan:
+    {"id": 1, "session": "g1", "move": 3, "depth": 9, "nodes": 51234,
+     "search_ms": 187.4, "queue_ms": 0.2, "latency_ms": 195.1}
+    {"id": 1, "session": "g1", "error": "busy", "detail": "..."}
+
+Posisi dikirim lengkap (`moves`) di setiap permintaan sehingga server tidak
+menyimpan state permainan; `session` hanya dipakai untuk statistik. Mesin
+selalu mencari untuk pemain yang sedang mendapat giliran.
+
+Cara kerja:
+1. Pencarian dijalankan di ProcessPoolExecutor berukuran `workers`. Sebuah
+   semaphore berukuran sama menjaga agar satu proses worker hanya memegang
+   satu pencarian; slot baru dilepas ketika pencarian di proses benar-benar
+   selesai.
+2. Setiap permintaan memiliki anggaran waktu (`time_ms`, atau `budget_ms`
+   untuk permintaan `depth`) yang dihitung sejak permintaan diterima,
+   termasuk waktu antre. Permintaan `time_ms` mencari dengan iterative
+   deepening sebesar sisa anggaran dikurangi margin. Permintaan `depth`
+   membawa SearchContext dengan deadline ke worker, sehingga pencarian yang
+   melewati anggaran dihentikan di proses worker (bukan hanya diabaikan)
+   dan dibalas dengan error "timeout".
+3. Backpressure: jika antrean menunggu worker sudah `max_queue`, permintaan
+   baru langsung ditolak dengan error "busy". Satu koneksi hanya boleh
+   memiliki `max_inflight` permintaan yang belum dibalas; setelah itu server
+   berhenti membaca dari koneksi tersebut sampai ada balasan, dan menulis
+   balasan selalu menunggu drain().
+4. Perintah "stats" mengembalikan persentil latensi (p50/p90/p99), throughput
+   (permintaan per detik), dan penghitung diterima/selesai/ditolak/timeout.
+
+Contoh:
+    python engine_server.py --port 8765 --workers 4 --max-queue 32
+    python engine_server.py --unix /tmp/connect4.sock
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, COLUMN_COUNT
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer, percentile
+from src.search_context import SearchContext, SearchTimeout
+
+# Alamat default layanan
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Jumlah proses worker dan panjang antrean maksimum default
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 16
+
+# Jumlah permintaan yang belum dibalas per koneksi sebelum server berhenti membaca
+DEFAULT_MAX_INFLIGHT = 8
+
+# Anggaran waktu default (ms) untuk permintaan 'depth', dan batas atas semua anggaran
+DEFAULT_BUDGET_MS = 10000
+MAX_BUDGET_MS = 60000
+
+# Batas depth untuk permintaan 'depth'
+MAX_DEPTH = 20
+
+# Bagian anggaran yang disisakan untuk antrean, IPC, dan pembuatan balasan (ms)
+BUDGET_MARGIN_MS = 20
+
+# Jumlah sampel latensi terakhir yang dipakai untuk persentil
+LATENCY_WINDOW = 10000
+
+# Jumlah sesi yang dilacak untuk statistik (yang paling lama tidak aktif dibuang)
+MAX_SESSIONS = 10000
+
+# Panjang maksimum satu baris permintaan (byte)
+MAX_LINE_BYTES = 64 * 1024
+
+
+class RequestError(Exception):
+    """
+    Permintaan tidak bisa dilayani; `code` dikirim sebagai field "error".
+    """
+    def __init__(self, code, detail):
+        super().__init__(detail)
+        self.code = code
+        self.detail = detail
+
+
+def parse_position(moves):
+    """
+    Membuat Connect4Game dari urutan kolom dengan pemain yang mendapat giliran
+    sebagai AI_PIECE, karena get_best_move selalu mencari untuk AI.
+
+    Raises:
+        RequestError: Jika urutan langkah tidak valid atau permainan sudah selesai.
+    """
+    if not isinstance(moves, str) or not all(c.isdigit() and int(c) < COLUMN_COUNT for c in moves):
+        raise RequestError('bad_request', f"'moves' harus berupa string kolom 0-{COLUMN_COUNT - 1}")
+    game = Connect4Game()
+    # Pemain pertama dipilih agar giliran setelah langkah terakhir jatuh ke AI_PIECE
+    piece = AI_PIECE if len(moves) % 2 == 0 else PLAYER_PIECE
+    for col in map(int, moves):
+        if not game.is_valid_location(col):
+            raise RequestError('bad_request', f"Kolom {col} sudah penuh")
+        row = game.play(col, piece)
+        if game.winning_move_at(row, col, piece) is not None:
+            raise RequestError('bad_request', "Permainan sudah selesai")
+        piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    if game.is_board_full():
+        raise RequestError('bad_request', "Papan sudah penuh")
+    return game
+
+
+def search_move(moves, options, budget_ms):
+    """
+    Isi proses worker: mencari langkah terbaik untuk posisi `moves`.
+
+    Args:
+        moves (str): Urutan kolom yang sudah dimainkan.
+        options (dict): Argumen get_best_move.
+        budget_ms (float): Batas keras waktu pencarian; pencarian 'depth'
+            yang melewatinya dihentikan agar worker segera bebas.
+
+    Returns:
+        dict: Langkah, depth tercapai, jumlah node, dan waktu pencarian (ms),
+        atau {'timeout': True} jika batas keras terlampaui.
+    """
+    analyzer = PerformanceAnalyzer()
+    start = time.perf_counter()
+    ctx = SearchContext(deadline=time.time() + budget_ms / 1000)
+    try:
+        col = get_best_move(parse_position(moves), analyzer, ctx=ctx, verbose=False, **options)
+    except SearchTimeout:
+        return {'timeout': True}
+    return {
+        'move': col,
+        'depth': analyzer.search_depth,
+        'nodes': analyzer.nodes_evaluated,
+        'search_ms': round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+class ServiceStats:
+    """
+    Penghitung throughput dan jendela latensi untuk perintah 'stats'.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.received = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.sessions = collections.OrderedDict() # sesi -> jumlah permintaan
+
+    def touch_session(self, session):
+        self.sessions[session] = self.sessions.pop(session, 0) + 1
+        if len(self.sessions) > MAX_SESSIONS:
+            self.sessions.popitem(last=False)
+
+    def snapshot(self, queued, running):
+        """
+        Ringkasan statistik dalam bentuk dict yang siap dikirim sebagai JSON.
+        """
+        uptime = time.perf_counter() - self.started
+        latencies = list(self.latencies)
+        summary = {
+            'uptime_s': round(uptime, 3),
+            'received': self.received,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'queued': queued,
+            'running': running,
+            'sessions': len(self.sessions),
+            'throughput_rps': round(self.completed / uptime, 3) if uptime > 0 else 0.0,
+        }
+        for name, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99)):
+            summary[f'latency_{name}_ms'] = round(percentile(latencies, fraction), 3) if latencies else None
+        return summary
+
+
+class EngineService:
+    """
+    Server asyncio JSON-lines yang meneruskan pencarian ke pool proses worker.
+    """
+    def __init__(self, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                 max_inflight=DEFAULT_MAX_INFLIGHT, engine_options=None):
+        """
+        Args:
+            workers (int): Jumlah proses worker (pencarian yang berjalan bersamaan).
+            max_queue (int): Jumlah permintaan yang boleh menunggu worker.
+            max_inflight (int): Permintaan belum dibalas per koneksi.
+            engine_options (dict or None): Argumen tambahan get_best_move
+                untuk semua pencarian (misalnya {'opening_book': False}).
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_inflight = max_inflight
+        self.engine_options = dict(engine_options or {})
+        self.stats = ServiceStats()
+        self.queued = 0
+        self.running = 0
+        self._executor = None
+        self._slots = None
+        self._server = None
+        self._clients = set() # Task _handle_client yang masih terhubung
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        Membuka pool worker dan mulai mendengarkan di TCP `host:port`
+        (port 0: dipilih sistem) atau di Unix socket `unix_path`.
+
+        Returns:
+            asyncio.Server: Server yang sedang berjalan.
+        """
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._slots = asyncio.Semaphore(self.workers)
+        if unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=unix_path,
+                                                           limit=MAX_LINE_BYTES)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port, limit=MAX_LINE_BYTES)
+        return self._server
+
+    @property
+    def address(self):
+        """
+        Alamat yang sedang didengarkan: (host, port) atau path Unix socket.
+        """
+        return self._server.sockets[0].getsockname()
+
+    async def close(self):
+        """
+        Berhenti menerima koneksi dan mematikan pool worker.
+        """
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._clients):
+                task.cancel()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _handle_client(self, reader, writer):
+        """
+        Membaca permintaan dari satu koneksi; setiap permintaan dilayani
+        sebagai task sendiri sehingga satu koneksi bisa memakai beberapa worker.
+        """
+        client = asyncio.current_task()
+        self._clients.add(client)
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                await inflight.acquire() # Backpressure: berhenti membaca jika terlalu banyak belum dibalas
+                try:
+                    line = await reader.readline()
+                except ValueError: # Baris melebihi MAX_LINE_BYTES
+                    inflight.release()
+                    await self._send(writer, write_lock, {'error': 'bad_request', 'detail': "Baris terlalu panjang"})
+                    break
+                if not line:
+                    inflight.release()
+                    break
+                task = asyncio.create_task(self._serve_line(line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: inflight.release())
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass # Layanan ditutup; koneksi diakhiri dengan rapi di bawah
+        finally:
+            self._clients.discard(client)
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _send(self, writer, write_lock, reply):
+        async with write_lock:
+            writer.write(json.dumps(reply).encode() + b'\n')
+            await writer.drain()
+
+    async def _serve_line(self, line, writer, write_lock):
+        """
+        Mengurai satu baris permintaan, melayaninya, lalu menulis balasannya.
+        """
+        received = time.perf_counter()
+        reply = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError('bad_request', "Permintaan harus berupa objek JSON")
+            for key in ('id', 'session'):
+                if key in request:
+                    reply[key] = request[key]
+            op = request.get('op', 'move')
+            if op == 'ping':
+                reply['pong'] = True
+            elif op == 'stats':
+                reply['stats'] = self.stats.snapshot(self.queued, self.running)
+            elif op == 'move':
+                reply.update(await self._serve_move(request, received))
+            else:
+                raise RequestError('bad_request', f"op tidak dikenal: {op!r}")
+        except json.JSONDecodeError:
+            self.stats.errors += 1
+            reply.update(error='bad_request', detail="JSON tidak valid")
+        except RequestError as e:
+            if e.code == 'busy':
+                self.stats.rejected += 1
+            elif e.code == 'timeout':
+                self.stats.timeouts += 1
+            else:
+                self.stats.errors += 1
+            reply.update(error=e.code, detail=e.detail)
+        await self._send(writer, write_lock, reply)
+
+    def _parse_budget(self, request):
+        """
+        Opsi get_best_move dan anggaran waktu (ms) untuk satu permintaan 'move'.
+        """
+        try:
+            if 'time_ms' in request:
+                budget = int(request['time_ms'])
+                options = {}
+            else:
+                depth = int(request.get('depth', 0)) or None
+                if depth is None or not 1 <= depth <= MAX_DEPTH:
+                    raise RequestError('bad_request', f"Isi 'time_ms' atau 'depth' 1-{MAX_DEPTH}")
+                budget = int(request.get('budget_ms', DEFAULT_BUDGET_MS))
+                options = {'depth': depth}
+        except (TypeError, ValueError):
+            raise RequestError('bad_request', "'time_ms', 'depth' dan 'budget_ms' harus bilangan bulat")
+        if not 1 <= budget <= MAX_BUDGET_MS:
+            raise RequestError('bad_request', f"Anggaran waktu harus 1-{MAX_BUDGET_MS} ms")
+        return options, budget
+
+    async def _acquire_slot(self, timeout):
+        """
+        Menunggu slot worker paling lama `timeout` detik.
+
+        Returns:
+            bool: True jika slot didapat (dan harus dilepas oleh pemanggil).
+        """
+        # Tidak memakai asyncio.wait_for: pada Python < 3.12 slot yang didapat
+        # tepat saat batas waktu habis bisa hilang tanpa pernah dilepas.
+        acquire = asyncio.ensure_future(self._slots.acquire())
+        try:
+            await asyncio.wait({acquire}, timeout=max(0.0, timeout))
+        finally:
+            if not acquire.done():
+                acquire.cancel() # Semaphore mengembalikan slot jika sudah sempat diberikan
+        return acquire.done() and not acquire.cancelled()
+
+    async def _serve_move(self, request, received):
+        """
+        Mengantrekan satu pencarian ke pool worker dengan batas antrean dan anggaran waktu.
+        """
+        session = str(request.get('session', ''))
+        options, budget_ms = self._parse_budget(request)
+        moves = request.get('moves', '')
+        parse_position(moves) # Validasi murah sebelum masuk antrean
+        self.stats.received += 1
+        self.stats.touch_session(session)
+
+        if self.queued >= self.max_queue:
+            raise RequestError('busy', f"Antrean penuh ({self.max_queue} permintaan menunggu)")
+        deadline = received + budget_ms / 1000
+        if self._slots.locked():
+            self.queued += 1
+            try:
+                acquired = await self._acquire_slot(deadline - time.perf_counter())
+            finally:
+                self.queued -= 1
+        else:
+            acquired = await self._slots.acquire() # Ada worker bebas: langsung, tanpa antre
+        if not acquired:
+            raise RequestError('timeout', "Anggaran waktu habis saat menunggu worker")
+
+        remaining_ms = (deadline - time.perf_counter()) * 1000
+        if 'depth' not in options:
+            options['time_limit_ms'] = max(1, int(remaining_ms - BUDGET_MARGIN_MS))
+        queue_ms = (time.perf_counter() - received) * 1000
+        self.running += 1
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, search_move, moves, dict(self.engine_options, **options), remaining_ms)
+
+        def release(_):
+            # Slot baru dilepas ketika proses worker benar-benar selesai
+            self.running -= 1
+            self._slots.release()
+
+        future.add_done_callback(release)
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future),
+                                            timeout=(remaining_ms + BUDGET_MARGIN_MS) / 1000)
+        except asyncio.TimeoutError:
+            result = {'timeout': True}
+        if result.get('timeout'):
+            raise RequestError('timeout', f"Pencarian melewati anggaran {budget_ms} ms")
+        latency_ms = (time.perf_counter() - received) * 1000
+        self.stats.completed += 1
+        self.stats.latencies.append(latency_ms)
+        return dict(result, session=session, queue_ms=round(queue_ms, 3), latency_ms=round(latency_ms, 3))
+
+
+async def serve(args):
+    """
+    Menjalankan layanan sampai dihentikan (Ctrl+C).
+    """
+    service = EngineService(workers=args.workers, max_queue=args.max_queue, max_inflight=args.max_inflight,
+                            engine_options={'opening_book': not args.no_book})
+    await service.start(args.host, args.port, unix_path=args.unix)
+    print(f"Engine service mendengarkan di {service.address} dengan {args.workers} worker")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Layanan engine Connect 4 (JSON-lines lewat TCP/Unix socket).")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Alamat TCP.")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port TCP (0: dipilih sistem).")
+    parser.add_argument('--unix', default=None, help="Path Unix socket (menggantikan --host/--port).")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Jumlah proses worker.")
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help="Jumlah permintaan menunggu sebelum permintaan baru ditolak.")
+    parser.add_argument('--max-inflight', type=int, default=DEFAULT_MAX_INFLIGHT,
+                        help="Permintaan belum dibalas per koneksi sebelum server berhenti membaca.")
+    parser.add_argument('--no-book', action='store_true', help="Jangan memakai opening book.")
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args))
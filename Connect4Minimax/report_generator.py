@@ -7,7 +7,9 @@ tingkat kedalaman pencarian (depth) dan memvisualisasikan hasilnya.
 
 Proses yang dilakukan:
 1. Menjalankan algoritma `get_best_move` untuk setiap depth yang ditentukan.
-2. Mengumpulkan data metrik: waktu eksekusi dan jumlah node yang dievaluasi.
+2. Mengumpulkan data metrik: waktu eksekusi, jumlah node yang dievaluasi,
+   dan memori puncak (tracemalloc, diukur pada pencarian terpisah karena
+   pelacakannya memperlambat pencarian).
 3. Menggunakan `matplotlib` untuk membuat dua plot:
    - Depth vs. Waktu Eksekusi (ms)
    - Depth vs. Jumlah Node
@@ -29,6 +31,19 @@ from src.game_logic import Connect4Game, PLAYER_PIECE
 from src.minimax import get_best_move
 from src.analyzer import PerformanceAnalyzer
 
+# Kumpulan posisi tetap untuk membandingkan mode pencarian. Setiap posisi
+# ditulis sebagai urutan kolom yang dimainkan bergantian, dimulai oleh Player.
+COMPARISON_POSITIONS = [
+    "3",
+    "323",
+    "33243",
+    "3324425",
+    "332234456",
+    "46660203633",
+    "3322544110662",
+    "610306334660532",
+]
+
 def run_performance_analysis(depths_to_test):
     """
     Menjalankan Minimax untuk setiap depth dan mengumpulkan data performa.
@@ -37,7 +52,9 @@ def run_performance_analysis(depths_to_test):
     
     execution_times = []
     evaluated_nodes = []
+    peak_memory = []
     analyzer = PerformanceAnalyzer()
+    memory_analyzer = PerformanceAnalyzer()
 
     for depth in depths_to_test:
         print(f"  Menguji depth = {depth}...")
@@ -52,16 +69,83 @@ def run_performance_analysis(depths_to_test):
         # Panggil fungsi utama AI untuk mendapatkan langkah terbaik
         get_best_move(game, analyzer, depth=depth)
         
+        print(f"    TT: {analyzer.tt_probes} probe, {analyzer.tt_hits} hit, {analyzer.tt_cutoffs} cutoff")
+        print(f"    Cutoff langkah pertama: {analyzer.get_first_move_cutoff_rate():.1f}%, EBF: {analyzer.get_effective_branching_factor():.2f}")
+
+        # Memori puncak diukur pada pencarian kedua agar tracemalloc tidak memengaruhi waktu di atas
+        get_best_move(game, memory_analyzer, depth=depth, track_memory=True, verbose=False)
+        print(f"    {memory_analyzer.get_memory_string()}")
+
         # Simpan hasil analisis
         execution_times.append(analyzer.execution_time_ms)
         evaluated_nodes.append(analyzer.nodes_evaluated)
+        peak_memory.append(memory_analyzer.memory_usage_mb)
 
     print("Analisis selesai.")
-    return execution_times, evaluated_nodes
+    return execution_times, evaluated_nodes, peak_memory
 
-def create_performance_graphs(depths, times, nodes):
+def run_parallel_scaling(depth, max_workers):
     """
-    Membuat dan menyimpan grafik perbandingan performa.
+    Mengukur speedup dan efisiensi pencarian paralel untuk 1..max_workers proses
+    pada posisi yang sama. Pool proses dipanaskan dengan pencarian dangkal
+    yang tidak diukur, sehingga waktu membuat proses worker tidak ikut
+    terhitung sebagai waktu pencarian.
+    """
+    print(f"Memulai analisis skalabilitas paralel (depth = {depth})...")
+    analyzer = PerformanceAnalyzer()
+    scaling_analyzer = PerformanceAnalyzer()
+
+    for workers in range(1, max_workers + 1):
+        get_best_move(Connect4Game(), analyzer, depth=2, workers=workers, opening_book=False, verbose=False)
+        game = Connect4Game()
+        game.board[0][3] = PLAYER_PIECE
+        game.board[0][2] = PLAYER_PIECE
+        game.board[1][3] = PLAYER_PIECE
+        get_best_move(game, analyzer, depth=depth, workers=workers)
+        scaling_analyzer.record_parallel_run(workers, analyzer.execution_time_ms)
+
+    for row in scaling_analyzer.get_parallel_scaling():
+        print(f"  {row['workers']} worker: {row['time_ms']:.1f} ms, "
+              f"speedup {row['speedup']:.2f}x, efisiensi {row['efficiency'] * 100:.0f}%")
+    return scaling_analyzer.get_parallel_scaling()
+
+def run_search_comparison(depth, positions=COMPARISON_POSITIONS, modes=('minimax', 'pvs')):
+    """
+    Menjalankan setiap mode pencarian pada kumpulan posisi yang sama dan
+    mencetak jumlah node serta waktu eksekusinya berdampingan. Juga memeriksa
+    bahwa semua mode memilih langkah yang sama.
+
+    Returns:
+        dict: mode -> (total node, total waktu dalam ms).
+    """
+    print(f"Membandingkan mode pencarian {modes} pada depth = {depth}...")
+    analyzer = PerformanceAnalyzer()
+    totals = {mode: [0, 0.0] for mode in modes}
+
+    header = "  Posisi".ljust(20) + "".join(f"{mode + ' node':>14}{mode + ' ms':>12}" for mode in modes)
+    print(header)
+    for moves in positions:
+        row = f"  {moves or '-'}".ljust(20)
+        chosen = set()
+        for mode in modes:
+            chosen.add(get_best_move(Connect4Game.from_moves(moves), analyzer, depth=depth, search=mode))
+            totals[mode][0] += analyzer.nodes_evaluated
+            totals[mode][1] += analyzer.execution_time_ms
+            row += f"{analyzer.nodes_evaluated:>14}{analyzer.execution_time_ms:>12.1f}"
+        if len(chosen) > 1:
+            row += "  <- langkah berbeda!"
+        print(row)
+
+    total_row = "  Total".ljust(20)
+    for mode in modes:
+        total_row += f"{totals[mode][0]:>14}{totals[mode][1]:>12.1f}"
+    print(total_row)
+    return {mode: tuple(values) for mode, values in totals.items()}
+
+def create_performance_graphs(depths, times, nodes, show=True):
+    """
+    Membuat dan menyimpan grafik perbandingan performa. Jika `show` bernilai
+    False, grafik hanya disimpan tanpa membuka jendela (untuk mode headless).
     """
     print("Membuat grafik performa...")
     
@@ -97,7 +181,8 @@ def create_performance_graphs(depths, times, nodes):
     print(f"Grafik telah disimpan di: {output_path}")
     
     # Tampilkan grafik
-    plt.show()
+    if show:
+        plt.show()
 
 
 if __name__ == '__main__':
@@ -105,5 +190,14 @@ if __name__ == '__main__':
     # Hati-hati, depth 5 atau lebih bisa memakan waktu sangat lama.
     test_depths = [1, 2, 3, 4] 
     
-    times, nodes = run_performance_analysis(test_depths)
-    create_performance_graphs(test_depths, times, nodes)
+    times, nodes, peaks = run_performance_analysis(test_depths)
+    # Grafik disimpan dulu; jendelanya baru ditampilkan setelah semua analisis selesai
+    create_performance_graphs(test_depths, times, nodes, show=False)
+
+    # Perbandingan Minimax biasa dengan Negamax + PVS
+    run_search_comparison(depth=7)
+
+    # Skalabilitas pencarian paralel di akar (1..jumlah core)
+    run_parallel_scaling(depth=7, max_workers=os.cpu_count() or 1)
+
+    plt.show()
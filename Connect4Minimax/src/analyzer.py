@@ -11,8 +11,29 @@ Penggunaan kelas ini bertujuan untuk:
    disimpan atau ditampilkan tanpa mengubah logika inti algoritma.
 3. Kerapian Kode: Mencegah variabel-variabel global atau passing parameter
    yang berlebihan antar fungsi.
+
+Selain metrik langkah terakhir, analyzer juga menyimpan riwayat metrik
+setiap langkah AI selama satu permainan (lihat `record_move`), yang bisa
+diekspor sebagai JSON untuk dianalisis di luar aplikasi.
 """
 
+import json
+
+# Atribut yang menggambarkan satu pencarian (lihat adopt_search)
+LAST_SEARCH_FIELDS = ('execution_time_ms', 'nodes_evaluated', 'search_depth', 'memory_usage_mb', 'rss_growth_mb',
+                      'memory_source',
+                      'tt_probes', 'tt_hits', 'tt_cutoffs', 'beta_cutoffs', 'first_move_cutoffs',
+                      'nodes_per_ply', 'cutoffs_per_ply', 'leaf_nodes')
+
+def percentile(values, fraction):
+    """
+    Persentil dengan metode nearest-rank (misalnya fraction=0.95 untuk p95).
+    Dipakai bersama oleh benchmark, layanan engine, dan FrameTimer.
+    """
+    ordered = sorted(values)
+    rank = max(1, int(-(-fraction * len(ordered) // 1)))
+    return ordered[min(rank, len(ordered)) - 1]
+
 class PerformanceAnalyzer:
     """
     Kelas untuk menyimpan metrik performa eksekusi algoritma Minimax.
@@ -24,7 +45,26 @@ class PerformanceAnalyzer:
         self.execution_time_ms = 0.0
         self.nodes_evaluated = 0
         self.search_depth = 0
+        # Memori puncak yang sebenarnya (tracemalloc); 0.0 jika tidak diukur
         self.memory_usage_mb = 0.0
+        # Pertumbuhan RSS proses selama pencarian (psutil). Murah diukur,
+        # tetapi bukan memori puncak, jadi disimpan terpisah.
+        self.rss_growth_mb = 0.0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.tt_cutoffs = 0
+        self.beta_cutoffs = 0
+        self.first_move_cutoffs = 0
+        # Rincian per ply relatif terhadap akar (indeks 0 = posisi akar)
+        self.nodes_per_ply = []
+        self.cutoffs_per_ply = []
+        self.leaf_nodes = 0
+        # Cara memori diukur: 'rss' (rss_growth_mb), 'tracemalloc' (memory_usage_mb), atau 'none'
+        self.memory_source = 'rss'
+        # Metrik setiap langkah AI dalam permainan ini, diisi oleh record_move
+        self.history = []
+        # Waktu eksekusi (ms) per jumlah worker, untuk analisis skalabilitas paralel
+        self.parallel_runs = {}
 
     def reset(self):
         """
@@ -34,10 +74,20 @@ class PerformanceAnalyzer:
         self.execution_time_ms = 0.0
         self.nodes_evaluated = 0
         self.memory_usage_mb = 0.0
+        self.rss_growth_mb = 0.0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.tt_cutoffs = 0
+        self.beta_cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.nodes_per_ply = []
+        self.cutoffs_per_ply = []
+        self.leaf_nodes = 0
+        self.history = []
         # Search depth tidak direset karena merupakan konstanta,
         # tapi bisa diatur ulang jika diperlukan.
 
-    def set_metrics(self, time_ms, nodes, depth, memory_mb):
+    def set_metrics(self, time_ms, nodes, depth, memory_mb=None):
         """
         Menyimpan nilai metrik yang baru dihitung.
 
@@ -45,12 +95,210 @@ class PerformanceAnalyzer:
             time_ms (float): Waktu eksekusi dalam milidetik.
             nodes (int): Jumlah node yang dievaluasi.
             depth (int): Kedalaman pencarian yang digunakan.
-            memory_mb (float): Penggunaan memori puncak dalam megabyte.
+            memory_mb (float or None): Memori puncak dalam megabyte. None:
+                tidak diubah (lihat set_memory_metrics).
         """
         self.execution_time_ms = time_ms
         self.nodes_evaluated = nodes
         self.search_depth = depth
-        self.memory_usage_mb = memory_mb
+        if memory_mb is not None:
+            self.memory_usage_mb = memory_mb
+
+    def set_memory_metrics(self, source, memory_mb):
+        """
+        Menyimpan hasil pengukuran memori sesuai caranya diukur.
+
+        Args:
+            source (str): 'tracemalloc' (memori puncak), 'rss' (pertumbuhan
+                RSS proses), atau 'none' (tidak diukur).
+            memory_mb (float): Hasil pengukuran dalam megabyte.
+        """
+        self.memory_source = source
+        self.memory_usage_mb = memory_mb if source == 'tracemalloc' else 0.0
+        self.rss_growth_mb = memory_mb if source == 'rss' else 0.0
+
+    def get_memory_string(self):
+        """
+        Hasil pengukuran memori dengan label yang sesuai caranya diukur.
+        """
+        if self.memory_source == 'tracemalloc':
+            return f"Memori Puncak: {self.memory_usage_mb:.2f} MB"
+        if self.memory_source == 'rss':
+            return f"Pertumbuhan RSS: {self.rss_growth_mb:.2f} MB"
+        return "Memori: tidak diukur"
+
+    def set_ply_metrics(self, nodes_per_ply, cutoffs_per_ply, leaf_nodes):
+        """
+        Menyimpan rincian node dari pencarian terakhir.
+
+        Args:
+            nodes_per_ply (list): Jumlah node pada setiap ply, mulai dari akar.
+            cutoffs_per_ply (list): Jumlah beta cutoff pada setiap ply.
+            leaf_nodes (int): Jumlah node yang dievaluasi statis (depth 0 atau terminal).
+        """
+        self.nodes_per_ply = list(nodes_per_ply)
+        self.cutoffs_per_ply = list(cutoffs_per_ply)
+        self.leaf_nodes = leaf_nodes
+
+    def get_interior_nodes(self):
+        """
+        Jumlah node interior (node yang anak-anaknya dicari).
+        """
+        return max(self.nodes_evaluated - self.leaf_nodes, 0)
+
+    def get_nodes_per_second(self):
+        """
+        Node per detik (NPS) dari pencarian terakhir.
+        """
+        if self.execution_time_ms <= 0:
+            return 0.0
+        return self.nodes_evaluated / (self.execution_time_ms / 1000)
+
+    def set_tt_metrics(self, probes, hits, cutoffs):
+        """
+        Menyimpan statistik Transposition Table dari pencarian terakhir.
+
+        Args:
+            probes (int): Jumlah pencarian entri di tabel.
+            hits (int): Jumlah pencarian yang menemukan entri posisi yang sama.
+            cutoffs (int): Jumlah node yang langsung selesai berkat entri tabel.
+        """
+        self.tt_probes = probes
+        self.tt_hits = hits
+        self.tt_cutoffs = cutoffs
+
+    def get_tt_hit_rate(self):
+        """
+        Mengembalikan persentase probe yang menemukan entri (0 jika tidak ada probe).
+        """
+        if self.tt_probes == 0:
+            return 0.0
+        return 100.0 * self.tt_hits / self.tt_probes
+
+    def set_cutoff_metrics(self, cutoffs, first_move_cutoffs):
+        """
+        Menyimpan statistik beta cutoff dari pencarian terakhir.
+
+        Args:
+            cutoffs (int): Jumlah node yang terpotong (alpha >= beta).
+            first_move_cutoffs (int): Berapa di antaranya terjadi pada langkah pertama yang dicoba.
+        """
+        self.beta_cutoffs = cutoffs
+        self.first_move_cutoffs = first_move_cutoffs
+
+    def get_first_move_cutoff_rate(self):
+        """
+        Persentase cutoff yang terjadi pada langkah pertama. Semakin mendekati
+        100%, semakin baik pengurutan langkahnya.
+        """
+        if self.beta_cutoffs == 0:
+            return 0.0
+        return 100.0 * self.first_move_cutoffs / self.beta_cutoffs
+
+    def get_effective_branching_factor(self):
+        """
+        Faktor percabangan efektif: b* sehingga b*^d = jumlah node.
+        Minimax murni pada Connect-Four mendekati 7; pruning yang baik menurunkannya.
+        """
+        if self.search_depth <= 0 or self.nodes_evaluated <= 0:
+            return 0.0
+        return self.nodes_evaluated ** (1.0 / self.search_depth)
+
+    def get_ply_branching_factors(self):
+        """
+        Faktor percabangan terukur antar ply: node di ply i+1 dibagi node di ply i.
+        """
+        return [self.nodes_per_ply[i + 1] / self.nodes_per_ply[i]
+                for i in range(len(self.nodes_per_ply) - 1) if self.nodes_per_ply[i] > 0]
+
+    def to_dict(self):
+        """
+        Mengembalikan metrik pencarian terakhir sebagai dict yang bisa diserialisasi ke JSON.
+        """
+        return {
+            'execution_time_ms': self.execution_time_ms,
+            'nodes_evaluated': self.nodes_evaluated,
+            'leaf_nodes': self.leaf_nodes,
+            'interior_nodes': self.get_interior_nodes(),
+            'nodes_per_ply': list(self.nodes_per_ply),
+            'cutoffs_per_ply': list(self.cutoffs_per_ply),
+            'search_depth': self.search_depth,
+            'memory_usage_mb': self.memory_usage_mb,
+            'rss_growth_mb': self.rss_growth_mb,
+            'memory_source': self.memory_source,
+            'nps': self.get_nodes_per_second(),
+            'ebf': self.get_effective_branching_factor(),
+            'tt_probes': self.tt_probes,
+            'tt_hits': self.tt_hits,
+            'tt_cutoffs': self.tt_cutoffs,
+            'beta_cutoffs': self.beta_cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+        }
+
+    def record_move(self, col, score=None, source='search'):
+        """
+        Menambahkan metrik pencarian terakhir ke riwayat permainan.
+
+        Args:
+            col (int): Kolom yang dipilih AI.
+            score (int or None): Skor langkah tersebut.
+            source (str): Asal langkah: 'search', 'book', 'tactics', atau 'endgame'.
+        """
+        entry = {'move': len(self.history) + 1, 'col': col, 'score': score, 'source': source}
+        entry.update(self.to_dict())
+        self.history.append(entry)
+
+    def adopt_search(self, other):
+        """
+        Mengambil metrik pencarian terakhir dari analyzer lain, misalnya
+        pencarian yang sudah dijalankan lebih dulu saat pondering, lalu
+        mencatatnya sebagai langkah berikutnya di riwayat permainan ini.
+        """
+        for name in LAST_SEARCH_FIELDS:
+            setattr(self, name, getattr(other, name))
+        if other.history:
+            entry = dict(other.history[-1], move=len(self.history) + 1, pondered=True)
+            self.history.append(entry)
+
+    def export_history_json(self, path=None):
+        """
+        Mengekspor riwayat langkah permainan sebagai JSON.
+
+        Args:
+            path (str or None): Jika diisi, JSON juga ditulis ke file ini.
+
+        Returns:
+            str: Riwayat dalam format JSON.
+        """
+        text = json.dumps({'moves': self.history}, indent=2)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def record_parallel_run(self, workers, time_ms):
+        """
+        Mencatat waktu eksekusi sebuah pencarian dengan `workers` proses.
+        """
+        self.parallel_runs[workers] = time_ms
+
+    def get_parallel_scaling(self):
+        """
+        Menghitung speedup dan efisiensi setiap jumlah worker terhadap
+        pencarian dengan 1 worker.
+
+        Returns:
+            list of dict: Berisi 'workers', 'time_ms', 'speedup', dan 'efficiency'
+            (speedup / workers), diurutkan berdasarkan jumlah worker.
+        """
+        baseline = self.parallel_runs.get(1)
+        scaling = []
+        for workers in sorted(self.parallel_runs):
+            time_ms = self.parallel_runs[workers]
+            speedup = baseline / time_ms if baseline and time_ms > 0 else 0.0
+            scaling.append({'workers': workers, 'time_ms': time_ms,
+                            'speedup': speedup, 'efficiency': speedup / workers})
+        return scaling
 
     def get_stats_string(self):
         """
@@ -60,7 +308,10 @@ class PerformanceAnalyzer:
             f"Waktu Eksekusi: {self.execution_time_ms:.2f} ms\n"
             f"Jumlah Node: {self.nodes_evaluated}\n"
             f"Depth Pencarian: {self.search_depth}\n"
-            f"Memori Puncak: {self.memory_usage_mb:.2f} MB"
+            f"{self.get_memory_string()}\n"
+            f"TT Hit: {self.tt_hits}/{self.tt_probes} ({self.get_tt_hit_rate():.1f}%), Cutoff: {self.tt_cutoffs}\n"
+            f"Cutoff Langkah Pertama: {self.get_first_move_cutoff_rate():.1f}%, EBF: {self.get_effective_branching_factor():.2f}\n"
+            f"NPS: {self.get_nodes_per_second():.0f}, Daun/Interior: {self.leaf_nodes}/{self.get_interior_nodes()}"
         )
 
 if __name__ == '__main__':
@@ -69,10 +320,16 @@ if __name__ == '__main__':
     
     # Simulasikan hasil dari eksekusi Minimax
     analyzer.set_metrics(time_ms=58.1234, nodes=12345, depth=4, memory_mb=2.5)
+    analyzer.set_tt_metrics(probes=2000, hits=600, cutoffs=450)
+    analyzer.set_cutoff_metrics(cutoffs=1500, first_move_cutoffs=1350)
+    analyzer.set_ply_metrics([1, 7, 40, 240, 1200], [0, 5, 30, 180, 0], leaf_nodes=10800)
+    analyzer.record_move(col=3, score=12)
     
     print("--- Analisis Performa AI ---")
     print(analyzer.get_stats_string())
     print("\nKompleksitas Teoritis: O(b^d)")
+    print(f"Node per ply: {analyzer.nodes_per_ply}, cutoff per ply: {analyzer.cutoffs_per_ply}")
+    print(analyzer.export_history_json())
 
     # Reset untuk game berikutnya
     analyzer.reset()
@@ -0,0 +1,358 @@
+# src/bitboard.py
+
+"""
+Modul ini berisi representasi papan alternatif berbasis bitboard.
+
+Setiap pemain disimpan sebagai satu bilangan bulat (64-bit untuk papan 6x7).
+Papan dipetakan per kolom dengan tinggi (rows + 1) bit: bit ke-(col * 7 + row) menyatakan
+slot (row, col), sedangkan bit ke-7 setiap kolom adalah baris "penjaga" yang
+selalu kosong agar operasi geser (shift) tidak merambat ke kolom sebelahnya.
+
+    kolom:  0  1  2  3  4  5  6
+            6 13 20 27 34 41 48   <- baris penjaga
+            5 12 19 26 33 40 47
+            4 11 18 25 32 39 46
+            3 10 17 24 31 38 45
+            2  9 16 23 30 37 44
+            1  8 15 22 29 36 43
+            0  7 14 21 28 35 42   <- baris 0 (bawah)
+
+Dengan representasi ini, deteksi kemenangan cukup dilakukan dengan beberapa
+operasi AND dan geser bit, jauh lebih cepat daripada memeriksa array NumPy
+elemen per elemen. Kelas `BitboardGame` menyediakan API yang sama dengan
+`Connect4Game` sehingga bisa dipakai langsung oleh algoritma Minimax.
+Papan dengan ukuran lain memakai tata letak yang sama dengan tinggi kolom
+rows + 1; karena bilangan bulat Python tidak dibatasi 64 bit, papan 9x7 atau
+lebih besar tetap bisa dipakai. Modul ini tidak membutuhkan NumPy kecuali
+untuk to_board().
+"""
+
+from .game_logic import (PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT, CONNECT_LENGTH, DEFAULT_GEOMETRY,
+                         zobrist_tables)
+from .geometry import get_geometry
+
+# Tabel untuk papan default. Papan dengan ukuran lain memakai tabel yang sama
+# dari BitboardGame.geometry (lihat geometry.py).
+
+# Tinggi satu kolom di dalam bitboard (termasuk baris penjaga)
+COLUMN_HEIGHT = DEFAULT_GEOMETRY.column_height
+
+# Bit baris paling bawah dari setiap kolom
+BOTTOM_MASK = DEFAULT_GEOMETRY.bottom_mask
+# Seluruh slot papan yang valid (tanpa baris penjaga)
+BOARD_MASK = DEFAULT_GEOMETRY.board_mask
+
+# Besar pergeseran untuk setiap arah garis, urutannya sama dengan
+# Connect4Game.winning_move: horizontal, vertikal, diagonal (/), diagonal (\)
+DIRECTION_SHIFTS = DEFAULT_GEOMETRY.direction_shifts
+
+
+def cell_bit(row, col):
+    """
+    Mengembalikan bit tunggal yang mewakili slot (row, col).
+    """
+    return 1 << (col * COLUMN_HEIGHT + row)
+
+
+def top_bit(col):
+    """
+    Mengembalikan bit dari baris teratas (baris 5) pada kolom yang diberikan.
+    """
+    return 1 << (col * COLUMN_HEIGHT + ROW_COUNT - 1)
+
+
+def bit_to_cell(index):
+    """
+    Mengubah indeks bit menjadi koordinat (row, col).
+    """
+    return (index % COLUMN_HEIGHT, index // COLUMN_HEIGHT)
+
+
+# Mask untuk seluruh 69 'window' (4 slot berurutan) dengan urutan yang sama
+# seperti score_position: horizontal, vertikal, diagonal (/), lalu diagonal (\)
+WINDOW_MASKS = DEFAULT_GEOMETRY.window_masks
+
+# Mask setiap kolom, dipakai untuk mencerminkan bitboard
+COLUMN_MASKS = DEFAULT_GEOMETRY.column_masks
+
+
+def mirror_bits(bits, geometry=DEFAULT_GEOMETRY):
+    """
+    Mengembalikan bitboard yang dicerminkan secara kiri-kanan.
+    """
+    mirrored = 0
+    columns = geometry.columns
+    for c in range(columns):
+        shift = (columns - 1 - 2 * c) * geometry.column_height
+        column = bits & geometry.column_masks[c]
+        mirrored |= column << shift if shift >= 0 else column >> -shift
+    return mirrored
+
+# Mask kolom tengah, dipakai oleh fungsi evaluasi heuristik
+CENTER_MASK = DEFAULT_GEOMETRY.center_mask
+
+
+class BitboardGame:
+    """
+    Representasi state permainan Connect-Four menggunakan dua bitboard
+    (satu per pemain) dan satu mask tinggi kolom (slot yang sudah terisi).
+    API-nya identik dengan Connect4Game.
+    """
+    def __init__(self, rows=ROW_COUNT, columns=COLUMN_COUNT, connect=CONNECT_LENGTH):
+        """
+        Inisialisasi papan kosong berukuran rows x columns (lihat Connect4Game).
+        `bitboards` menyimpan bidak tiap pemain, `mask` menyimpan semua slot
+        yang sudah terisi, dan `heights` menyimpan baris kosong berikutnya
+        untuk setiap kolom. `move_history` adalah tumpukan langkah
+        (row, col, piece) yang dibuat lewat play(). `hash` adalah Zobrist
+        hash posisi, sama dengan milik Connect4Game untuk papan yang sama,
+        dan `mirror_hash` adalah hash cerminan kiri-kanannya. `evaluator` adalah evaluator heuristik inkremental opsional.
+        """
+        self.geometry = get_geometry(rows, columns, connect)
+        self.zobrist_keys, self.zobrist_mirror_keys = zobrist_tables(rows, columns)
+        self._column_height = self.geometry.column_height
+        self._cell_window_masks = self.geometry.cell_window_masks
+        self.bitboards = {PLAYER_PIECE: 0, AI_PIECE: 0}
+        self.mask = 0
+        self.heights = [0] * columns
+        self.move_history = []
+        self.hash = 0
+        self.mirror_hash = 0
+        self.evaluator = None
+        self.game_over = False
+        self.winner = None
+
+    @classmethod
+    def from_board(cls, board, connect=CONNECT_LENGTH):
+        """
+        Membuat BitboardGame dari papan NumPy (format Connect4Game.board);
+        ukuran papan diambil dari bentuk `board`.
+        """
+        game = cls(len(board), len(board[0]), connect)
+        geometry = game.geometry
+        for c in range(geometry.columns):
+            for r in range(geometry.rows):
+                piece = int(board[r][c])
+                if piece == 0:
+                    continue
+                bit = geometry.cell_bit(r, c)
+                game.bitboards[piece] |= bit
+                game.mask |= bit
+                game.heights[c] = r + 1
+                game.hash ^= game.zobrist_keys[piece][r][c]
+                game.mirror_hash ^= game.zobrist_mirror_keys[piece][r][c]
+        return game
+
+    @classmethod
+    def from_game(cls, game):
+        """
+        Membuat BitboardGame dari objek Connect4Game, termasuk ukuran papan
+        dan status akhir permainan.
+        """
+        bitboard_game = cls.from_board(game.board, game.geometry.connect)
+        bitboard_game.game_over = game.game_over
+        bitboard_game.winner = game.winner
+        return bitboard_game
+
+    def to_rows(self):
+        """
+        Mengubah bitboard menjadi list rows x columns biasa (tanpa NumPy),
+        dengan indeks [row][col] yang sama seperti Connect4Game.board.
+        """
+        geometry = self.geometry
+        rows = [[0] * geometry.columns for _ in range(geometry.rows)]
+        for piece, bits in self.bitboards.items():
+            for c in range(geometry.columns):
+                for r in range(geometry.rows):
+                    if bits & geometry.cell_bit(r, c):
+                        rows[r][c] = piece
+        return rows
+
+    def to_board(self):
+        """
+        Mengubah bitboard kembali menjadi papan NumPy, misalnya untuk digambar oleh UI.
+        """
+        import numpy as np # Impor malas: engine headless tidak memanggil to_board
+        return np.array(self.to_rows(), dtype=int)
+
+    @property
+    def board(self):
+        """
+        Salinan papan dalam format NumPy. Mengubah array ini tidak mengubah
+        bitboard; gunakan drop_piece untuk menambah bidak.
+        """
+        return self.to_board()
+
+    def copy(self):
+        """
+        Mengembalikan salinan independen dari state permainan ini.
+        """
+        geometry = self.geometry
+        clone = BitboardGame(geometry.rows, geometry.columns, geometry.connect)
+        clone.bitboards = dict(self.bitboards)
+        clone.mask = self.mask
+        clone.heights = list(self.heights)
+        clone.move_history = list(self.move_history)
+        clone.hash = self.hash
+        clone.mirror_hash = self.mirror_hash
+        clone.evaluator = self.evaluator.copy() if self.evaluator is not None else None
+        clone.game_over = self.game_over
+        clone.winner = self.winner
+        return clone
+
+    def canonical_hash(self):
+        """
+        Mengembalikan hash kanonik posisi ini (lihat Connect4Game.canonical_hash).
+
+        Returns:
+            tuple: (hash kanonik, True jika hash kanonik berasal dari cerminan).
+        """
+        if self.mirror_hash < self.hash:
+            return self.mirror_hash, True
+        return self.hash, False
+
+    def is_symmetric(self):
+        """
+        Mengecek apakah papan sama dengan cerminan kiri-kanannya.
+        """
+        return all(mirror_bits(bits, self.geometry) == bits for bits in self.bitboards.values())
+
+    def attach_evaluator(self, evaluator):
+        """
+        Memasang evaluator inkremental yang sudah diinisialisasi dengan papan
+        ini, atau None untuk melepasnya.
+        """
+        self.evaluator = evaluator
+
+    def drop_piece(self, row, col, piece):
+        """
+        Menempatkan bidak (piece) pada posisi (row, col) yang diberikan.
+        """
+        bit = self.geometry.cell_bit(row, col)
+        for other in (PLAYER_PIECE, AI_PIECE):
+            if self.bitboards[other] & bit:
+                self.bitboards[other] ^= bit
+                self.hash ^= self.zobrist_keys[other][row][col]
+                self.mirror_hash ^= self.zobrist_mirror_keys[other][row][col]
+                if self.evaluator is not None:
+                    self.evaluator.remove_piece(row, col, other)
+        self.bitboards[piece] |= bit
+        self.mask |= bit
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.add_piece(row, col, piece)
+        if row + 1 > self.heights[col]:
+            self.heights[col] = row + 1
+
+    def play(self, col, piece):
+        """
+        Menjatuhkan bidak ke kolom `col` secara in-place dan mencatatnya di
+        move_history. Kolom harus masih valid.
+
+        Returns:
+            int: Baris tempat bidak mendarat.
+        """
+        row = self.heights[col]
+        bit = 1 << (col * self._column_height + row)
+        self.bitboards[piece] |= bit
+        self.mask |= bit
+        self.heights[col] = row + 1
+        self.move_history.append((row, col, piece))
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.add_piece(row, col, piece)
+        return row
+
+    def undo(self):
+        """
+        Membatalkan langkah terakhir yang dibuat dengan play().
+
+        Returns:
+            tuple: Langkah (row, col, piece) yang dibatalkan.
+        """
+        row, col, piece = self.move_history.pop()
+        bit = 1 << (col * self._column_height + row)
+        self.bitboards[piece] ^= bit
+        self.mask ^= bit
+        self.heights[col] = row
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.remove_piece(row, col, piece)
+        return (row, col, piece)
+
+    def is_valid_location(self, col):
+        """
+        Mengecek apakah sebuah kolom masih valid untuk ditempati.
+        """
+        return not self.mask & self.geometry.top_bits[col]
+
+    def get_next_open_row(self, col):
+        """
+        Mengembalikan indeks baris kosong berikutnya pada kolom yang diberikan.
+        """
+        row = self.heights[col]
+        return row if row < self.geometry.rows else None
+
+    def get_valid_locations(self):
+        """
+        Mengembalikan daftar semua kolom yang masih bisa diisi.
+        """
+        top_bits = self.geometry.top_bits
+        return [col for col in range(self.geometry.columns) if not self.mask & top_bits[col]]
+
+    def winning_move(self, piece):
+        """
+        Mengecek apakah pemain dengan bidak 'piece' telah memenangkan permainan.
+
+        Returns:
+            tuple of tuples or None: Koordinat dari bidak-bidak yang menang, atau None jika tidak ada kemenangan.
+        """
+        bits = self.bitboards[piece]
+        geometry = self.geometry
+        for shift, steps in geometry.run_shifts:
+            m = bits
+            for step in steps:
+                m &= m >> step
+            if m:
+                start = (m & -m).bit_length() - 1
+                return tuple(geometry.bit_to_cell(start + i * shift) for i in range(geometry.connect))
+        return None
+
+    def winning_move_at(self, row, col, piece):
+        """
+        Versi inkremental dari winning_move: hanya memeriksa garis yang melewati
+        slot (row, col).
+
+        Returns:
+            tuple of tuples or None: Koordinat dari bidak-bidak yang menang, atau None jika tidak ada kemenangan.
+        """
+        bits = self.bitboards[piece]
+        # Cukup cek window yang melewati slot ini (3 sampai 13 pada papan default)
+        for window_mask, window in self._cell_window_masks[col * self._column_height + row]:
+            if bits & window_mask == window_mask:
+                return window
+        return None
+
+    def is_board_full(self):
+        """
+        Mengecek apakah papan sudah terisi penuh.
+        """
+        return self.mask == self.geometry.board_mask
+
+    def reset_game(self):
+        """
+        Mereset state permainan kembali ke kondisi awal.
+        """
+        self.bitboards = {PLAYER_PIECE: 0, AI_PIECE: 0}
+        self.mask = 0
+        self.heights = [0] * self.geometry.columns
+        self.move_history = []
+        self.hash = 0
+        self.mirror_hash = 0
+        if self.evaluator is not None:
+            self.evaluator = type(self.evaluator)(geometry=self.geometry)
+        self.game_over = False
+        self.winner = None
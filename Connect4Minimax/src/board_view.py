@@ -0,0 +1,199 @@
+# src/board_view.py
+
+"""
+Modul ini berisi kelas `BoardView`, yaitu penggambaran papan Connect-Four
+pada canvas Tkinter dengan gaya retained mode.
+
+Sebelumnya App.draw_board menghapus seluruh canvas (`delete("all")`) lalu
+membuat ulang 42 persegi dan 42 lingkaran setiap kali mouse bergerak dan
+setiap kali ada langkah, sehingga Tk harus membuat ribuan item per detik.
+BoardView membuat semua item sekali saja, lalu hanya mengubah item yang
+berubah:
+1. Setelah bidak dijatuhkan, hanya warna satu lingkaran yang diubah
+   (itemconfigure).
+2. Disk hover hanya dipindahkan (coords) ketika kolomnya berubah, dan
+   disembunyikan dengan state="hidden" alih-alih dihapus.
+3. Garis kemenangan juga item tetap yang ditampilkan dan disembunyikan.
+
+Setiap pembaruan dicatat oleh `FrameTimer` (waktu dan jumlah item yang
+dibuat), sehingga efeknya bisa dibandingkan dengan penggambaran ulang penuh.
+Yang diukur adalah waktu perintah canvas di sisi Python; Tk sendiri
+menggambar ulang area yang berubah pada saat idle.
+
+Modul ini tidak mengimpor Tkinter; `canvas` cukup berupa objek dengan API
+tkinter.Canvas (create_rectangle, create_oval, create_line, itemconfigure,
+coords).
+"""
+
+import time
+from collections import deque
+
+from .game_logic import PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from .analyzer import percentile
+
+# Jumlah frame terakhir yang disimpan FrameTimer
+FRAME_WINDOW = 1000
+
+
+class FrameTimer:
+    """
+    Mencatat durasi setiap pembaruan canvas ("frame") per jenisnya.
+    """
+    def __init__(self, window=FRAME_WINDOW):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.frames = {} # jenis frame -> deque durasi (ms)
+        self.counts = {} # jenis frame -> jumlah total frame
+
+    def record(self, kind, start):
+        """
+        Mencatat satu frame jenis `kind` yang dimulai pada `start` (time.perf_counter()).
+        """
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.frames.setdefault(kind, deque(maxlen=self.window)).append(elapsed_ms)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+    def summary(self):
+        """
+        Ringkasan per jenis frame: jumlah, rata-rata, p95, dan maksimum (ms).
+        """
+        result = {}
+        for kind, durations in self.frames.items():
+            ordered = sorted(durations)
+            result[kind] = {
+                'frames': self.counts[kind],
+                'mean_ms': sum(ordered) / len(ordered),
+                'p95_ms': percentile(ordered, 0.95),
+                'max_ms': ordered[-1],
+            }
+        return result
+
+    def get_stats_string(self):
+        """
+        Ringkasan dalam bentuk teks, satu baris per jenis frame.
+        """
+        lines = []
+        for kind, stats in sorted(self.summary().items()):
+            lines.append(f"{kind}: {stats['frames']} frame, rata-rata {stats['mean_ms']:.3f} ms, "
+                         f"p95 {stats['p95_ms']:.3f} ms, maks {stats['max_ms']:.3f} ms")
+        return "\n".join(lines)
+
+
+class BoardView:
+    """
+    Item canvas papan yang dibuat sekali lalu diperbarui di tempat.
+    """
+    def __init__(self, canvas, square_size, radius, colors, rows=ROW_COUNT, columns=COLUMN_COUNT, timer=None):
+        """
+        Args:
+            canvas (tkinter.Canvas): Canvas tujuan.
+            square_size (int): Ukuran satu slot (piksel).
+            radius (int): Jari-jari bidak.
+            colors (dict): Warna 'board', 'empty', 'highlight', serta
+                PLAYER_PIECE dan AI_PIECE.
+            rows (int): Jumlah baris papan.
+            columns (int): Jumlah kolom papan.
+            timer (FrameTimer or None): Pencatat waktu frame. Default: baru.
+        """
+        self.canvas = canvas
+        self.square_size = square_size
+        self.radius = radius
+        self.colors = colors
+        self.rows = rows
+        self.columns = columns
+        self.timer = timer if timer is not None else FrameTimer()
+        self.items_created = 0
+        self._build()
+
+    def _create(self, kind, *coords, **options):
+        self.items_created += 1
+        return getattr(self.canvas, f"create_{kind}")(*coords, **options)
+
+    def _cell_center(self, row, col):
+        # Baris 0 ada di bawah; baris paling atas canvas untuk disk hover
+        return (col * self.square_size + self.square_size / 2,
+                (self.rows - row) * self.square_size + self.square_size / 2)
+
+    def _hover_coords(self, col):
+        size, pad = self.square_size, 5
+        return (col * size + pad, size - 2 * self.radius - pad, col * size + size - pad, size - pad)
+
+    def _build(self):
+        """
+        Membuat semua item canvas: latar slot, bidak, disk hover, dan garis kemenangan.
+        """
+        start = time.perf_counter()
+        size, radius = self.square_size, self.radius
+        self.discs = [[None] * self.columns for _ in range(self.rows)]
+        self.pieces = [[0] * self.columns for _ in range(self.rows)]
+        for c in range(self.columns):
+            for r in range(self.rows):
+                x1, y1 = c * size, (self.rows - r) * size
+                self._create('rectangle', x1, y1, x1 + size, y1 + size, fill=self.colors['board'], outline="black")
+                center_x, center_y = self._cell_center(r, c)
+                self.discs[r][c] = self._create('oval', center_x - radius, center_y - radius,
+                                                center_x + radius, center_y + radius,
+                                                fill=self.colors['empty'], outline="")
+        self.hover_col = None
+        self.hover_disc = self._create('oval', *self._hover_coords(0), fill=self.colors[PLAYER_PIECE],
+                                       outline="", state="hidden")
+        self.winning_line = self._create('line', 0, 0, 0, 0, fill=self.colors['highlight'], width=8,
+                                         state="hidden", tags="winning_line")
+        self.timer.record('build', start)
+
+    def set_cell(self, row, col, piece):
+        """
+        Mengubah warna satu slot setelah bidak dijatuhkan atau diambil.
+        """
+        if self.pieces[row][col] == piece:
+            return
+        start = time.perf_counter()
+        self.pieces[row][col] = piece
+        self.canvas.itemconfigure(self.discs[row][col], fill=self.colors.get(piece, self.colors['empty']))
+        self.timer.record('cell', start)
+
+    def sync(self, board):
+        """
+        Menyamakan tampilan dengan `board` (misalnya setelah restart);
+        hanya slot yang berbeda yang diubah.
+        """
+        start = time.perf_counter()
+        for r in range(self.rows):
+            for c in range(self.columns):
+                piece = int(board[r][c])
+                if self.pieces[r][c] != piece:
+                    self.pieces[r][c] = piece
+                    self.canvas.itemconfigure(self.discs[r][c], fill=self.colors.get(piece, self.colors['empty']))
+        self.timer.record('sync', start)
+
+    def set_hover(self, col):
+        """
+        Menampilkan disk hover di atas kolom `col`, atau menyembunyikannya
+        jika `col` None. Tidak melakukan apa pun jika kolomnya sama.
+        """
+        if col == self.hover_col:
+            return
+        start = time.perf_counter()
+        if col is None:
+            self.canvas.itemconfigure(self.hover_disc, state="hidden")
+        else:
+            self.canvas.coords(self.hover_disc, *self._hover_coords(col))
+            if self.hover_col is None:
+                self.canvas.itemconfigure(self.hover_disc, state="normal")
+        self.hover_col = col
+        self.timer.record('hover', start)
+
+    def show_winning_line(self, winning_coords):
+        """
+        Menampilkan garis sorotan dari bidak menang pertama sampai keempat.
+        """
+        if not winning_coords:
+            return
+        (r1, c1), (r4, c4) = winning_coords[0], winning_coords[-1]
+        self.canvas.coords(self.winning_line, *self._cell_center(r1, c1), *self._cell_center(r4, c4))
+        self.canvas.itemconfigure(self.winning_line, state="normal")
+
+    def hide_winning_line(self):
+        self.canvas.itemconfigure(self.winning_line, state="hidden")
@@ -0,0 +1,253 @@
+# src/endgame.py
+
+"""
+Modul ini berisi solver eksak untuk fase akhir permainan (endgame).
+
+Ketika slot kosong tinggal sedikit, seluruh sisa pohon permainan cukup kecil
+untuk dicari sampai habis. Hasilnya bukan lagi perkiraan heuristik,
+melainkan nilai pasti: menang, kalah, atau seri.
+
+Solver ini sengaja dibuat terpisah dari minimax_alpha_beta agar punya jalur
+cepatnya sendiri:
+- Tidak ada evaluasi heuristik, hanya deteksi kemenangan dengan bitboard.
+- Posisi disimpan sebagai (bidak pemain yang melangkah, mask), sehingga
+  pergantian giliran cukup dengan satu XOR (formulasi Negamax).
+- Kemenangan langsung dan ancaman lawan dicek sebelum rekursi, dan langkah
+  yang langsung memberi lawan kemenangan tidak pernah dicoba.
+
+Skor mengodekan jarak ke akhir permainan. Kemenangan bernilai
+SCORE_MAP['4_ai'] + jumlah slot kosong yang tersisa setelah langkah
+kemenangan, sehingga menang lebih cepat bernilai lebih tinggi dan kalah
+lebih lambat bernilai lebih baik. Seri bernilai 0.
+
+Solver mengikuti geometri papan yang dicari (ukuran dan panjang garis
+kemenangan, lihat geometry.py).
+"""
+
+from math import inf
+
+from .game_logic import AI_PIECE, DEFAULT_GEOMETRY
+from .bitboard import BitboardGame
+from .transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+# Skor dasar kemenangan, sama dengan skor terminal pada pencarian heuristik
+WIN_SCORE = 1000000
+
+# Solver dipakai jika jumlah slot kosong kurang dari batas ini
+DEFAULT_ENDGAME_THRESHOLD = 16
+
+# Ukuran Transposition Table milik solver
+ENDGAME_TT_SIZE = 1 << 18
+
+
+def has_line(bits, geometry=DEFAULT_GEOMETRY):
+    """
+    Mengecek apakah `bits` memuat garis kemenangan (4 bidak berurutan pada
+    papan default) ke arah mana pun.
+    """
+    for _, steps in geometry.run_shifts:
+        m = bits
+        for step in steps:
+            m &= m >> step
+        if m:
+            return True
+    return False
+
+
+def winning_cells(bits, mask, geometry=DEFAULT_GEOMETRY):
+    """
+    Mengembalikan semua slot kosong yang akan melengkapi garis kemenangan
+    untuk `bits` jika diisi (belum tentu bisa dimainkan sekarang).
+    """
+    if geometry.connect != 4:
+        return _winning_cells_any_length(bits, mask, geometry)
+    # Vertikal: hanya tiga bidak di bawahnya
+    result = (bits << 1) & (bits << 2) & (bits << 3)
+    for shift in geometry.direction_shifts:
+        if shift == 1:
+            continue
+        pair = (bits << shift) & (bits << (2 * shift))
+        result |= pair & (bits << (3 * shift))
+        result |= pair & (bits >> shift)
+        pair = (bits >> shift) & (bits >> (2 * shift))
+        result |= pair & (bits << shift)
+        result |= pair & (bits >> (3 * shift))
+    return result & (geometry.board_mask ^ mask)
+
+
+def _winning_cells_any_length(bits, mask, geometry):
+    """
+    Versi umum winning_cells untuk panjang garis selain 4: sebuah slot
+    melengkapi garis jika ada k bidak berurutan di satu sisinya dan
+    connect - 1 - k bidak di sisi lainnya.
+    """
+    n = geometry.connect
+    # Vertikal: hanya n - 1 bidak di bawahnya
+    result = bits << 1
+    for i in range(2, n):
+        result &= bits << i
+    for shift in geometry.direction_shifts:
+        if shift == 1:
+            continue
+        # before[k] / after[k]: slot dengan k bidak berurutan tepat sebelum / sesudahnya (-1 = semua slot)
+        before, after = [-1], [-1]
+        for k in range(1, n):
+            before.append(before[-1] & (bits << (k * shift)))
+            after.append(after[-1] & (bits >> (k * shift)))
+        for k in range(n):
+            result |= before[k] & after[n - 1 - k]
+    return result & (geometry.board_mask ^ mask)
+
+
+class EndgameSolver:
+    """
+    Solver Negamax eksak dengan Alpha-Beta Pruning dan Transposition Table.
+    """
+    def __init__(self, tt_size=ENDGAME_TT_SIZE):
+        """
+        Args:
+            tt_size (int): Jumlah entri maksimum Transposition Table solver.
+        """
+        self.tt = TranspositionTable(tt_size)
+        self.nodes = 0
+        self.geometry = None
+        self.set_geometry(DEFAULT_GEOMETRY)
+
+    def set_geometry(self, geometry):
+        """
+        Menyiapkan mask solver untuk geometri papan `geometry`. Transposition
+        Table dikosongkan jika geometrinya berubah, karena kunci posisi
+        bergantung pada tata letak bitboard.
+        """
+        if geometry is self.geometry:
+            return
+        if self.geometry is not None:
+            self.tt.clear()
+        self.geometry = geometry
+        self.bottom_mask = geometry.bottom_mask
+        self.board_mask = geometry.board_mask
+        # Mask kolom dengan urutan dari tengah ke tepi, urutan langkah solver
+        self.ordered_column_masks = tuple(geometry.column_masks[c] for c in geometry.center_order)
+
+    def negamax(self, current, mask, empty, alpha, beta):
+        """
+        Menghitung nilai pasti posisi dari sudut pandang pemain yang melangkah.
+
+        Args:
+            current (int): Bitboard bidak pemain yang akan melangkah.
+            mask (int): Bitboard semua slot yang sudah terisi.
+            empty (int): Jumlah slot kosong.
+        """
+        self.nodes += 1
+        if empty == 0:
+            return 0
+
+        geometry = self.geometry
+        possible = (mask + self.bottom_mask) & self.board_mask
+        # Kemenangan langsung
+        if winning_cells(current, mask, geometry) & possible:
+            return WIN_SCORE + empty - 1
+
+        opponent = current ^ mask
+        opponent_wins = winning_cells(opponent, mask, geometry)
+        forced = possible & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return -(WIN_SCORE + empty - 2) # Dua ancaman sekaligus tidak bisa diblok
+            possible = forced
+        # Jangan bermain tepat di bawah slot kemenangan lawan
+        possible &= ~(opponent_wins >> 1)
+        if not possible:
+            return -(WIN_SCORE + empty - 2)
+
+        # Kemenangan tercepat yang masih mungkin adalah pada langkah kita berikutnya
+        if empty >= 3:
+            best_possible = WIN_SCORE + empty - 3
+        else:
+            best_possible = 0
+        if beta > best_possible:
+            beta = best_possible
+            if alpha >= beta:
+                return beta
+
+        key = current + mask
+        alpha_start = alpha
+        entry = self.tt.probe(key)
+        if entry is not None:
+            _, _, entry_score, entry_flag, _ = entry
+            if entry_flag == EXACT:
+                return entry_score
+            elif entry_flag == LOWER_BOUND:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if alpha >= beta:
+                return entry_score
+
+        value = -inf
+        for column_mask in self.ordered_column_masks:
+            move = possible & column_mask
+            if not move:
+                continue
+            score = -self.negamax(opponent, mask | move, empty - 1, -beta, -alpha)
+            if score > value:
+                value = score
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        if value <= alpha_start:
+            flag = UPPER_BOUND
+        elif value >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.tt.store(key, empty, value, flag, None)
+        return value
+
+    def solve(self, game, piece=AI_PIECE):
+        """
+        Mencari langkah terbaik yang pasti untuk `piece` pada BitboardGame.
+
+        Returns:
+            tuple: (kolom terbaik, skor pasti dari sudut pandang `piece`).
+        """
+        geometry = game.geometry
+        self.set_geometry(geometry)
+        current = game.bitboards[piece]
+        mask = game.mask
+        empty = geometry.cell_count - bin(mask).count('1')
+        moves = [col for col in geometry.center_order if not mask & geometry.top_bits[col]]
+
+        # Kemenangan langsung di akar
+        for col in moves:
+            move = (mask + geometry.bottom_mask) & geometry.column_masks[col]
+            if has_line(current | move, geometry):
+                self.nodes += 1
+                return col, WIN_SCORE + empty - 1
+
+        best_col, best_score = moves[0], -inf
+        alpha, beta = -inf, inf
+        for col in moves:
+            move = (mask + geometry.bottom_mask) & geometry.column_masks[col]
+            score = -self.negamax(current ^ mask, mask | move, empty - 1, -beta, -alpha)
+            if score > best_score:
+                best_col, best_score = col, score
+                alpha = max(alpha, score)
+        return best_col, best_score
+
+
+def solve_endgame(game, piece=AI_PIECE, solver=None):
+    """
+    Fungsi pembantu: menjalankan EndgameSolver pada salinan bitboard `game`.
+
+    Returns:
+        tuple: (kolom terbaik, skor pasti, jumlah node yang dievaluasi).
+    """
+    if not isinstance(game, BitboardGame):
+        game = BitboardGame.from_game(game)
+    if solver is None:
+        solver = EndgameSolver()
+    col, score = solver.solve(game, piece)
+    return col, score, solver.nodes
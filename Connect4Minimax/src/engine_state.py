@@ -0,0 +1,127 @@
+# src/engine_state.py
+
+"""
+Modul ini berisi kelas `EngineState`, yaitu data pencarian yang disimpan
+dari satu langkah AI ke langkah berikutnya dalam satu permainan.
+
+Tanpa EngineState, setiap pemanggilan get_best_move mulai dari nol: subtree
+di bawah balasan manusia yang sudah diperkirakan akan dicari ulang pada
+giliran berikutnya. EngineState menyimpan:
+1. Transposition Table. Setiap pencarian baru memulai generasi baru; entri
+   lama tetap bisa dipakai tetapi boleh ditimpa (aging), bukan dihapus.
+2. MoveOrderer: tabel history dibagi dua dan killer move digeser sesuai
+   jumlah ply yang sudah dimainkan sejak pencarian sebelumnya.
+3. Principal variation (PV): jika manusia memainkan balasan yang
+   diperkirakan, langkah PV berikutnya dicoba paling awal di akar.
+
+Ukuran Transposition Table dihitung dari batas memori `max_memory_mb`,
+sehingga memori EngineState tidak pernah melebihi batas tersebut berapa
+pun panjang permainannya. App.restart_game membuat EngineState baru alih-alih
+memanggil reset(), karena pencarian lama yang baru dibatalkan bisa saja
+masih memakai tabelnya sesaat.
+
+Pencarian pondering untuk beberapa balasan manusia berbagi satu generasi
+Transposition Table: hanya pencarian pondering pertama setelah langkah AI
+yang memulai generasi baru. Tanpa itu setiap balasan menuakan entri yang
+masih dibutuhkan pencarian sebenarnya, dan nomor generasi (modulo 256)
+cepat berputar.
+"""
+
+from .game_logic import PLAYER_PIECE, AI_PIECE, DEFAULT_GEOMETRY
+from .transposition import TranspositionTable, ENTRY_BYTES
+from .move_ordering import MoveOrderer
+
+# Batas memori default EngineState (MB), hampir seluruhnya untuk Transposition Table
+DEFAULT_ENGINE_MEMORY_MB = 64
+
+# Panjang maksimum principal variation yang disimpan
+MAX_PV_LENGTH = 16
+
+
+def tt_entries_for_memory(max_memory_mb):
+    """
+    Jumlah slot Transposition Table terbesar yang muat dalam `max_memory_mb`.
+    """
+    return max(1, int(max_memory_mb * 1024 * 1024) // ENTRY_BYTES)
+
+
+class EngineState:
+    """
+    Data pencarian yang bertahan antar langkah dalam satu permainan.
+    """
+    def __init__(self, max_memory_mb=DEFAULT_ENGINE_MEMORY_MB, replacement='depth', geometry=DEFAULT_GEOMETRY):
+        """
+        Args:
+            max_memory_mb (float): Batas keras memori Transposition Table.
+            replacement (str): Kebijakan penggantian entri Transposition Table.
+            geometry (BoardGeometry): Geometri papan permainan ini.
+        """
+        self.max_memory_mb = max_memory_mb
+        self.geometry = geometry
+        self.tt = TranspositionTable(tt_entries_for_memory(max_memory_mb), replacement)
+        self.orderer = MoveOrderer(geometry=geometry)
+        self.reset()
+
+    def reset(self):
+        """
+        Menghapus semua data pencarian. Hanya dipanggil ketika permainan baru dimulai.
+        """
+        self.tt.clear()
+        self.orderer.reset()
+        self.pv = []
+        self.searches = 0
+        self._expected_hash = None # Hash posisi setelah dua langkah pertama PV
+        self._root_pieces = None
+        self._root_index = None
+        self._pondering = False # Pencarian terakhir adalah pencarian pondering
+
+    def memory_bytes(self):
+        """
+        Perkiraan atas memori yang dipakai EngineState (byte).
+        """
+        return self.tt.memory_bytes()
+
+    def new_search(self, game, ponder=False):
+        """
+        Menuakan data pencarian sebelumnya sebelum mencari posisi `game`.
+
+        Args:
+            ponder (bool): Pencarian pondering. Pencarian pondering yang
+                berturut-turut tetap di generasi TT yang sama.
+        """
+        pieces = sum(game.heights)
+        root_index = len(game.move_history)
+        if self._root_pieces is not None:
+            # Killer move diindeks dengan ply relatif terhadap akar papan pencarian
+            self.orderer.age((pieces - self._root_pieces) - (root_index - self._root_index))
+        self._root_pieces, self._root_index = pieces, root_index
+        if ponder and self._pondering:
+            self.tt.reset_stats()
+        else:
+            self.tt.new_generation()
+        self._pondering = ponder
+        self.searches += 1
+
+    def preferred_move(self, game):
+        """
+        Langkah PV yang diharapkan pada posisi `game`, atau None jika manusia
+        tidak memainkan balasan yang diperkirakan.
+        """
+        if self._expected_hash is not None and game.hash == self._expected_hash and len(self.pv) > 2:
+            col = self.pv[2]
+            if game.is_valid_location(col):
+                return col
+        return None
+
+    def record_pv(self, game, pv):
+        """
+        Menyimpan principal variation hasil pencarian pada posisi akar `game`.
+        """
+        self.pv = list(pv[:MAX_PV_LENGTH])
+        self._expected_hash = None
+        if len(self.pv) > 2:
+            for col, piece in zip(self.pv[:2], (AI_PIECE, PLAYER_PIECE)):
+                game.play(col, piece)
+            self._expected_hash = game.hash
+            game.undo()
+            game.undo()
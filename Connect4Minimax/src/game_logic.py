@@ -6,58 +6,275 @@ Termasuk di dalamnya adalah representasi papan, mekanisme menjatuhkan bidak,
 validasi langkah, dan deteksi kondisi akhir permainan (menang, seri).
 Modul ini tidak memiliki dependensi pada GUI (Tkinter) dan sepenuhnya
 bisa diuji secara terpisah.
+
+Ukuran papan dan panjang garis kemenangan bisa diatur per permainan
+(lihat Connect4Game.__init__); konstanta di bawah adalah nilai default-nya.
+Tabel window yang dipakai deteksi kemenangan berasal dari geometry.py.
+
+NumPy baru diimpor ketika Connect4Game pertama kali dibuat, sehingga modul
+lain yang hanya membutuhkan konstanta di bawah (misalnya BitboardGame pada
+engine headless) tidak ikut membayar waktu impor NumPy.
 """
 
-import numpy as np
+import random
+from functools import lru_cache
+
+from .geometry import get_geometry
 
 # --- Konstanta Permainan ---
+# Ukuran papan dan panjang garis kemenangan default (Connect-Four klasik)
 ROW_COUNT = 6
 COLUMN_COUNT = 7
+CONNECT_LENGTH = 4
 
 PLAYER_PIECE = 1
 AI_PIECE = 2
 
+# Geometri papan default, dipakai bersama oleh semua papan 6x7 connect-4
+DEFAULT_GEOMETRY = get_geometry(ROW_COUNT, COLUMN_COUNT, CONNECT_LENGTH)
+
+# --- Zobrist Hashing ---
+# Setiap kombinasi (bidak, baris, kolom) mendapat satu bilangan acak 64-bit.
+# Hash sebuah posisi adalah XOR dari bilangan milik semua bidak di papan,
+# sehingga bisa diperbarui dalam O(1) setiap kali bidak ditambah/diambil.
+# Seed dibuat tetap agar hash sama di setiap proses.
+ZOBRIST_SEED = 20230302018
+
+def _build_zobrist_keys(rows, columns):
+    rng = random.Random(ZOBRIST_SEED)
+    keys = {}
+    for piece in (PLAYER_PIECE, AI_PIECE):
+        keys[piece] = [[rng.getrandbits(64) for _ in range(columns)] for _ in range(rows)]
+    return keys, rng.getrandbits(64)
+
+# --- Simetri Kiri-Kanan ---
+# Posisi dan cerminannya (kolom c <-> columns - 1 - c) memiliki nilai
+# yang sama. Kunci cerminan memberi setiap slot kunci milik slot
+# cerminannya, sehingga hash dari papan yang dicerminkan bisa diperbarui
+# secara inkremental bersamaan dengan hash biasa.
+@lru_cache(maxsize=None)
+def zobrist_tables(rows=ROW_COUNT, columns=COLUMN_COUNT):
+    """
+    Mengembalikan kunci Zobrist untuk papan berukuran rows x columns, dibuat
+    sekali per ukuran. Untuk ukuran default hasilnya sama dengan
+    ZOBRIST_KEYS dan ZOBRIST_MIRROR_KEYS, sehingga hash di opening book tetap berlaku.
+
+    Returns:
+        tuple: (kunci per [piece][row][col], kunci cerminan dengan bentuk yang sama).
+    """
+    keys = _build_zobrist_keys(rows, columns)[0]
+    return keys, {piece: [row[::-1] for row in grid] for piece, grid in keys.items()}
+
+ZOBRIST_KEYS, ZOBRIST_MIRROR_KEYS = zobrist_tables(ROW_COUNT, COLUMN_COUNT)
+# Kunci giliran sama untuk semua ukuran papan
+ZOBRIST_SIDE_KEY = _build_zobrist_keys(ROW_COUNT, COLUMN_COUNT)[1]
+
+def mirror_column(col):
+    """
+    Mengembalikan kolom cerminan dari `col` pada papan berukuran default
+    (lihat BoardGeometry.mirror_column untuk ukuran lain).
+    """
+    return COLUMN_COUNT - 1 - col
+
 class Connect4Game:
     """
     Kelas yang merepresentasikan dan mengelola state dari sebuah sesi
     permainan Connect-Four.
     """
-    def __init__(self):
+    def __init__(self, rows=ROW_COUNT, columns=COLUMN_COUNT, connect=CONNECT_LENGTH):
         """
         Inisialisasi papan permainan.
-        Papan direpresentasikan sebagai array NumPy 6x7.
+        Papan direpresentasikan sebagai array NumPy rows x columns (default 6x7).
         Nilai 0 merepresentasikan slot kosong.
         Nilai 1 merepresentasikan bidak Player.
         Nilai 2 merepresentasikan bidak AI.
+
+        `heights` menyimpan baris kosong berikutnya untuk setiap kolom, dan
+        `move_history` adalah tumpukan langkah (row, col, piece) yang dibuat
+        lewat play() sehingga bisa dibatalkan dengan undo(). `hash` adalah
+        Zobrist hash dari posisi saat ini dan `mirror_hash` adalah hash dari
+        cerminan kiri-kanannya. `evaluator` adalah evaluator heuristik
+        inkremental opsional (lihat attach_evaluator).
+
+        Args:
+            rows (int): Jumlah baris papan.
+            columns (int): Jumlah kolom papan.
+            connect (int): Jumlah bidak berurutan yang dibutuhkan untuk menang.
+
+        Raises:
+            ValueError: Jika ukuran papan atau panjang garis tidak didukung
+                (lihat geometry.py).
         """
+        self.geometry = get_geometry(rows, columns, connect)
+        self.zobrist_keys, self.zobrist_mirror_keys = zobrist_tables(rows, columns)
         self.board = self.create_board()
+        self.heights = [0] * columns
+        self.move_history = []
+        self.hash = 0
+        self.mirror_hash = 0
+        self.evaluator = None
         self.game_over = False
         self.winner = None
 
+    @classmethod
+    def from_moves(cls, moves, first_piece=PLAYER_PIECE, **geometry):
+        """
+        Membuat permainan dari urutan kolom yang dimainkan bergantian,
+        misalnya "3324" atau [3, 3, 2, 4].
+
+        Args:
+            moves (str or list): Urutan kolom.
+            first_piece (int): Bidak pemain yang melangkah pertama.
+            **geometry: `rows`, `columns`, dan `connect` untuk papan non-default.
+        """
+        game = cls(**geometry)
+        piece = first_piece
+        for col in moves:
+            game.play(int(col), piece)
+            piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+        return game
+
     def create_board(self):
         """
         Membuat dan mengembalikan papan permainan kosong (diisi dengan nol).
         """
-        return np.zeros((ROW_COUNT, COLUMN_COUNT), dtype=int)
+        import numpy as np # Impor malas, lihat docstring modul
+        return np.zeros((self.geometry.rows, self.geometry.columns), dtype=int)
+
+    def copy(self):
+        """
+        Mengembalikan salinan independen dari state permainan ini.
+        """
+        geometry = self.geometry
+        clone = Connect4Game(geometry.rows, geometry.columns, geometry.connect)
+        clone.board = self.board.copy()
+        clone.heights = clone.compute_heights()
+        clone.hash = clone.compute_hash()
+        clone.mirror_hash = clone.compute_hash(mirrored=True)
+        clone.move_history = list(self.move_history)
+        clone.evaluator = self.evaluator.copy() if self.evaluator is not None else None
+        clone.game_over = self.game_over
+        clone.winner = self.winner
+        return clone
+
+    def compute_heights(self):
+        """
+        Menghitung ulang tinggi setiap kolom langsung dari papan. Berguna jika
+        papan diubah secara langsung tanpa melalui drop_piece/play.
+        """
+        heights = [0] * self.geometry.columns
+        for c in range(self.geometry.columns):
+            for r in range(self.geometry.rows):
+                if self.board[r][c] != 0:
+                    heights[c] = r + 1
+        return heights
+
+    def compute_hash(self, mirrored=False):
+        """
+        Menghitung ulang Zobrist hash langsung dari papan, atau hash dari
+        cerminannya jika `mirrored` bernilai True.
+        """
+        keys = self.zobrist_mirror_keys if mirrored else self.zobrist_keys
+        h = 0
+        for r in range(self.geometry.rows):
+            for c in range(self.geometry.columns):
+                piece = self.board[r][c]
+                if piece != 0:
+                    h ^= keys[piece][r][c]
+        return h
+
+    def canonical_hash(self):
+        """
+        Mengembalikan hash kanonik posisi ini, yaitu yang lebih kecil di antara
+        hash posisi dan hash cerminannya, sehingga sebuah posisi dan cerminannya
+        mendapat kunci yang sama.
+
+        Returns:
+            tuple: (hash kanonik, True jika hash kanonik berasal dari cerminan).
+        """
+        if self.mirror_hash < self.hash:
+            return self.mirror_hash, True
+        return self.hash, False
+
+    def is_symmetric(self):
+        """
+        Mengecek apakah papan sama dengan cerminan kiri-kanannya.
+        """
+        return bool((self.board == self.board[:, ::-1]).all())
+
+    def attach_evaluator(self, evaluator):
+        """
+        Memasang evaluator inkremental (misalnya minimax.IncrementalEvaluator)
+        yang sudah diinisialisasi dengan papan ini. Setelah itu setiap
+        drop_piece/play/undo akan memperbarui evaluator tersebut.
+        None berarti melepas evaluator.
+        """
+        self.evaluator = evaluator
 
     def drop_piece(self, row, col, piece):
         """
         Menempatkan bidak (piece) pada posisi (row, col) yang diberikan.
         """
+        old_piece = self.board[row][col]
+        if old_piece != 0:
+            self.hash ^= self.zobrist_keys[old_piece][row][col]
+            self.mirror_hash ^= self.zobrist_mirror_keys[old_piece][row][col]
+            if self.evaluator is not None:
+                self.evaluator.remove_piece(row, col, old_piece)
         self.board[row][col] = piece
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.add_piece(row, col, piece)
+        if row + 1 > self.heights[col]:
+            self.heights[col] = row + 1
+
+    def play(self, col, piece):
+        """
+        Menjatuhkan bidak ke kolom `col` secara in-place dalam O(1) dan
+        mencatatnya di move_history. Kolom harus masih valid.
+
+        Returns:
+            int: Baris tempat bidak mendarat.
+        """
+        row = self.heights[col]
+        self.board[row][col] = piece
+        self.heights[col] = row + 1
+        self.move_history.append((row, col, piece))
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.add_piece(row, col, piece)
+        return row
+
+    def undo(self):
+        """
+        Membatalkan langkah terakhir yang dibuat dengan play().
+
+        Returns:
+            tuple: Langkah (row, col, piece) yang dibatalkan.
+        """
+        row, col, piece = self.move_history.pop()
+        self.board[row][col] = 0
+        self.heights[col] = row
+        self.hash ^= self.zobrist_keys[piece][row][col]
+        self.mirror_hash ^= self.zobrist_mirror_keys[piece][row][col]
+        if self.evaluator is not None:
+            self.evaluator.remove_piece(row, col, piece)
+        return (row, col, piece)
 
     def is_valid_location(self, col):
         """
         Mengecek apakah sebuah kolom masih valid untuk ditempati.
-        Sebuah kolom valid jika baris teratasnya (baris 5) masih kosong (bernilai 0).
+        Sebuah kolom valid jika baris teratasnya (baris 5 pada papan 6x7) masih kosong (bernilai 0).
         """
-        return self.board[ROW_COUNT - 1][col] == 0
+        return self.board[self.geometry.rows - 1][col] == 0
 
     def get_next_open_row(self, col):
         """
         Mencari dan mengembalikan indeks baris kosong berikutnya pada kolom yang diberikan.
         """
-        for r in range(ROW_COUNT):
+        for r in range(self.geometry.rows):
             if self.board[r][col] == 0:
                 return r
         return None # Seharusnya tidak pernah terjadi jika is_valid_location dipanggil dulu
@@ -65,38 +282,37 @@ class Connect4Game:
     def winning_move(self, piece):
         """
         Mengecek apakah pemain dengan bidak 'piece' telah memenangkan permainan.
-        Kemenangan terjadi jika ada 4 bidak yang sama berurutan.
+        Kemenangan terjadi jika ada `connect` bidak yang sama berurutan
+        (4 pada papan default), yaitu jika salah satu window milik geometri
+        papan terisi penuh oleh bidak tersebut.
 
         Args:
             piece (int): Bidak pemain (1 untuk Player, 2 untuk AI).
 
         Returns:
-            tuple of tuples or None: Koordinat dari 4 bidak yang menang, atau None jika tidak ada kemenangan.
-        """
-        # Cek kemenangan horizontal
-        for c in range(COLUMN_COUNT - 3):
-            for r in range(ROW_COUNT):
-                if self.board[r][c] == piece and self.board[r][c+1] == piece and self.board[r][c+2] == piece and self.board[r][c+3] == piece:
-                    return ((r, c), (r, c+1), (r, c+2), (r, c+3))
-
-        # Cek kemenangan vertikal
-        for c in range(COLUMN_COUNT):
-            for r in range(ROW_COUNT - 3):
-                if self.board[r][c] == piece and self.board[r+1][c] == piece and self.board[r+2][c] == piece and self.board[r+3][c] == piece:
-                    return ((r, c), (r+1, c), (r+2, c), (r+3, c))
-
-        # Cek kemenangan diagonal (positif /)
-        for c in range(COLUMN_COUNT - 3):
-            for r in range(ROW_COUNT - 3):
-                if self.board[r][c] == piece and self.board[r+1][c+1] == piece and self.board[r+2][c+2] == piece and self.board[r+3][c+3] == piece:
-                    return ((r, c), (r+1, c+1), (r+2, c+2), (r+3, c+3))
-
-        # Cek kemenangan diagonal (negatif \)
-        for c in range(COLUMN_COUNT - 3):
-            for r in range(3, ROW_COUNT):
-                if self.board[r][c] == piece and self.board[r-1][c+1] == piece and self.board[r-2][c+2] == piece and self.board[r-3][c+3] == piece:
-                    return ((r, c), (r-1, c+1), (r-2, c+2), (r-3, c+3))
-        
+            tuple of tuples or None: Koordinat dari bidak-bidak yang menang, atau None jika tidak ada kemenangan.
+        """
+        board = self.board
+        for window in self.geometry.windows:
+            if all(board[r][c] == piece for r, c in window):
+                return window
+        return None
+
+    def winning_move_at(self, row, col, piece):
+        """
+        Versi inkremental dari winning_move. Hanya memeriksa window yang
+        melewati bidak terakhir di (row, col), sehingga cukup dipanggil sekali
+        setelah drop_piece.
+
+        Returns:
+            tuple of tuples or None: Koordinat dari bidak-bidak yang menang, atau None jika tidak ada kemenangan.
+        """
+        board = self.board
+        geometry = self.geometry
+        for w in geometry.cell_windows[row * geometry.columns + col]:
+            window = geometry.windows[w]
+            if all(board[r][c] == piece for r, c in window):
+                return window
         return None
 
     def is_board_full(self):
@@ -105,7 +321,7 @@ class Connect4Game:
         Ini mengindikasikan kondisi permainan seri jika tidak ada pemenang.
         """
         # Cek apakah ada nilai 0 (slot kosong) di seluruh papan
-        return not np.any(self.board == 0)
+        return not (self.board == 0).any()
 
     def get_valid_locations(self):
         """
@@ -113,7 +329,7 @@ class Connect4Game:
         Ini digunakan oleh algoritma Minimax untuk mengetahui langkah apa saja yang mungkin.
         """
         valid_locations = []
-        for col in range(COLUMN_COUNT):
+        for col in range(self.geometry.columns):
             if self.is_valid_location(col):
                 valid_locations.append(col)
         return valid_locations
@@ -123,10 +339,18 @@ class Connect4Game:
         Mereset state permainan kembali ke kondisi awal.
         """
         self.board = self.create_board()
+        self.heights = [0] * self.geometry.columns
+        self.move_history = []
+        self.hash = 0
+        self.mirror_hash = 0
+        if self.evaluator is not None:
+            self.evaluator = type(self.evaluator)(geometry=self.geometry)
         self.game_over = False
         self.winner = None
 
 if __name__ == '__main__':
+    import numpy as np
+
     # Contoh penggunaan dan pengujian sederhana modul game_logic
     game = Connect4Game()
     print("Papan Awal:")
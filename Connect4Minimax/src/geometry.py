@@ -0,0 +1,177 @@
+# src/geometry.py
+
+"""
+Modul ini berisi kelas `BoardGeometry`, yaitu semua tabel yang hanya
+bergantung pada ukuran papan (baris x kolom) dan panjang garis kemenangan.
+
+Sebelumnya ukuran 6x7 dan panjang garis 4 ditulis langsung di banyak tempat,
+termasuk loop window yang ditulis satu per satu. Sekarang setiap geometri
+dihitung sekali oleh `get_geometry` lalu disimpan di cache, dan dipakai
+bersama oleh semua papan dengan ukuran yang sama:
+1. Window: setiap kemungkinan garis `connect` slot berurutan (horizontal,
+   vertikal, diagonal (/), lalu diagonal (\\)), sebagai koordinat, sebagai
+   indeks papan yang diratakan (row * columns + col), dan daftar window
+   yang melewati setiap slot. Tabel ini dipakai oleh deteksi kemenangan
+   Connect4Game dan oleh fungsi evaluasi heuristik.
+2. Mask bitboard: tinggi kolom (rows + 1 bit, termasuk baris penjaga),
+   mask baris bawah, mask papan, mask per kolom, mask kolom tengah, mask
+   setiap window, dan besar pergeseran untuk setiap arah garis.
+3. Kolom tengah dan urutan kolom dari tengah ke tepi. Pada jumlah kolom
+   genap ada dua kolom tengah yang diperlakukan sama, sehingga evaluasi
+   tetap simetris kiri-kanan (lihat `mirror_symmetric`).
+
+Bitboard memakai bilangan bulat Python yang presisinya tidak terbatas,
+sehingga papan yang lebih besar dari 64 bit (misalnya 9 kolom x 7 baris =
+72 bit) tetap bekerja dengan kode yang sama.
+
+Modul ini tidak mengimpor modul lain dalam proyek; konstanta ukuran default
+ada di game_logic.py.
+"""
+
+from functools import lru_cache
+
+# Batas ukuran papan yang didukung. SearchContext menyiapkan penghitung per
+# ply untuk papan terbesar, dan kolom ditulis sebagai satu digit (0-9).
+MAX_ROWS = 10
+MAX_COLUMNS = 10
+
+# Garis kemenangan terpendek yang masuk akal untuk fungsi evaluasi
+# (skor '2_ai' dan '2_player' membutuhkan garis minimal 3 slot)
+MIN_CONNECT = 3
+
+
+class BoardGeometry:
+    """
+    Tabel window dan mask bitboard untuk satu ukuran papan dan panjang
+    garis kemenangan. Jangan dibuat langsung; gunakan get_geometry agar
+    tabel yang sama dipakai ulang.
+    """
+    def __init__(self, rows, columns, connect):
+        """
+        Args:
+            rows (int): Jumlah baris papan.
+            columns (int): Jumlah kolom papan.
+            connect (int): Jumlah bidak berurutan yang dibutuhkan untuk menang.
+
+        Raises:
+            ValueError: Jika ukuran di luar batas yang didukung, atau garis
+                kemenangan tidak muat di papan.
+        """
+        if not (1 <= rows <= MAX_ROWS and 1 <= columns <= MAX_COLUMNS):
+            raise ValueError(f"Ukuran papan harus antara 1x1 dan {MAX_ROWS}x{MAX_COLUMNS}: {rows}x{columns}")
+        if not MIN_CONNECT <= connect <= max(rows, columns):
+            raise ValueError(f"Panjang garis kemenangan harus antara {MIN_CONNECT} dan {max(rows, columns)}: {connect}")
+        self.rows = rows
+        self.columns = columns
+        self.connect = connect
+        self.cell_count = rows * columns
+        # Satu kolom tengah untuk jumlah kolom ganjil, dua untuk jumlah genap
+        # (misalnya kolom 3 dan 4 pada papan 8 kolom)
+        self.center_columns = tuple(range((columns - 1) // 2, columns // 2 + 1))
+        self.center_column = columns // 2
+        # Urutan kolom dari tengah ke tepi, misalnya (3, 2, 4, 1, 5, 0, 6).
+        # Jarak dihitung dalam setengah kolom agar kedua kolom tengah pada
+        # papan genap berjarak sama, misalnya (3, 4, 2, 5, 1, 6, 0, 7).
+        self.center_order = tuple(sorted(range(columns), key=lambda c: abs(2 * c - (columns - 1))))
+
+        self.windows = self._build_windows()
+        self.window_indices = tuple(tuple(r * columns + c for r, c in window) for window in self.windows)
+        cell_windows = [[] for _ in range(self.cell_count)]
+        for w, window in enumerate(self.window_indices):
+            for index in window:
+                cell_windows[index].append(w)
+        self.cell_windows = tuple(tuple(windows) for windows in cell_windows)
+
+        # --- Bitboard ---
+        # Bit ke-(col * column_height + row) menyatakan slot (row, col)
+        self.column_height = rows + 1
+        self.bottom_mask = sum(1 << (c * self.column_height) for c in range(columns))
+        self.board_mask = self.bottom_mask * ((1 << rows) - 1)
+        self.column_masks = tuple(((1 << rows) - 1) << (c * self.column_height) for c in range(columns))
+        self.top_bits = tuple(1 << (c * self.column_height + rows - 1) for c in range(columns))
+        self.center_mask = sum(self.column_masks[c] for c in self.center_columns)
+        self.window_masks = tuple(sum(self.cell_bit(r, c) for r, c in window) for window in self.windows)
+        # Untuk setiap indeks bit, pasangan (mask window, koordinat window) yang
+        # melewati slot tersebut; baris penjaga tidak memiliki window
+        cell_window_masks = [()] * (columns * self.column_height)
+        for r in range(rows):
+            for c in range(columns):
+                cell_window_masks[c * self.column_height + r] = tuple(
+                    (self.window_masks[w], self.windows[w]) for w in self.cell_windows[r * columns + c])
+        self.cell_window_masks = tuple(cell_window_masks)
+        # Urutannya sama dengan window: horizontal, vertikal, diagonal (/), diagonal (\)
+        self.direction_shifts = (self.column_height, 1, self.column_height + 1, self.column_height - 1)
+        # Untuk setiap arah: (pergeseran, pergeseran-pergeseran yang mengubah
+        # bitboard menjadi awal garis `connect` bidak). Panjang garis digandakan
+        # selama mungkin, jadi untuk connect 4 cukup dua langkah (1 lalu 2).
+        steps, length = [], 1
+        while length < connect:
+            step = min(length, connect - length)
+            steps.append(step)
+            length += step
+        self.run_shifts = tuple((shift, tuple(step * shift for step in steps)) for shift in self.direction_shifts)
+
+        # Evaluasi heuristik bernilai sama untuk posisi dan cerminannya hanya
+        # jika kumpulan window dan kolom tengah tertutup terhadap pencerminan.
+        # Pintasan simetri di minimax.py (hash kanonik dan drop_mirror_moves)
+        # hanya boleh dipakai jika ini True.
+        self.mirror_symmetric = (
+            {tuple(sorted((r, self.mirror_column(c)) for r, c in w)) for w in self.windows}
+            == {tuple(sorted(w)) for w in self.windows}
+            and {self.mirror_column(c) for c in self.center_columns} == set(self.center_columns))
+
+    def _build_windows(self):
+        """
+        Membuat semua window `connect` slot berurutan sebagai tuple koordinat
+        (row, col), dengan urutan horizontal, vertikal, diagonal (/), lalu
+        diagonal (\\).
+        """
+        n, rows, columns = self.connect, self.rows, self.columns
+        windows = []
+        for r in range(rows):
+            for c in range(columns - n + 1):
+                windows.append(tuple((r, c + i) for i in range(n)))
+        for c in range(columns):
+            for r in range(rows - n + 1):
+                windows.append(tuple((r + i, c) for i in range(n)))
+        for r in range(rows - n + 1):
+            for c in range(columns - n + 1):
+                windows.append(tuple((r + i, c + i) for i in range(n)))
+        for r in range(rows - n + 1):
+            for c in range(columns - n + 1):
+                windows.append(tuple((r + n - 1 - i, c + i) for i in range(n)))
+        return tuple(windows)
+
+    def cell_bit(self, row, col):
+        """
+        Mengembalikan bit tunggal yang mewakili slot (row, col).
+        """
+        return 1 << (col * self.column_height + row)
+
+    def bit_to_cell(self, index):
+        """
+        Mengubah indeks bit menjadi koordinat (row, col).
+        """
+        return (index % self.column_height, index // self.column_height)
+
+    def mirror_column(self, col):
+        """
+        Mengembalikan kolom cerminan dari `col`.
+        """
+        return self.columns - 1 - col
+
+    def __reduce__(self):
+        # Saat dikirim ke proses worker, geometri dibuat ulang lewat cache di sana
+        return (get_geometry, (self.rows, self.columns, self.connect))
+
+    def __repr__(self):
+        return f"BoardGeometry(rows={self.rows}, columns={self.columns}, connect={self.connect})"
+
+
+@lru_cache(maxsize=None)
+def get_geometry(rows, columns, connect):
+    """
+    Mengembalikan BoardGeometry untuk ukuran dan panjang garis ini. Tabelnya
+    dibuat sekali saja; pemanggilan berikutnya mengembalikan objek yang sama.
+    """
+    return BoardGeometry(rows, columns, connect)
@@ -7,24 +7,28 @@ File ini bertanggung jawab untuk:
 1. Mengimpor kelas-kelas yang diperlukan dari modul lain (App, Connect4Game, PerformanceAnalyzer).
 2. Membuat instance dari setiap kelas.
 3. Menjalankan aplikasi dengan memanggil method mainloop() dari instance App.
+
+Ukuran papan dan panjang garis kemenangan bisa diubah, misalnya:
+    python src/main.py --rows 7 --columns 9 --connect 5
 """
 
 # Pastikan kita bisa mengimpor dari direktori       
 # Ini mungkin diperlukan tergantung pada cara Anda menjalankan skrip
+import argparse
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.game_logic import Connect4Game
+from src.game_logic import Connect4Game, ROW_COUNT, COLUMN_COUNT, CONNECT_LENGTH
 from src.ui import App
 from src.analyzer import PerformanceAnalyzer
 
-def main():
+def main(rows=ROW_COUNT, columns=COLUMN_COUNT, connect=CONNECT_LENGTH):
     """
     Fungsi utama untuk menginisialisasi dan menjalankan aplikasi.
     """
     # 1. Buat instance dari logika permainan
-    game = Connect4Game()
+    game = Connect4Game(rows, columns, connect)
 
     # 2. Buat instance dari penganalisis performa
     analyzer = PerformanceAnalyzer()
@@ -38,6 +42,12 @@ def main():
 if __name__ == "__main__":
     # Blok ini memastikan bahwa fungsi main() hanya akan dipanggil
     # ketika file ini dieksekusi secara langsung oleh interpreter Python.
+    parser = argparse.ArgumentParser(description="Aplikasi Connect-Four Minimax.")
+    parser.add_argument('--rows', type=int, default=ROW_COUNT, help="Jumlah baris papan.")
+    parser.add_argument('--columns', type=int, default=COLUMN_COUNT, help="Jumlah kolom papan.")
+    parser.add_argument('--connect', type=int, default=CONNECT_LENGTH,
+                        help="Jumlah bidak berurutan yang dibutuhkan untuk menang.")
+    args = parser.parse_args()
     print("Menjalankan aplikasi Connect-Four Minimax...")
-    main()
+    main(args.rows, args.columns, args.connect)
 
@@ -14,6 +14,9 @@ Struktur Algoritma:
     atau 'minimizer' (Player), fungsi ini akan memilih langkah yang memaksimalkan
     atau meminimalkan skor evaluasi.
 
+    negamax_pvs adalah formulasi alternatif (Negamax + Principal Variation
+    Search) yang bisa dipilih lewat parameter `search` di get_best_move.
+
 3.  score_position: Fungsi evaluasi heuristik. Fungsi ini memberikan skor
     numerik pada keadaan papan saat ini. Skor ini mengestimasi seberapa
     menguntungkan posisi tersebut untuk AI.
@@ -21,17 +24,35 @@ Struktur Algoritma:
 4.  evaluate_window: Fungsi pembantu untuk 'score_position'. Ia akan menganalisis
     sebuah segmen dari 4 slot (horizontal, vertikal, atau diagonal) dan
     memberikan skor berdasarkan jumlah bidak AI, Player, dan slot kosong di dalamnya.
+
+Semua fungsi di sini mengikuti geometri papan yang dicari (game.geometry,
+lihat geometry.py): window dan tabel skornya dibuat sekali per ukuran papan
+dan panjang garis kemenangan. Pada papan connect-N, '4_ai' berarti garis
+lengkap, dan '3_*' / '2_*' berarti kurang satu / dua bidak dari garis lengkap.
+
+NumPy (evaluasi batch dan backend 'numpy'), psutil dan tracemalloc
+(pengukuran memori), serta multiprocessing (pencarian paralel) diimpor
+secara malas saat pertama kali dipakai, sehingga engine headless yang
+mencari dengan bitboard tidak membayar waktu impor semuanya.
 """
 
-import numpy as np
+import itertools
 import random
 import time
+from functools import lru_cache
 from math import inf
-import psutil
 import os
+import threading
 
 # Impor dari modul lain dalam proyek
-from .game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from .game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, CONNECT_LENGTH, DEFAULT_GEOMETRY, ZOBRIST_SIDE_KEY
+from .bitboard import BitboardGame
+from .transposition import TranspositionTable, DEFAULT_TT_SIZE, EXACT, LOWER_BOUND, UPPER_BOUND
+from .move_ordering import MoveOrderer
+from .opening_book import OpeningBook, DEFAULT_BOOK_PATH, load_book
+from .endgame import DEFAULT_ENDGAME_THRESHOLD, EndgameSolver, solve_endgame, winning_cells
+from .search_context import SearchContext, SearchTimeout, SearchCancelled, TIME_CHECK_INTERVAL
+from .engine_state import MAX_PV_LENGTH
 
 # --- Bobot untuk Fungsi Evaluasi Heuristik ---
 # Bobot ini sangat krusial dan bisa di-tweak untuk mengubah "kepribadian" AI.
@@ -49,16 +70,76 @@ SCORE_MAP = {
 # Depth 4 atau 5 adalah titik awal yang baik.
 DEFAULT_DEPTH = 4
 
-# Variabel global sementara untuk menghitung node selama satu pemanggilan
-nodes_evaluated_counter = 0
+# Bobot tambahan untuk setiap bidak di kolom tengah
+CENTER_WEIGHT = 6
+
+# Representasi papan yang dipakai selama pencarian.
+# 'bitboard' jauh lebih cepat; 'numpy' mencari langsung pada Connect4Game.
+DEFAULT_BACKEND = 'bitboard'
+
+# Mode pencarian yang tersedia di get_best_move:
+# - 'minimax' : minimax_alpha_beta dengan cabang maximizer/minimizer terpisah.
+# - 'pvs'     : negamax_pvs, Negamax dengan Principal Variation Search.
+SEARCH_MODES = ('minimax', 'pvs')
+DEFAULT_SEARCH = 'minimax'
+
+class PeakMemoryMeter:
+    """
+    Mengukur memori puncak selama satu pencarian.
+
+    Dengan `use_tracemalloc=True` yang diukur adalah puncak alokasi Python
+    yang sebenarnya (tracemalloc), tetapi pencarian menjadi jauh lebih
+    lambat selama pelacakan aktif. Dengan False dipakai selisih RSS proses
+    (psutil), yang murah tetapi hanya menangkap pertumbuhan heap proses,
+    sehingga analyzer mencatatnya terpisah sebagai rss_growth_mb, bukan
+    sebagai memori puncak. Dengan None memori tidak diukur sama sekali
+    (selalu 0.0).
+    """
+    def __init__(self, use_tracemalloc=False):
+        self.source = {True: 'tracemalloc', False: 'rss', None: 'none'}[use_tracemalloc]
+        self._owns_trace = False
+        if use_tracemalloc is None:
+            self._baseline = 0
+        elif use_tracemalloc:
+            import tracemalloc # Impor malas, lihat docstring modul
+            self._tracemalloc = tracemalloc
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._owns_trace = True
+            self._baseline = tracemalloc.get_traced_memory()[0]
+        else:
+            import psutil # Impor malas, lihat docstring modul
+            self._process = psutil.Process(os.getpid())
+            self._baseline = self._process.memory_info().rss
+
+    def stop(self):
+        """
+        Menghentikan pengukuran.
+
+        Returns:
+            float: Memori puncak di atas kondisi awal, dalam MB.
+        """
+        if self.source == 'none':
+            peak = 0
+        elif self.source == 'tracemalloc':
+            peak = max(self._tracemalloc.get_traced_memory()[1] - self._baseline, 0)
+            if self._owns_trace:
+                self._tracemalloc.stop()
+                self._owns_trace = False
+        else:
+            peak = self._process.memory_info().rss - self._baseline
+        return peak / (1024 * 1024)
 
 def evaluate_window(window, piece):
     """
-    Fungsi pembantu yang mengevaluasi sebuah 'window' (list 4 elemen)
-    dan memberikan skor berdasarkan isinya.
+    Fungsi pembantu yang mengevaluasi sebuah 'window' (list 4 elemen, atau
+    `connect` elemen pada papan connect-N) dan memberikan skor berdasarkan isinya.
     """
     score = 0
     opponent_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
+    length = len(window)
 
     # Hitung jumlah bidak masing-masing pemain di dalam window
     ai_count = window.count(piece)
@@ -66,163 +147,1267 @@ def evaluate_window(window, piece):
     empty_count = window.count(0)
 
     # Prioritas 1: AI menang
-    if ai_count == 4:
+    if ai_count == length:
         score += SCORE_MAP['4_ai']
     # Prioritas 2: AI hampir menang (3 bidak)
-    elif ai_count == 3 and empty_count == 1:
+    elif ai_count == length - 1 and empty_count == 1:
         score += SCORE_MAP['3_ai']
     # Prioritas 3: AI punya potensi (2 bidak)
-    elif ai_count == 2 and empty_count == 2:
+    elif ai_count == length - 2 and empty_count == 2:
         score += SCORE_MAP['2_ai']
     
     # Prioritas 4: Blokir lawan yang akan menang
-    if player_count == 3 and empty_count == 1:
+    if player_count == length - 1 and empty_count == 1:
         score += SCORE_MAP['3_player']
     # Prioritas 5: Blokir potensi lawan
-    elif player_count == 2 and empty_count == 2:
+    elif player_count == length - 2 and empty_count == 2:
         score += SCORE_MAP['2_player']
 
     return score
 
-def score_position(board, piece):
+# Indeks 69 x 4 seluruh window papan default pada papan yang diratakan
+# (indeks = row * COLUMN_COUNT + col), dari geometry.py
+WINDOW_INDICES = DEFAULT_GEOMETRY.window_indices
+
+def score_positions(boards, piece, geometry=DEFAULT_GEOMETRY):
+    """
+    Versi batch dari score_position: mengevaluasi banyak papan sekaligus.
+
+    Args:
+        boards (array-like): Array berbentuk (N, rows, columns), misalnya (N, 6, 7).
+        piece (int): Bidak yang dinilai (sudut pandang skor).
+        geometry (BoardGeometry): Geometri papan-papan tersebut.
+
+    Returns:
+        numpy.ndarray: Array int64 berisi N skor, sama dengan memanggil
+        score_position untuk setiap papan.
+    """
+    opponent_piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
+    np, window_indices, window_scores = _numpy_tables(geometry)
+    boards = np.asarray(boards)
+    count = boards.shape[0]
+
+    # Skor Berdasarkan Posisi Tengah
+    # Bidak di kolom tengah lebih berharga karena membuka lebih banyak peluang.
+    # Pada jumlah kolom genap kedua kolom tengah mendapat bobot yang sama.
+    center = boards[:, :, list(geometry.center_columns)] == piece
+    scores = np.count_nonzero(center.reshape(count, -1), axis=1) * CENTER_WEIGHT
+
+    # Skor semua window (horizontal, vertikal, dan kedua diagonal):
+    # satu gather menghasilkan array (N, 69, 4) pada papan default
+    cells = boards.reshape(count, -1)[:, window_indices]
+    own_counts = np.count_nonzero(cells == piece, axis=2)
+    opponent_counts = np.count_nonzero(cells == opponent_piece, axis=2)
+    scores += window_scores[own_counts * (geometry.connect + 1) + opponent_counts].sum(axis=1)
+    return scores
+
+def score_position(board, piece, geometry=DEFAULT_GEOMETRY):
     """
     Fungsi evaluasi heuristik utama.
     Memberikan skor keseluruhan untuk posisi papan saat ini.
     Skor positif menguntungkan AI, skor negatif menguntungkan Player.
+
+    Seluruh window (69 pada papan default) diambil sekaligus dengan satu
+    operasi gather NumPy, lalu jumlah bidak per window dipetakan ke skor
+    lewat window_score_table (diturunkan dari evaluate_window, sehingga
+    hasilnya identik).
     """
-    score = 0
-    
-    # Skor Berdasarkan Posisi Tengah
-    # Bidak di kolom tengah lebih berharga karena membuka lebih banyak peluang.
-    center_array = [int(i) for i in list(board[:, COLUMN_COUNT // 2])]
-    center_count = center_array.count(piece)
-    score += center_count * 6
-
-    # Skor Horizontal
-    for r in range(ROW_COUNT):
-        row_array = [int(i) for i in list(board[r,:])]
-        for c in range(COLUMN_COUNT - 3):
-            window = row_array[c:c+4]
-            score += evaluate_window(window, piece)
-
-    # Skor Vertikal
-    for c in range(COLUMN_COUNT):
-        col_array = [int(i) for i in list(board[:,c])]
-        for r in range(ROW_COUNT - 3):
-            window = col_array[r:r+4]
-            score += evaluate_window(window, piece)
-
-    # Skor Diagonal (positif /)
-    for r in range(ROW_COUNT - 3):
-        for c in range(COLUMN_COUNT - 3):
-            window = [board[r+i][c+i] for i in range(4)]
-            score += evaluate_window(window, piece)
-
-    # Skor Diagonal (negatif \)
-    for r in range(ROW_COUNT - 3):
-        for c in range(COLUMN_COUNT - 3):
-            window = [board[r+3-i][c+i] for i in range(4)]
-            score += evaluate_window(window, piece)
-            
+    np = _numpy_tables(geometry)[0]
+    return int(score_positions(np.asarray(board)[np.newaxis], piece, geometry)[0])
+
+@lru_cache(maxsize=None)
+def window_score_table(connect=CONNECT_LENGTH):
+    """
+    Membuat tabel skor window yang diindeks dengan (jumlah bidak sendiri) *
+    (connect + 1) + (jumlah bidak lawan), yaitu own * 5 + opp pada papan
+    default. Nilainya diambil langsung dari evaluate_window sehingga selalu
+    konsisten dengan SCORE_MAP. Dibuat sekali per panjang garis.
+    """
+    base = connect + 1
+    table = [0] * (base * base)
+    for own in range(base):
+        for opp in range(base - own):
+            window = [AI_PIECE] * own + [PLAYER_PIECE] * opp + [0] * (connect - own - opp)
+            table[own * base + opp] = evaluate_window(window, AI_PIECE)
+    return tuple(table)
+
+WINDOW_SCORE_TABLE = window_score_table()
+
+# Versi NumPy dari indeks window dan window_score_table per geometri, dibuat oleh _numpy_tables()
+_NUMPY_TABLES = {}
+
+def _numpy_tables(geometry=DEFAULT_GEOMETRY):
+    """
+    Mengimpor NumPy dan membuat tabel window versi array saat pertama kali
+    dibutuhkan oleh evaluasi batch pada geometri `geometry`.
+
+    Returns:
+        tuple: (modul numpy, indeks window (69, 4), skor window (25,)) untuk papan default.
+    """
+    tables = _NUMPY_TABLES.get(geometry)
+    if tables is None:
+        import numpy as np
+        tables = (np, np.array(geometry.window_indices, dtype=np.intp),
+                  np.array(window_score_table(geometry.connect), dtype=np.int64))
+        _NUMPY_TABLES[geometry] = tables
+    return tables
+
+def score_bitboard(own_bits, opponent_bits, geometry=DEFAULT_GEOMETRY):
+    """
+    Versi score_position untuk BitboardGame. Menghasilkan skor yang sama persis
+    dengan score_position, tetapi jumlah bidak di setiap window dihitung
+    dengan operasi AND dan bit_count.
+    """
+    score = (own_bits & geometry.center_mask).bit_count() * CENTER_WEIGHT
+    table = window_score_table(geometry.connect)
+    base = geometry.connect + 1
+    for window in geometry.window_masks:
+        score += table[(own_bits & window).bit_count() * base + (opponent_bits & window).bit_count()]
     return score
 
+# Untuk setiap slot papan default (diindeks row * COLUMN_COUNT + col), daftar
+# window yang memuat slot tersebut. Satu langkah hanya mengubah window-window ini.
+CELL_WINDOWS = DEFAULT_GEOMETRY.cell_windows
+
+class IncrementalEvaluator:
+    """
+    Evaluator heuristik yang diperbarui secara inkremental setiap kali bidak
+    ditambah atau diambil dari papan.
+
+    Untuk setiap window disimpan kode (jumlah bidak AI * 5 + jumlah bidak
+    Player pada papan default), sama dengan indeks window_score_table. Saat
+    sebuah bidak dijatuhkan, hanya window yang melewati slot tersebut
+    (paling banyak 16 pada papan default) yang dihitung ulang, sehingga
+    current_score() bisa dijawab dalam O(1).
+    Skornya selalu sama dengan score_position(board, AI_PIECE, geometry).
+    """
+    def __init__(self, board=None, geometry=DEFAULT_GEOMETRY):
+        """
+        Args:
+            board (array-like or None): Papan awal. None berarti papan kosong.
+            geometry (BoardGeometry): Geometri papan yang dievaluasi.
+        """
+        self.geometry = geometry
+        self._table = window_score_table(geometry.connect)
+        self._ai_step = geometry.connect + 1
+        self._cell_windows = geometry.cell_windows
+        self._columns = geometry.columns
+        self._center_columns = geometry.center_columns
+        window_count = len(geometry.window_indices)
+        self.window_codes = [0] * window_count
+        # Skor papan kosong (semua window bernilai tabel[0])
+        self.total = self._table[0] * window_count
+        if board is not None:
+            for r in range(geometry.rows):
+                for c in range(geometry.columns):
+                    piece = int(board[r][c])
+                    if piece != 0:
+                        self.add_piece(r, c, piece)
+
+    def copy(self):
+        """
+        Mengembalikan salinan independen dari evaluator ini.
+        """
+        clone = IncrementalEvaluator(geometry=self.geometry)
+        clone.window_codes = list(self.window_codes)
+        clone.total = self.total
+        return clone
+
+    def add_piece(self, row, col, piece):
+        """
+        Memperbarui skor setelah bidak `piece` ditempatkan di (row, col).
+        """
+        step = self._ai_step if piece == AI_PIECE else 1
+        codes = self.window_codes
+        table = self._table
+        total = self.total
+        for w in self._cell_windows[row * self._columns + col]:
+            code = codes[w]
+            total += table[code + step] - table[code]
+            codes[w] = code + step
+        if piece == AI_PIECE and col in self._center_columns:
+            total += CENTER_WEIGHT
+        self.total = total
+
+    def remove_piece(self, row, col, piece):
+        """
+        Membalik add_piece: memperbarui skor setelah bidak di (row, col) diambil.
+        """
+        step = self._ai_step if piece == AI_PIECE else 1
+        codes = self.window_codes
+        table = self._table
+        total = self.total
+        for w in self._cell_windows[row * self._columns + col]:
+            code = codes[w]
+            total += table[code - step] - table[code]
+            codes[w] = code - step
+        if piece == AI_PIECE and col in self._center_columns:
+            total -= CENTER_WEIGHT
+        self.total = total
+
+    def current_score(self):
+        """
+        Skor heuristik posisi saat ini dari sudut pandang AI, dalam O(1).
+        """
+        return self.total
+
+def evaluate_game(game):
+    """
+    Mengevaluasi posisi dari sudut pandang AI, memilih implementasi yang
+    sesuai dengan representasi papan yang digunakan. Jika game memiliki
+    IncrementalEvaluator, skornya langsung dibaca dari sana.
+    """
+    if game.evaluator is not None:
+        return game.evaluator.current_score()
+    if isinstance(game, BitboardGame):
+        return score_bitboard(game.bitboards[AI_PIECE], game.bitboards[PLAYER_PIECE], game.geometry)
+    return score_position(game.board, AI_PIECE, game.geometry)
+
 def is_terminal_node(game):
     """
     Mengecek apakah state permainan saat ini adalah terminal (akhir).
     Kondisi terminal: ada pemenang, atau papan penuh (seri).
     """
-    return game.winning_move(PLAYER_PIECE) is not None or \
-           game.winning_move(AI_PIECE) is not None or \
-           game.is_board_full()
+    return get_terminal_status(game) is not None
+
+def get_terminal_status(game, last_move=None):
+    """
+    Menentukan status akhir posisi dalam satu kali pemeriksaan.
+
+    Jika `last_move` (row, col, piece) diketahui, hanya garis yang melewati
+    bidak terakhir itu yang diperiksa, karena hanya pemain yang baru saja
+    melangkah yang mungkin menang. Tanpa `last_move` (misalnya di akar
+    pencarian) seluruh papan dipindai.
+
+    Returns:
+        int or None: Bidak pemenang (AI_PIECE/PLAYER_PIECE), 0 jika seri,
+        atau None jika permainan belum berakhir.
+    """
+    if last_move is not None:
+        row, col, piece = last_move
+        if game.winning_move_at(row, col, piece) is not None:
+            return piece
+    else:
+        if game.winning_move(AI_PIECE) is not None:
+            return AI_PIECE
+        if game.winning_move(PLAYER_PIECE) is not None:
+            return PLAYER_PIECE
+    if game.is_board_full():
+        return 0
+    return None
+
+def terminal_score(status):
+    """
+    Mengubah status terminal (lihat get_terminal_status) menjadi skor dari
+    sudut pandang AI.
+    """
+    if status == AI_PIECE:
+        return SCORE_MAP['4_ai'] # AI menang
+    elif status == PLAYER_PIECE:
+        return -SCORE_MAP['4_ai'] # Player menang
+    return 0 # Game seri
+
+def score_frontier(game, moves, piece):
+    """
+    Mengevaluasi semua anak dari sebuah node frontier (depth 1) sekaligus.
+
+    Anak yang terminal (menang/seri) langsung diberi skor terminal. Papan
+    anak lainnya ditumpuk menjadi array (N, rows, columns) dan dinilai dengan satu
+    panggilan score_positions.
+
+    Returns:
+        list: Skor untuk setiap langkah di `moves`, dengan urutan yang sama.
+    """
+    scores = [None] * len(moves)
+    pending = []
+    for i, col in enumerate(moves):
+        row = game.play(col, piece)
+        status = get_terminal_status(game, (row, col, piece))
+        game.undo()
+        if status is not None:
+            scores[i] = terminal_score(status)
+        else:
+            pending.append((i, row, col))
+
+    if pending:
+        np = _numpy_tables(game.geometry)[0]
+        boards = np.repeat(np.asarray(game.board)[np.newaxis], len(pending), axis=0)
+        for k, (_, row, col) in enumerate(pending):
+            boards[k, row, col] = piece
+        for (i, _, _), score in zip(pending, score_positions(boards, AI_PIECE, game.geometry).tolist()):
+            scores[i] = score
+    return scores
+
+def tt_key(game, ai_to_move, symmetry=False):
+    """
+    Menghitung kunci Transposition Table untuk posisi saat ini.
+
+    Jika `symmetry` aktif (dan geometri papan simetris, lihat
+    BoardGeometry.mirror_symmetric), kunci dihitung dari hash kanonik sehingga
+    sebuah posisi dan cerminan kiri-kanannya berbagi entri yang sama. Langkah
+    terbaik yang tersimpan selalu dalam orientasi kanonik; `mirrored`
+    menandakan bahwa langkah tersebut harus dicerminkan untuk posisi ini.
+
+    Returns:
+        tuple: (kunci, mirrored).
+    """
+    if symmetry and game.geometry.mirror_symmetric:
+        key, mirrored = game.canonical_hash()
+    else:
+        key, mirrored = game.hash, False
+    if ai_to_move:
+        key ^= ZOBRIST_SIDE_KEY
+    return key, mirrored
+
+def extract_pv(game, tt, max_length, symmetry=False):
+    """
+    Menyusun principal variation dengan mengikuti langkah terbaik yang
+    tersimpan di Transposition Table, mulai dari giliran AI di posisi `game`.
+    Papan dikembalikan ke posisi semula.
+
+    Returns:
+        list: Kolom-kolom PV (bisa lebih pendek dari `max_length`).
+    """
+    pv = []
+    piece = AI_PIECE
+    seen = set()
+    while len(pv) < max_length and get_terminal_status(game) is None:
+        key, mirrored = tt_key(game, piece == AI_PIECE, symmetry)
+        entry = tt.peek(key)
+        if entry is None or entry[4] is None or key in seen:
+            break
+        seen.add(key)
+        col = game.geometry.mirror_column(entry[4]) if mirrored else entry[4]
+        if not game.is_valid_location(col):
+            break
+        game.play(col, piece)
+        pv.append(col)
+        piece = PLAYER_PIECE if piece == AI_PIECE else AI_PIECE
+    for _ in pv:
+        game.undo()
+    return pv
+
+def is_mirror_position(game, symmetry):
+    """
+    Mengecek apakah pintasan simetri boleh dipakai pada posisi ini: `symmetry`
+    aktif, evaluasi geometri papan bernilai sama untuk posisi dan cerminannya
+    (BoardGeometry.mirror_symmetric), dan papan sama dengan cerminannya.
+    Perbandingan hash cukup murah untuk dipanggil di setiap node.
+    """
+    return symmetry and game.geometry.mirror_symmetric and game.hash == game.mirror_hash
+
+def drop_mirror_moves(moves, geometry=DEFAULT_GEOMETRY):
+    """
+    Untuk papan yang simetris, langkah di kolom c dan kolom cerminannya
+    menghasilkan posisi yang saling mencerminkan dan bernilai sama. Fungsi ini
+    hanya menyisakan langkah yang muncul lebih dulu dari setiap pasangan, sehingga
+    langkah yang terpilih tetap sama dengan pencarian tanpa simetri.
+    """
+    kept = []
+    for col in moves:
+        if geometry.mirror_column(col) not in kept:
+            kept.append(col)
+    return kept
+
+def tactical_moves(game, piece):
+    """
+    Lapisan taktis: mendeteksi langkah-langkah yang hasilnya sudah pasti
+    tanpa perlu pencarian, untuk pemain `piece` yang akan melangkah.
+
+    Returns:
+        tuple: (winning, blocking, losing), masing-masing list kolom:
+        - winning  : langkah yang langsung memenangkan permainan.
+        - blocking : kolom tempat lawan akan langsung menang, sehingga wajib diblok.
+        - losing   : langkah tepat di bawah slot kemenangan lawan, sehingga lawan
+                     bisa langsung menang di atasnya.
+    """
+    opponent = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    geometry = game.geometry
+    if isinstance(game, BitboardGame):
+        mask = game.mask
+        possible = (mask + geometry.bottom_mask) & geometry.board_mask
+        own_wins = winning_cells(game.bitboards[piece], mask, geometry) & possible
+        opponent_wins = winning_cells(game.bitboards[opponent], mask, geometry)
+        blocks = opponent_wins & possible
+        below = (opponent_wins >> 1) & possible
+        columns = range(geometry.columns)
+        column_masks = geometry.column_masks
+        return ([c for c in columns if own_wins & column_masks[c]],
+                [c for c in columns if blocks & column_masks[c]],
+                [c for c in columns if below & column_masks[c]])
+
+    # Representasi NumPy: coba setiap langkah dengan play/undo
+    winning, blocking, losing = [], [], []
+    for col in range(geometry.columns):
+        row = game.heights[col]
+        if row >= geometry.rows:
+            continue
+        for who, result in ((piece, winning), (opponent, blocking)):
+            game.play(col, who)
+            if game.winning_move_at(row, col, who) is not None:
+                result.append(col)
+            game.undo()
+        if row + 1 < geometry.rows:
+            game.play(col, piece)
+            game.play(col, opponent)
+            if game.winning_move_at(row + 1, col, opponent) is not None:
+                losing.append(col)
+            game.undo()
+            game.undo()
+    return winning, blocking, losing
+
+def tactical_filter(game, piece, moves):
+    """
+    Menerapkan lapisan taktis pada sebuah node.
+
+    Returns:
+        tuple: (status, moves). `status` adalah (kolom, pemenang) jika hasil
+        node sudah pasti: `piece` menang langsung, atau lawan pasti menang
+        (dua ancaman sekaligus, atau semua langkah memberi lawan kemenangan).
+        Jika belum pasti, status bernilai None dan `moves` hanya berisi langkah
+        yang tidak langsung kalah (blok wajib jika lawan punya satu ancaman).
+    """
+    winning, blocking, losing = tactical_moves(game, piece)
+    opponent = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    if winning:
+        return (winning[0], piece), moves
+    if len(blocking) > 1:
+        return (blocking[0], opponent), moves
+    candidates = blocking if blocking else moves
+    safe = [col for col in candidates if col not in losing]
+    if not safe:
+        return (candidates[0], opponent), moves
+    return None, [col for col in moves if col in safe]
 
-def minimax_alpha_beta(game, depth, alpha, beta, maximizing_player):
+def minimax_alpha_beta(game, depth, alpha, beta, maximizing_player, last_move=None, tt=None,
+                       preferred_move=None, orderer=None, batch_leaves=False, symmetry=False,
+                       tactics=False, ctx=None):
     """
     Implementasi algoritma Minimax dengan optimisasi Alpha-Beta Pruning.
+
+    `last_move` adalah langkah (row, col, piece) yang menghasilkan posisi ini,
+    dipakai agar status terminal cukup dihitung sekali per node. Node akar
+    dikenali dari `last_move` yang bernilai None.
+
+    Jika `tt` (TranspositionTable) diberikan, hasil yang tersimpan dipakai untuk
+    mempersempit atau langsung memotong window [alpha, beta], dan langkah
+    terbaik yang tersimpan dicoba lebih dulu. `preferred_move` (misalnya
+    langkah terbaik dari iterasi sebelumnya) selalu dicoba paling awal.
+    `orderer` (MoveOrderer) mengurutkan langkah lainnya; tanpa orderer langkah
+    dicoba dari kiri ke kanan.
+
+    Jika `batch_leaves` aktif, semua anak dari node depth 1 dievaluasi sekaligus
+    dengan score_frontier, lalu skor tersebut diproses sesuai urutan langkah
+    sehingga cutoff dan jumlah node tetap sama dengan pencarian biasa.
+
+    Jika `symmetry` aktif, Transposition Table diindeks dengan hash kanonik
+    (posisi dan cerminannya berbagi entri), dan pada papan yang simetris
+    hanya satu dari setiap pasangan langkah cerminan yang dicari.
+
+    Jika `tactics` aktif, lapisan taktis (tactical_filter) dipakai pada node
+    dengan depth >= 2: kemenangan langsung dikembalikan tanpa mencari, dan
+    langkah yang langsung memberi lawan kemenangan tidak dicari. Pada depth
+    tersebut pencarian biasa pasti menemukan kemenangan/kekalahan yang sama,
+    sehingga skor node tidak berubah.
+
+    `ctx` (SearchContext) membawa penghitung node, batas waktu, status
+    pembatalan, dan callback instrumentasi milik pencarian ini. Tanpa `ctx`
+    dibuat konteks baru yang tidak dibatasi.
     """
-    global nodes_evaluated_counter
-    nodes_evaluated_counter += 1
+    if ctx is None:
+        ctx = SearchContext()
+    ctx.nodes += 1
+    ply = len(game.move_history)
+    ctx.nodes_per_ply[ply] += 1
+    if ctx.nodes % TIME_CHECK_INTERVAL == 0:
+        ctx.check_limits()
+    if ctx.on_node is not None:
+        ctx.on_node(game, depth)
 
-    valid_locations = game.get_valid_locations()
-    is_terminal = is_terminal_node(game)
+    status = get_terminal_status(game, last_move)
 
     # Base case: kedalaman tercapai atau permainan berakhir
-    if depth == 0 or is_terminal:
-        if is_terminal:
-            if game.winning_move(AI_PIECE) is not None:
-                return (None, SCORE_MAP['4_ai']) # AI menang
-            elif game.winning_move(PLAYER_PIECE) is not None:
-                return (None, -SCORE_MAP['4_ai']) # Player menang
-            else: # Game seri
-                return (None, 0)
+    if depth == 0 or status is not None:
+        ctx.leaf_nodes += 1
+        if status is not None:
+            return (None, terminal_score(status))
         else: # Kedalaman 0, gunakan heuristik
-            return (None, score_position(game.board, AI_PIECE))
+            return (None, evaluate_game(game))
+
+    heights = game.heights
+    geometry = game.geometry
+    rows = geometry.rows
+    valid_locations = [col for col in range(geometry.columns) if heights[col] < rows]
+
+    # Cek Transposition Table
+    tt_move = None
+    if tt is not None:
+        key, mirrored = tt_key(game, maximizing_player, symmetry)
+        entry = tt.probe(key)
+        if entry is not None:
+            _, entry_depth, entry_score, entry_flag, tt_move = entry
+            if mirrored and tt_move is not None:
+                tt_move = geometry.mirror_column(tt_move)
+            # Di akar kita tetap mencari agar selalu mendapat langkah terbaik
+            if entry_depth >= depth and last_move is not None:
+                if entry_flag == EXACT:
+                    tt.cutoffs += 1
+                    return (tt_move, entry_score)
+                elif entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    tt.cutoffs += 1
+                    return (tt_move, entry_score)
+        alpha_start, beta_start = alpha, beta
+
+    if tactics and depth >= 2:
+        forced, valid_locations = tactical_filter(game, AI_PIECE if maximizing_player else PLAYER_PIECE,
+                                                  valid_locations)
+        if forced is not None:
+            return (forced[0], terminal_score(forced[1]))
+
+    # Urutkan langkah: langkah terbaik dicoba lebih dulu agar pruning maksimal
+    if orderer is not None:
+        valid_locations = orderer.order_moves(valid_locations, ply, AI_PIECE if maximizing_player else PLAYER_PIECE, tt_move)
+    elif tt_move in valid_locations:
+        valid_locations.remove(tt_move)
+        valid_locations.insert(0, tt_move)
+    if preferred_move in valid_locations:
+        valid_locations.remove(preferred_move)
+        valid_locations.insert(0, preferred_move)
+    if is_mirror_position(game, symmetry):
+        valid_locations = drop_mirror_moves(valid_locations, geometry)
+
+    child_scores = None
+    if batch_leaves and depth == 1:
+        child_scores = score_frontier(game, valid_locations, AI_PIECE if maximizing_player else PLAYER_PIECE)
 
     # Langkah rekursif untuk Maximizing Player (AI)
     if maximizing_player:
         value = -inf
         best_col = random.choice(valid_locations) # Pilih langkah acak sebagai default
-        for col in valid_locations:
-            temp_game = Connect4Game()
-            temp_game.board = np.copy(game.board)
-            row = temp_game.get_next_open_row(col)
-            temp_game.drop_piece(row, col, AI_PIECE)
-            
-            new_score = minimax_alpha_beta(temp_game, depth - 1, alpha, beta, False)[1]
+        for move_index, col in enumerate(valid_locations):
+            if child_scores is not None:
+                ctx.nodes += 1 # Anak frontier tetap dihitung sebagai node
+                ctx.nodes_per_ply[ply + 1] += 1
+                ctx.leaf_nodes += 1
+                new_score = child_scores[move_index]
+            else:
+                row = game.play(col, AI_PIECE)
+                new_score = minimax_alpha_beta(game, depth - 1, alpha, beta, False, (row, col, AI_PIECE), tt,
+                                               orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry,
+                                               tactics=tactics, ctx=ctx)[1]
+                game.undo()
             if new_score > value:
                 value = new_score
                 best_col = col
             alpha = max(alpha, value)
             if alpha >= beta:
+                ctx.cutoffs_per_ply[ply] += 1
+                if ctx.on_cutoff is not None:
+                    ctx.on_cutoff(ply, col, move_index)
+                if orderer is not None:
+                    orderer.record_cutoff(col, ply, depth, AI_PIECE, move_index)
                 break # Pruning
-        return best_col, value
 
     # Langkah rekursif untuk Minimizing Player (Player)
     else: # Minimizing player
         value = inf
         best_col = random.choice(valid_locations)
-        for col in valid_locations:
-            temp_game = Connect4Game()
-            temp_game.board = np.copy(game.board)
-            row = temp_game.get_next_open_row(col)
-            temp_game.drop_piece(row, col, PLAYER_PIECE)
-
-            new_score = minimax_alpha_beta(temp_game, depth - 1, alpha, beta, True)[1]
+        for move_index, col in enumerate(valid_locations):
+            if child_scores is not None:
+                ctx.nodes += 1 # Anak frontier tetap dihitung sebagai node
+                ctx.nodes_per_ply[ply + 1] += 1
+                ctx.leaf_nodes += 1
+                new_score = child_scores[move_index]
+            else:
+                row = game.play(col, PLAYER_PIECE)
+                new_score = minimax_alpha_beta(game, depth - 1, alpha, beta, True, (row, col, PLAYER_PIECE), tt,
+                                               orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry,
+                                               tactics=tactics, ctx=ctx)[1]
+                game.undo()
             if new_score < value:
                 value = new_score
                 best_col = col
             beta = min(beta, value)
             if alpha >= beta:
+                ctx.cutoffs_per_ply[ply] += 1
+                if ctx.on_cutoff is not None:
+                    ctx.on_cutoff(ply, col, move_index)
+                if orderer is not None:
+                    orderer.record_cutoff(col, ply, depth, PLAYER_PIECE, move_index)
                 break # Pruning
-        return best_col, value
 
+    # Simpan hasil ke Transposition Table beserta jenis batasnya
+    if tt is not None:
+        if value <= alpha_start:
+            flag = UPPER_BOUND
+        elif value >= beta_start:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        tt.store(key, depth, value, flag, geometry.mirror_column(best_col) if mirrored else best_col)
 
-def get_best_move(game, analyzer, depth=DEFAULT_DEPTH):
+    return best_col, value
+
+
+def _tt_entry_for_color(entry_score, entry_flag, color):
+    """
+    Transposition Table menyimpan skor dari sudut pandang AI. Fungsi ini
+    mengubah skor dan jenis batasnya ke sudut pandang pemain yang melangkah
+    (color = 1 untuk AI, -1 untuk Player), karena negasi menukar batas atas
+    dan batas bawah.
+    """
+    if color == 1 or entry_flag == EXACT:
+        return color * entry_score, entry_flag
+    return -entry_score, LOWER_BOUND if entry_flag == UPPER_BOUND else UPPER_BOUND
+
+def negamax_pvs(game, depth, alpha, beta, color, last_move=None, tt=None,
+                preferred_move=None, orderer=None, batch_leaves=False, symmetry=False, tactics=False,
+                ctx=None):
+    """
+    Formulasi Negamax dari Minimax dengan Principal Variation Search (PVS).
+
+    Negamax memakai satu cabang untuk kedua pemain: skor selalu dilihat dari
+    sudut pandang pemain yang melangkah (`color` = 1 untuk AI, -1 untuk
+    Player), dan skor anak cukup dinegasikan. Dengan PVS, anak pertama dicari
+    dengan window penuh, sedangkan anak lainnya dicari dengan null window
+    (alpha, alpha + 1) untuk sekadar membuktikan bahwa mereka tidak lebih
+    baik. Hanya jika pembuktian itu gagal (fail-high) anak tersebut dicari
+    ulang dengan window penuh. Karena skor heuristik berupa bilangan bulat,
+    null window selebar 1 sudah cukup.
+
+    Parameter lainnya sama dengan minimax_alpha_beta, dan langkah yang dipilih
+    juga sama (langkah pertama dengan skor tertinggi). Entri Transposition
+    Table tetap disimpan dari sudut pandang AI sehingga bisa dipakai bersama
+    minimax_alpha_beta.
+
+    Returns:
+        tuple: (kolom terbaik, skor dari sudut pandang pemain yang melangkah).
+    """
+    if ctx is None:
+        ctx = SearchContext()
+    ctx.nodes += 1
+    ply = len(game.move_history)
+    ctx.nodes_per_ply[ply] += 1
+    if ctx.nodes % TIME_CHECK_INTERVAL == 0:
+        ctx.check_limits()
+    if ctx.on_node is not None:
+        ctx.on_node(game, depth)
+
+    status = get_terminal_status(game, last_move)
+    if status is not None:
+        ctx.leaf_nodes += 1
+        return (None, color * terminal_score(status))
+    if depth == 0:
+        ctx.leaf_nodes += 1
+        return (None, color * evaluate_game(game))
+
+    heights = game.heights
+    geometry = game.geometry
+    rows = geometry.rows
+    valid_locations = [col for col in range(geometry.columns) if heights[col] < rows]
+    piece = AI_PIECE if color == 1 else PLAYER_PIECE
+
+    # Cek Transposition Table
+    tt_move = None
+    if tt is not None:
+        key, mirrored = tt_key(game, color == 1, symmetry)
+        entry = tt.probe(key)
+        if entry is not None:
+            _, entry_depth, entry_score, entry_flag, tt_move = entry
+            if mirrored and tt_move is not None:
+                tt_move = geometry.mirror_column(tt_move)
+            if entry_depth >= depth and last_move is not None:
+                entry_score, entry_flag = _tt_entry_for_color(entry_score, entry_flag, color)
+                if entry_flag == EXACT:
+                    tt.cutoffs += 1
+                    return (tt_move, entry_score)
+                elif entry_flag == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    tt.cutoffs += 1
+                    return (tt_move, entry_score)
+        alpha_start, beta_start = alpha, beta
+
+    if tactics and depth >= 2:
+        forced, valid_locations = tactical_filter(game, piece, valid_locations)
+        if forced is not None:
+            return (forced[0], color * terminal_score(forced[1]))
+
+    # Urutan langkah sama persis dengan minimax_alpha_beta
+    if orderer is not None:
+        valid_locations = orderer.order_moves(valid_locations, ply, piece, tt_move)
+    elif tt_move in valid_locations:
+        valid_locations.remove(tt_move)
+        valid_locations.insert(0, tt_move)
+    if preferred_move in valid_locations:
+        valid_locations.remove(preferred_move)
+        valid_locations.insert(0, preferred_move)
+    if is_mirror_position(game, symmetry):
+        valid_locations = drop_mirror_moves(valid_locations, geometry)
+
+    child_scores = None
+    if batch_leaves and depth == 1:
+        child_scores = score_frontier(game, valid_locations, piece)
+
+    value = -inf
+    best_col = valid_locations[0]
+    for move_index, col in enumerate(valid_locations):
+        if child_scores is not None:
+            ctx.nodes += 1 # Anak frontier tetap dihitung sebagai node
+            ctx.nodes_per_ply[ply + 1] += 1
+            ctx.leaf_nodes += 1
+            new_score = color * child_scores[move_index]
+        else:
+            row = game.play(col, piece)
+            child_move = (row, col, piece)
+            if move_index == 0:
+                new_score = -negamax_pvs(game, depth - 1, -beta, -alpha, -color, child_move, tt,
+                                         orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry,
+                                         tactics=tactics, ctx=ctx)[1]
+            else:
+                # Null window: cukup buktikan bahwa langkah ini tidak melebihi alpha
+                new_score = -negamax_pvs(game, depth - 1, -alpha - 1, -alpha, -color, child_move, tt,
+                                         orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry,
+                                         tactics=tactics, ctx=ctx)[1]
+                if alpha < new_score < beta:
+                    # Fail-high: langkah ini ternyata lebih baik, cari ulang dengan window penuh
+                    new_score = -negamax_pvs(game, depth - 1, -beta, -new_score, -color, child_move, tt,
+                                             orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry,
+                                             tactics=tactics, ctx=ctx)[1]
+            game.undo()
+        if new_score > value:
+            value = new_score
+            best_col = col
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            ctx.cutoffs_per_ply[ply] += 1
+            if ctx.on_cutoff is not None:
+                ctx.on_cutoff(ply, col, move_index)
+            if orderer is not None:
+                orderer.record_cutoff(col, ply, depth, piece, move_index)
+            break # Pruning
+
+    # Simpan hasil ke Transposition Table dari sudut pandang AI
+    if tt is not None:
+        if value <= alpha_start:
+            flag = UPPER_BOUND
+        elif value >= beta_start:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        if color == -1 and flag != EXACT:
+            flag = LOWER_BOUND if flag == UPPER_BOUND else UPPER_BOUND
+        tt.store(key, depth, color * value, flag, geometry.mirror_column(best_col) if mirrored else best_col)
+
+    return best_col, value
+
+def search_position(game, depth, alpha, beta, maximizing_player, last_move=None, tt=None,
+                    preferred_move=None, orderer=None, batch_leaves=False, search=DEFAULT_SEARCH,
+                    symmetry=False, tactics=False, ctx=None):
+    """
+    Menjalankan pencarian dengan mode `search` (lihat SEARCH_MODES) dan
+    mengembalikan hasilnya dari sudut pandang AI, seperti minimax_alpha_beta.
+    `alpha` dan `beta` juga dari sudut pandang AI.
+
+    Returns:
+        tuple: (kolom terbaik, skor dari sudut pandang AI).
+    """
+    if search == 'minimax':
+        return minimax_alpha_beta(game, depth, alpha, beta, maximizing_player, last_move, tt,
+                                  preferred_move=preferred_move, orderer=orderer, batch_leaves=batch_leaves,
+                                  symmetry=symmetry, tactics=tactics, ctx=ctx)
+    if search == 'pvs':
+        if maximizing_player:
+            return negamax_pvs(game, depth, alpha, beta, 1, last_move, tt, preferred_move=preferred_move,
+                               orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry, tactics=tactics,
+                               ctx=ctx)
+        col, score = negamax_pvs(game, depth, -beta, -alpha, -1, last_move, tt, preferred_move=preferred_move,
+                                 orderer=orderer, batch_leaves=batch_leaves, symmetry=symmetry, tactics=tactics,
+                                 ctx=ctx)
+        return col, -score
+    raise ValueError(f"Mode pencarian tidak dikenal: {search!r}")
+
+
+def iterative_deepening(game, time_limit_ms, tt=None, max_depth=None, start_time=None, orderer=None,
+                        batch_leaves=False, search=DEFAULT_SEARCH, symmetry=False, tactics=False, ctx=None,
+                        preferred_move=None):
+    """
+    Menjalankan Minimax berulang kali dengan depth 1, 2, 3, ... sampai batas
+    waktu habis. Langkah terbaik dari iterasi sebelumnya dicoba lebih dulu
+    pada iterasi berikutnya sehingga pruning semakin efektif.
+
+    Batas waktu ini tidak berlaku untuk iterasi depth 1, sehingga selalu ada
+    langkah yang dikembalikan. Iterasi yang terpotong di tengah jalan
+    dibuang. Waktu dihitung sejak `start_time` (default: saat fungsi ini
+    dipanggil). Batas waktu dipasang sebagai deadline pada `ctx`; jika `ctx`
+    sudah memiliki deadline (misalnya batas keras dari engine_server), yang
+    dipakai adalah yang lebih awal, dan deadline semula dipulihkan di akhir.
+    Deadline semula itu berlaku sejak depth 1: jika terlewati sebelum satu
+    iterasi pun selesai, SearchTimeout diteruskan ke pemanggil.
+    `preferred_move` (misalnya langkah PV dari giliran sebelumnya) dicoba
+    paling awal pada iterasi pertama.
+
+    Returns:
+        tuple: (kolom terbaik, skor, depth terakhir yang selesai).
+    """
+    if ctx is None:
+        ctx = SearchContext()
+    if start_time is None:
+        start_time = time.time()
+    empty_cells = game.geometry.cell_count - sum(game.heights)
+    if max_depth is None or max_depth > empty_cells:
+        max_depth = empty_cells
+    root_moves = len(game.move_history)
+    outer_deadline = ctx.deadline
+    deadline = start_time + time_limit_ms / 1000
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+
+    best_col, best_score, completed_depth = None, None, 0
+    try:
+        for current_depth in range(1, max_depth + 1):
+            # Batas waktu baru aktif setelah depth 1 selesai
+            if current_depth > 1:
+                ctx.deadline = deadline
+            try:
+                col, score = search_position(game, current_depth, -inf, inf, True, tt=tt,
+                                             preferred_move=preferred_move if best_col is None else best_col,
+                                             orderer=orderer, batch_leaves=batch_leaves, search=search,
+                                             symmetry=symmetry, tactics=tactics, ctx=ctx)
+            except SearchTimeout:
+                # Kembalikan papan ke posisi akar lalu pakai hasil iterasi terakhir
+                while len(game.move_history) > root_moves:
+                    game.undo()
+                if best_col is None:
+                    raise # Batas keras pemanggil habis sebelum depth 1 selesai
+                break
+            best_col, best_score, completed_depth = col, score, current_depth
+            # Hentikan jika waktu habis atau hasil permainan sudah pasti
+            if time.time() - start_time >= time_limit_ms / 1000 or abs(score) >= SCORE_MAP['4_ai']:
+                break
+    finally:
+        ctx.deadline = outer_deadline
+
+    return best_col, best_score, completed_depth
+
+# --- Pencarian Paralel di Akar ---
+# Pool proses dibuat sekali per jumlah worker lalu dipakai ulang, karena
+# membuat proses baru jauh lebih mahal daripada satu pencarian dangkal.
+# Setiap pool memiliki satu nilai alpha bersama (multiprocessing.Value)
+# yang dibaca worker sebelum mencari subtree-nya. Setiap proses worker juga
+# menyimpan satu Transposition Table yang dipakai ulang oleh semua tugasnya,
+# sehingga subtree yang sama tidak dicari ulang dari nol di setiap tugas.
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+_parallel_searches = itertools.count(1) # Nomor pencarian paralel, untuk aging TT worker
+_shared_alpha = None # Di dalam proses worker: alpha bersama milik pool
+_worker_tt = None # Di dalam proses worker: TT yang dipakai ulang antar tugas
+_worker_search = None # Di dalam proses worker: nomor pencarian tugas terakhir
+
+# Nilai awal alpha bersama (lebih kecil dari skor apa pun)
+_NO_ALPHA = -(1 << 62)
+
+def _init_worker(shared_alpha):
+    """
+    Initializer proses worker: menyimpan referensi ke alpha bersama.
+    """
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+def _get_process_pool(workers):
+    """
+    Mengembalikan (executor, alpha bersama, lock) untuk jumlah worker tertentu.
+    Lock memastikan satu pool hanya dipakai satu pencarian paralel pada satu waktu.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with _process_pools_lock:
+        if workers not in _process_pools:
+            shared_alpha = multiprocessing.Value('q', _NO_ALPHA)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(shared_alpha,))
+            _process_pools[workers] = (executor, shared_alpha, threading.Lock())
+        return _process_pools[workers]
+
+def shutdown_process_pools():
+    """
+    Menutup semua pool proses yang pernah dibuat oleh pencarian paralel.
+    """
+    with _process_pools_lock:
+        for executor, _, _ in _process_pools.values():
+            executor.shutdown(wait=True)
+        _process_pools.clear()
+
+def _worker_table(options, search_id):
+    """
+    Di dalam proses worker: mengembalikan TT milik proses ini. Tugas dari
+    pencarian paralel yang sama berbagi generasi; pencarian berikutnya
+    memulai generasi baru (aging) alih-alih mengosongkan tabel.
+    """
+    global _worker_tt, _worker_search
+    if (_worker_tt is None or _worker_tt.max_entries != options['tt_size']
+            or _worker_tt.replacement != options['tt_replacement']):
+        _worker_tt = TranspositionTable(options['tt_size'], options['tt_replacement'])
+    elif search_id != _worker_search:
+        _worker_tt.new_generation()
+    _worker_search = search_id
+    return _worker_tt
+
+def _search_root_move(game, col, depth, alpha_hint, options, search_id):
+    """
+    Dijalankan di proses worker: mencari subtree satu langkah akar.
+
+    Window yang dipakai adalah (alpha - 1, inf) dengan alpha = nilai terbesar
+    antara `alpha_hint` dan alpha bersama. Karena skor berupa bilangan bulat,
+    langkah yang nilainya >= alpha tetap mendapat skor pasti, sehingga hasil
+    akhirnya (termasuk tie-break) sama dengan pencarian serial.
+
+    Returns:
+        tuple: (col, skor, penghitung SearchContext worker) agar proses utama
+        bisa menggabungkan rincian node semua worker.
+    """
+    ctx = SearchContext()
+    alpha = alpha_hint
+    if _shared_alpha is not None:
+        alpha = max(alpha, _shared_alpha.value)
+    window_alpha = alpha - 1 if alpha > _NO_ALPHA else -inf
+
+    tt = _worker_table(options, search_id) if options['use_tt'] else None
+    orderer = MoveOrderer(geometry=game.geometry) if options['move_ordering'] else None
+    row = game.play(col, AI_PIECE)
+    score = search_position(game, depth - 1, window_alpha, inf, False, (row, col, AI_PIECE), tt,
+                            orderer=orderer, batch_leaves=options['batch_leaves'], search=options['search'],
+                            symmetry=options['symmetry'], tactics=options['tactics'], ctx=ctx)[1]
+    game.undo()
+
+    if _shared_alpha is not None and score > window_alpha:
+        with _shared_alpha.get_lock():
+            if score > _shared_alpha.value:
+                _shared_alpha.value = score
+    return col, score, ctx.counters()
+
+def parallel_root_search(game, depth, workers, tt=None, orderer=None, batch_leaves=False, options=None,
+                         search=DEFAULT_SEARCH, symmetry=False, tactics=False, ctx=None):
+    """
+    Membagi langkah-langkah di akar ke beberapa proses (skema "young brothers
+    wait"): langkah pertama dicari lebih dulu di proses utama untuk mendapat
+    alpha awal, lalu sisa langkah dicari paralel di ProcessPoolExecutor.
+    Alpha dari subtree yang sudah selesai dibagikan lewat alpha bersama.
+
+    Hasilnya adalah langkah yang sama dengan pencarian serial: langkah pertama
+    (dalam urutan pencarian) yang memiliki skor tertinggi.
+
+    Returns:
+        tuple: (kolom terbaik, skor).
+    """
+    if ctx is None:
+        ctx = SearchContext()
+    moves = game.get_valid_locations()
+    if orderer is not None:
+        moves = orderer.order_moves(moves, len(game.move_history), AI_PIECE)
+    if is_mirror_position(game, symmetry):
+        moves = drop_mirror_moves(moves, game.geometry)
+    if workers <= 1 or len(moves) <= 1 or get_terminal_status(game) is not None:
+        return search_position(game, depth, -inf, inf, True, tt=tt, orderer=orderer, batch_leaves=batch_leaves,
+                               search=search, symmetry=symmetry, tactics=tactics, ctx=ctx)
+
+    # Langkah pertama ("eldest brother") dicari secara serial
+    first_col = moves[0]
+    row = game.play(first_col, AI_PIECE)
+    first_score = search_position(game, depth - 1, -inf, inf, False, (row, first_col, AI_PIECE), tt,
+                                  orderer=orderer, batch_leaves=batch_leaves, search=search,
+                                  symmetry=symmetry, tactics=tactics, ctx=ctx)[1]
+    game.undo()
+    results = {first_col: first_score}
+
+    from concurrent.futures import as_completed, wait # Sudah dimuat oleh _get_process_pool
+    executor, shared_alpha, pool_lock = _get_process_pool(workers)
+    with pool_lock:
+        shared_alpha.value = first_score
+        search_id = next(_parallel_searches)
+        futures = [executor.submit(_search_root_move, game, col, depth, first_score, options, search_id)
+                   for col in moves[1:]]
+        for future in as_completed(futures):
+            if ctx.cancelled:
+                # Subtree yang sudah berjalan ditunggu selesai agar tidak menulis
+                # alpha bersama milik pencarian berikutnya
+                for pending in futures:
+                    pending.cancel()
+                wait(futures)
+                raise SearchCancelled()
+            col, score, counters = future.result()
+            results[col] = score
+            ctx.merge(counters)
+
+    # Ambil langkah pertama (sesuai urutan) dengan skor tertinggi
+    best_col = moves[0]
+    for col in moves[1:]:
+        if results[col] > results[best_col]:
+            best_col = col
+    return best_col, results[best_col]
+
+def _silent(*args, **kwargs):
+    """
+    Pengganti print ketika get_best_move dipanggil dengan verbose=False.
+    """
+    pass
+
+def _cancelled_search(memory_meter, log):
+    """
+    Mengakhiri get_best_move yang dibatalkan tanpa menyentuh analyzer.
+    """
+    memory_meter.stop()
+    log("[AI] Pencarian dibatalkan.")
+    return None
+
+def get_best_move(game, analyzer, depth=DEFAULT_DEPTH, backend=DEFAULT_BACKEND,
+                  use_tt=True, tt_size=DEFAULT_TT_SIZE, tt_replacement='depth',
+                  time_limit_ms=None, move_ordering=True, incremental_eval=True, batch_leaves=False,
+                  workers=1, search=DEFAULT_SEARCH, symmetry=True, opening_book=True,
+                  endgame_threshold=DEFAULT_ENDGAME_THRESHOLD, tactics=True, track_memory=False, ctx=None,
+                  verbose=True, engine=None, ponder=False):
     """
     Fungsi utama untuk mendapatkan langkah terbaik dari AI.
     Ini adalah jembatan antara UI dan algoritma Minimax dengan Alpha-Beta Pruning.
+
+    Args:
+        backend (str): 'bitboard' untuk mencari pada salinan BitboardGame,
+            atau 'numpy' untuk mencari pada salinan Connect4Game.
+        use_tt (bool): Gunakan Transposition Table selama pencarian.
+        tt_size (int): Jumlah entri maksimum Transposition Table.
+        tt_replacement (str): Kebijakan penggantian entri ('depth' atau 'always').
+        time_limit_ms (float or None): Jika diisi, gunakan iterative deepening
+            dengan batas waktu ini dan abaikan `depth`; langkah yang dikembalikan
+            berasal dari depth terakhir yang selesai dicari.
+        move_ordering (bool or MoveOrderer): True untuk MoveOrderer default
+            (tengah, hash move, killer, history), False untuk urutan kiri ke
+            kanan, atau objek MoveOrderer dengan konfigurasi sendiri.
+        incremental_eval (bool): Pasang IncrementalEvaluator pada papan
+            pencarian sehingga evaluasi daun tidak perlu memindai seluruh papan.
+        batch_leaves (bool): Evaluasi anak-anak node frontier sekaligus dengan
+            score_positions (NumPy) alih-alih satu per satu.
+        workers (int): Jumlah proses untuk pencarian paralel di akar (hanya
+            untuk pencarian depth tetap). 1 berarti pencarian serial biasa.
+        search (str): Mode pencarian, 'minimax' atau 'pvs' (lihat SEARCH_MODES).
+            Kedua mode memilih langkah yang sama.
+        symmetry (bool): Manfaatkan simetri kiri-kanan: posisi dan cerminannya
+            berbagi entri Transposition Table, dan pada papan simetris langkah
+            cerminan hanya dicari sekali. Langkah yang dipilih tetap sama.
+            Tidak berpengaruh jika evaluasi geometri papan tidak simetris
+            (lihat BoardGeometry.mirror_symmetric).
+        opening_book (bool, str, or OpeningBook): Cek opening book sebelum
+            mencari. True memakai file default (DEFAULT_BOOK_PATH) jika ada,
+            str adalah lokasi file book lain, False menonaktifkan book. Book
+            hanya dipakai jika depth pencariannya minimal sama dengan `depth`
+            (atau jika pencarian dibatasi waktu).
+        endgame_threshold (int or None): Jika jumlah slot kosong kurang dari
+            batas ini, posisi diselesaikan secara eksak oleh solver endgame
+            (lihat endgame.py) tanpa heuristik. None atau 0 menonaktifkannya.
+        tactics (bool): Pakai lapisan taktis: langkah yang sudah pasti
+            (kemenangan langsung, blok wajib, atau satu-satunya langkah)
+            langsung dikembalikan tanpa mencari, dan di dalam pohon langkah
+            yang langsung kalah tidak dicari.
+        track_memory (bool or None): True: ukur memori puncak yang
+            sebenarnya dengan tracemalloc (analyzer.memory_usage_mb).
+            Pelacakan tracemalloc memperlambat pencarian sekitar sepuluh
+            kali lipat, jadi hanya cocok untuk analisis, bukan permainan
+            biasa. False: hanya catat pertumbuhan RSS proses
+            (analyzer.rss_growth_mb), yang murah tetapi bukan memori
+            puncak. None: memori tidak diukur (psutil tidak perlu diimpor).
+        ctx (SearchContext or None): Konteks pencarian (penghitung, batas,
+            pembatalan, callback instrumentasi). Default: konteks baru, jadi
+            beberapa pencarian bisa berjalan bersamaan di thread berbeda.
+            Jika ctx.cancel() dipanggil dari thread lain, pencarian berhenti
+            secepatnya dan fungsi ini mengembalikan None tanpa mengubah analyzer.
+
+        verbose (bool): Cetak ringkasan "[AI] ..." ke stdout. Matikan untuk
+            pencarian latar belakang atau pemanggil yang memakai stdout sendiri.
+        engine (EngineState or None): Data pencarian yang dipakai ulang antar
+            langkah dalam satu permainan (Transposition Table, MoveOrderer,
+            dan principal variation). Jika diisi, `tt_size` dan
+            `tt_replacement` diabaikan karena tabel milik engine yang dipakai.
+            Geometri papan engine harus sama dengan geometri `game`.
+        ponder (bool): Pencarian pondering (lihat ponder.py). Beberapa
+            pencarian pondering berturut-turut berbagi satu generasi TT
+            engine agar tidak menuakan entri milik pencarian sebenarnya.
+
+    Returns:
+        int or None: Kolom terbaik, atau None jika pencarian dibatalkan.
     """
-    global nodes_evaluated_counter
-    nodes_evaluated_counter = 0 # Reset counter setiap kali AI berpikir
+    if search not in SEARCH_MODES:
+        raise ValueError(f"Mode pencarian tidak dikenal: {search!r}")
+    if engine is not None and engine.geometry is not game.geometry:
+        raise ValueError(f"EngineState dibuat untuk {engine.geometry}, bukan {game.geometry}")
+    if ctx is None:
+        ctx = SearchContext()
+    ctx.reset() # Reset counter setiap kali AI berpikir
+    log = print if verbose else _silent
+    if ctx.cancelled:
+        return None
     
-    process = psutil.Process(os.getpid())
-    mem_before = process.memory_info().rss
+    memory_meter = PeakMemoryMeter(track_memory)
     
     start_time = time.time()
     
-    # Panggil minimax dengan alpha-beta pruning
-    col, minimax_score = minimax_alpha_beta(game, depth, -inf, inf, True)
+    # Pencarian dilakukan in-place (play/undo) pada salinan, sehingga papan
+    # milik pemanggil (misalnya UI) tidak pernah berubah selama AI berpikir.
+    if backend == 'bitboard' and not isinstance(game, BitboardGame):
+        search_game = BitboardGame.from_game(game)
+    else:
+        search_game = game.copy()
+
+    # Posisi awal yang ada di opening book tidak perlu dicari sama sekali
+    if opening_book is True:
+        book = load_book(DEFAULT_BOOK_PATH)
+    elif isinstance(opening_book, str):
+        book = load_book(opening_book)
+    elif isinstance(opening_book, OpeningBook):
+        book = opening_book
+    else:
+        book = None
+    if book is not None and (time_limit_ms is not None or book.depth >= depth):
+        book_move = book.lookup(search_game)
+        if book_move is not None:
+            if ctx.cancelled:
+                return _cancelled_search(memory_meter, log)
+            col, book_score = book_move
+            execution_time_ms = (time.time() - start_time) * 1000
+            analyzer.set_metrics(execution_time_ms, 0, book.depth)
+            analyzer.set_memory_metrics(memory_meter.source, memory_meter.stop())
+            analyzer.set_tt_metrics(0, 0, 0)
+            analyzer.set_cutoff_metrics(0, 0)
+            analyzer.set_ply_metrics([], [], 0)
+            analyzer.record_move(col, book_score, 'book')
+            log(f"[AI] Memilih kolom {col} dari opening book dengan skor: {book_score}")
+            log(f"[AI] Opening book dibaca dalam {execution_time_ms:.3f} ms (Depth book: {book.depth}).")
+            return col
+
+    # Langkah yang sudah dipaksa oleh taktik tidak perlu dicari
+    if tactics and get_terminal_status(search_game) is None:
+        winning, blocking, _ = tactical_moves(search_game, AI_PIECE)
+        valid_locations = search_game.get_valid_locations()
+        if winning:
+            forced_col, reason = winning[0], "kemenangan langsung"
+        elif blocking:
+            forced_col, reason = blocking[0], "blok wajib"
+        elif len(valid_locations) == 1:
+            forced_col, reason = valid_locations[0], "satu-satunya langkah"
+        else:
+            forced_col = None
+        if forced_col is not None:
+            if ctx.cancelled:
+                return _cancelled_search(memory_meter, log)
+            execution_time_ms = (time.time() - start_time) * 1000
+            analyzer.set_metrics(execution_time_ms, 0, 1) # Taktik hanya melihat 1 langkah ke depan
+            analyzer.set_memory_metrics(memory_meter.source, memory_meter.stop())
+            analyzer.set_tt_metrics(0, 0, 0)
+            analyzer.set_cutoff_metrics(0, 0)
+            analyzer.set_ply_metrics([], [], 0)
+            analyzer.record_move(forced_col, None, 'tactics')
+            log(f"[AI] Memilih kolom {forced_col} karena langkah taktis paksa ({reason}).")
+            log(f"[AI] Taktik diperiksa dalam {execution_time_ms:.3f} ms.")
+            return forced_col
+
+    # Sisa pohon cukup kecil: selesaikan secara eksak tanpa heuristik
+    empty_cells = search_game.geometry.cell_count - sum(search_game.heights)
+    if endgame_threshold and empty_cells < endgame_threshold and get_terminal_status(search_game) is None:
+        solver = EndgameSolver()
+        col, exact_score, solver_nodes = solve_endgame(search_game, AI_PIECE, solver)
+        if ctx.cancelled:
+            return _cancelled_search(memory_meter, log)
+        execution_time_ms = (time.time() - start_time) * 1000
+        analyzer.set_metrics(execution_time_ms, solver_nodes, empty_cells)
+        analyzer.set_memory_metrics(memory_meter.source, memory_meter.stop())
+        analyzer.set_tt_metrics(solver.tt.probes, solver.tt.hits, 0)
+        analyzer.set_cutoff_metrics(0, 0)
+        analyzer.set_ply_metrics([], [], 0) # Solver memakai penghitung node sendiri
+        analyzer.record_move(col, exact_score, 'endgame')
+        log(f"[AI] Memilih kolom {col} dari solver endgame dengan skor pasti: {exact_score}")
+        log(f"[AI] Solver selesai dalam {execution_time_ms:.2f} ms, {solver_nodes} node dievaluasi ({empty_cells} slot kosong).")
+        return col
+
+    if incremental_eval:
+        board = search_game.to_rows() if isinstance(search_game, BitboardGame) else search_game.board
+        search_game.attach_evaluator(IncrementalEvaluator(board, search_game.geometry))
+    else:
+        search_game.attach_evaluator(None)
+
+    preferred_move = None
+    if engine is not None:
+        # Pakai ulang data pencarian langkah sebelumnya setelah dituakan
+        engine.new_search(search_game, ponder)
+        tt = engine.tt if use_tt else None
+        preferred_move = engine.preferred_move(search_game)
+    else:
+        tt = TranspositionTable(tt_size, tt_replacement) if use_tt else None
+    if move_ordering is True:
+        orderer = engine.orderer if engine is not None else MoveOrderer(geometry=search_game.geometry)
+    elif move_ordering is False:
+        orderer = None
+    else:
+        orderer = move_ordering
+
+    try:
+        if time_limit_ms is None and workers > 1:
+            options = {'use_tt': use_tt, 'tt_size': tt_size, 'tt_replacement': tt_replacement,
+                       'move_ordering': orderer is not None, 'batch_leaves': batch_leaves, 'search': search,
+                       'symmetry': symmetry, 'tactics': tactics}
+            col, minimax_score = parallel_root_search(search_game, depth, workers, tt=tt, orderer=orderer,
+                                                      batch_leaves=batch_leaves, options=options, search=search,
+                                                      symmetry=symmetry, tactics=tactics, ctx=ctx)
+        elif time_limit_ms is None:
+            # Panggil minimax (atau negamax PVS) dengan alpha-beta pruning
+            col, minimax_score = search_position(search_game, depth, -inf, inf, True, tt=tt,
+                                                 preferred_move=preferred_move, orderer=orderer,
+                                                 batch_leaves=batch_leaves, search=search, symmetry=symmetry,
+                                                 tactics=tactics, ctx=ctx)
+        else:
+            col, minimax_score, depth = iterative_deepening(search_game, time_limit_ms, tt=tt,
+                                                            start_time=start_time, orderer=orderer,
+                                                            batch_leaves=batch_leaves, search=search,
+                                                            symmetry=symmetry, tactics=tactics, ctx=ctx,
+                                                            preferred_move=preferred_move)
+    except SearchCancelled:
+        col = None
+    except SearchTimeout:
+        # Deadline milik pemanggil (ctx.deadline) habis: diteruskan ke pemanggil
+        memory_meter.stop()
+        raise
+    # Iterative deepening menangkap pembatalan sendiri, jadi cek juga status ctx
+    if col is None or ctx.cancelled:
+        return _cancelled_search(memory_meter, log)
     
     end_time = time.time()
     
-    mem_after = process.memory_info().rss
-    peak_memory_mb = (mem_after - mem_before) / (1024 * 1024)
+    memory_mb = memory_meter.stop()
 
     execution_time_ms = (end_time - start_time) * 1000
     
     # Simpan metrik performa menggunakan analyzer
-    analyzer.set_metrics(execution_time_ms, nodes_evaluated_counter, depth, peak_memory_mb)
+    analyzer.set_metrics(execution_time_ms, ctx.nodes, depth)
+    analyzer.set_memory_metrics(memory_meter.source, memory_mb)
+    if tt is not None:
+        analyzer.set_tt_metrics(tt.probes, tt.hits, tt.cutoffs)
+    else:
+        analyzer.set_tt_metrics(0, 0, 0)
+    if orderer is not None:
+        analyzer.set_cutoff_metrics(orderer.cutoffs, orderer.first_move_cutoffs)
+    else:
+        analyzer.set_cutoff_metrics(0, 0)
+    if engine is not None and tt is not None:
+        engine.record_pv(search_game, extract_pv(search_game, tt, MAX_PV_LENGTH, symmetry))
+    ply_nodes, ply_cutoffs = ctx.ply_metrics(len(search_game.move_history))
+    analyzer.set_ply_metrics(ply_nodes, ply_cutoffs, ctx.leaf_nodes)
+    analyzer.record_move(col, minimax_score)
     
-    print(f"[AI] Memilih kolom {col} dengan skor: {minimax_score}")
-    print(f"[AI] Analisis selesai dalam {execution_time_ms:.2f} ms, {nodes_evaluated_counter} node dievaluasi, memori puncak: {peak_memory_mb:.2f} MB (Depth: {depth}).")
+    log(f"[AI] Memilih kolom {col} dengan skor: {minimax_score}")
+    log(f"[AI] Analisis selesai dalam {execution_time_ms:.2f} ms, {ctx.nodes} node dievaluasi, {analyzer.get_memory_string()} (Depth: {depth}).")
     
     return col
@@ -0,0 +1,141 @@
+# src/move_ordering.py
+
+"""
+Modul ini berisi tahap pengurutan langkah (move ordering) untuk Minimax.
+
+Alpha-Beta Pruning memotong paling banyak cabang jika langkah terbaik dicoba
+lebih dulu. Kelas `MoveOrderer` menggabungkan beberapa heuristik murah untuk
+menebak urutan tersebut:
+
+1.  Center-first: kolom tengah dicoba lebih dulu, lalu bergerak ke tepi.
+    Kolom tengah ikut dalam paling banyak garis kemenangan.
+2.  Hash move: langkah terbaik yang tersimpan di Transposition Table.
+3.  Killer moves: langkah yang baru-baru ini menyebabkan cutoff pada ply yang
+    sama. Langkah yang bagus di satu cabang sering bagus juga di cabang saudaranya.
+4.  History heuristic: skor per (pemain, kolom) yang bertambah setiap kali
+    kolom tersebut menyebabkan cutoff, dengan bobot depth^2.
+
+Setiap heuristik bisa dinyalakan atau dimatikan sendiri-sendiri.
+"""
+
+from .game_logic import PLAYER_PIECE, AI_PIECE, DEFAULT_GEOMETRY
+
+# Urutan kolom dari tengah ke tepi pada papan default: [3, 2, 4, 1, 5, 0, 6]
+CENTER_ORDER = list(DEFAULT_GEOMETRY.center_order)
+
+# Jumlah killer move yang disimpan untuk setiap ply
+KILLER_SLOTS = 2
+
+
+class MoveOrderer:
+    """
+    Mengurutkan langkah-langkah yang valid pada sebuah node dan mencatat
+    langkah yang menyebabkan cutoff.
+    """
+    def __init__(self, center_first=True, use_hash_move=True, use_killers=True, use_history=True,
+                 geometry=DEFAULT_GEOMETRY):
+        """
+        Args:
+            center_first (bool): Urutkan kolom dari tengah ke tepi.
+            use_hash_move (bool): Dahulukan langkah terbaik dari Transposition Table.
+            use_killers (bool): Dahulukan killer move pada ply yang sama.
+            use_history (bool): Urutkan berdasarkan tabel history.
+            geometry (BoardGeometry): Geometri papan yang dicari (ukuran tabel
+                killer dan history, serta urutan kolom dari tengah).
+        """
+        self.geometry = geometry
+        self.center_first = center_first
+        self.use_hash_move = use_hash_move
+        self.use_killers = use_killers
+        self.use_history = use_history
+        self.reset()
+
+    def reset(self):
+        """
+        Mengosongkan killer move, tabel history, dan statistik cutoff.
+        """
+        # Ply paling banyak adalah jumlah slot papan
+        columns = self.geometry.columns
+        self.killers = [[None] * KILLER_SLOTS for _ in range(self.geometry.cell_count + 1)]
+        self.history = {PLAYER_PIECE: [0] * columns, AI_PIECE: [0] * columns}
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Mereset statistik cutoff tanpa menghapus killer move dan tabel history.
+        """
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def age(self, plies):
+        """
+        Menyiapkan orderer untuk pencarian berikutnya dalam permainan yang sama.
+
+        Nilai history dibagi dua sehingga cutoff lama tetap berpengaruh tetapi
+        perlahan digantikan yang baru. Killer move digeser `plies` ply karena
+        indeks ply relatif terhadap akar pencarian; jika `plies` tidak masuk
+        akal (misalnya negatif), killer move dihapus.
+
+        Args:
+            plies (int): Selisih indeks ply akar pencarian baru terhadap yang lama.
+        """
+        for piece in self.history:
+            self.history[piece] = [value // 2 for value in self.history[piece]]
+        slots = len(self.killers)
+        if 0 <= plies < slots:
+            self.killers = self.killers[plies:] + [[None] * KILLER_SLOTS for _ in range(plies)]
+        else:
+            self.killers = [[None] * KILLER_SLOTS for _ in range(slots)]
+        self.reset_stats()
+
+    def order_moves(self, moves, ply, piece, hash_move=None):
+        """
+        Mengembalikan list baru berisi `moves` dalam urutan yang akan dicoba.
+
+        Args:
+            moves (list): Kolom-kolom yang valid.
+            ply (int): Jumlah bidak di papan (dipakai sebagai indeks killer move).
+            piece (int): Bidak pemain yang akan melangkah.
+            hash_move (int or None): Langkah terbaik dari Transposition Table.
+        """
+        if self.center_first:
+            ordered = [col for col in self.geometry.center_order if col in moves]
+        else:
+            ordered = list(moves)
+
+        if self.use_history:
+            history = self.history[piece]
+            ordered.sort(key=lambda col: -history[col]) # sort stabil, urutan tengah tetap jadi tie-break
+
+        front = []
+        if self.use_hash_move and hash_move is not None and hash_move in ordered:
+            front.append(hash_move)
+        if self.use_killers:
+            for killer in self.killers[ply]:
+                if killer is not None and killer in ordered and killer not in front:
+                    front.append(killer)
+        if front:
+            ordered = front + [col for col in ordered if col not in front]
+        return ordered
+
+    def record_cutoff(self, col, ply, depth, piece, move_index):
+        """
+        Mencatat langkah yang menyebabkan beta cutoff.
+
+        Args:
+            col (int): Kolom yang menyebabkan cutoff.
+            ply (int): Ply tempat cutoff terjadi.
+            depth (int): Sisa kedalaman pencarian di node tersebut.
+            piece (int): Bidak pemain yang melangkah.
+            move_index (int): Urutan langkah tersebut di antara saudaranya (0 = pertama).
+        """
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+        if self.use_killers:
+            killers = self.killers[ply]
+            if killers[0] != col:
+                killers[1:] = killers[:-1]
+                killers[0] = col
+        if self.use_history:
+            self.history[piece][col] += depth * depth
@@ -0,0 +1,173 @@
+# src/opening_book.py
+
+"""
+Modul ini berisi opening book: tabel langkah terbaik untuk posisi-posisi awal
+permainan yang sudah dihitung sebelumnya (offline) dengan pencarian dalam.
+
+Posisi awal muncul di setiap permainan, sehingga tidak ada gunanya mencarinya
+ulang setiap kali. File book dibuat oleh skrip `book_generator.py` dan dibaca
+saat runtime melalui memory map (mmap): file tidak dimuat ke RAM, cukup
+beberapa halaman yang disentuh oleh binary search.
+
+Format file (little-endian):
+- Header (BOOK_HEADER): magic b'C4OB', versi, depth pencarian, ply maksimum,
+  dan jumlah entri.
+- Entri (BOOK_RECORD), terurut berdasarkan key: (key, best_move, score).
+  `key` adalah hash kanonik posisi (lihat Connect4Game.canonical_hash) dengan
+  AI sebagai pemain yang akan melangkah, `best_move` dalam orientasi kanonik,
+  dan `score` dari sudut pandang AI.
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+from .game_logic import PLAYER_PIECE, AI_PIECE, COLUMN_COUNT, DEFAULT_GEOMETRY, mirror_column
+from .bitboard import BitboardGame
+
+BOOK_MAGIC = b'C4OB'
+BOOK_VERSION = 1
+BOOK_HEADER = struct.Struct('<4sHBBI')
+BOOK_RECORD = struct.Struct('<QBi')
+
+# Lokasi default file book: di root proyek, di samping book_generator.py
+DEFAULT_BOOK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'opening_book.bin'))
+
+
+def enumerate_book_positions(max_ply):
+    """
+    Menghasilkan semua posisi unik (tanpa cerminan) dengan 0..max_ply bidak
+    di mana AI adalah pemain yang akan melangkah. Untuk jumlah bidak genap AI
+    yang memulai permainan, untuk jumlah ganjil Player yang memulai. Posisi
+    yang sudah berakhir (menang/seri) dilewati.
+
+    Returns:
+        list: Urutan kolom (list of int) untuk mencapai setiap posisi.
+    """
+    positions = []
+    seen = set()
+
+    def visit(game, moves, piece, target_ply):
+        if len(moves) == target_ply:
+            key = game.canonical_hash()[0]
+            if key not in seen:
+                seen.add(key)
+                positions.append(list(moves))
+            return
+        for col in game.get_valid_locations():
+            row = game.play(col, piece)
+            if game.winning_move_at(row, col, piece) is None:
+                moves.append(col)
+                visit(game, moves, AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE, target_ply)
+                moves.pop()
+            game.undo()
+
+    for ply in range(max_ply + 1):
+        first_piece = AI_PIECE if ply % 2 == 0 else PLAYER_PIECE
+        visit(BitboardGame(), [], first_piece, ply)
+    return positions
+
+
+def write_book(path, entries, depth, max_ply):
+    """
+    Menulis entri (key, best_move, score) ke file book, terurut berdasarkan key.
+    """
+    entries = sorted(entries)
+    with open(path, 'wb') as f:
+        f.write(BOOK_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, depth, max_ply, len(entries)))
+        for key, best_move, score in entries:
+            f.write(BOOK_RECORD.pack(key, best_move, score))
+
+
+class OpeningBook:
+    """
+    Pembaca file opening book berbasis memory map dan binary search.
+    """
+    def __init__(self, path=DEFAULT_BOOK_PATH):
+        """
+        Args:
+            path (str): Lokasi file book yang dibuat oleh book_generator.py.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < BOOK_HEADER.size:
+            raise ValueError(f"File book terlalu kecil: {path}")
+        magic, version, self.depth, self.max_ply, self.size = BOOK_HEADER.unpack_from(self._mmap, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            raise ValueError(f"Format file book tidak dikenal: {path}")
+        if len(self._mmap) < BOOK_HEADER.size + self.size * BOOK_RECORD.size:
+            raise ValueError(f"File book terpotong: {path}")
+
+    def _key_at(self, index):
+        return struct.unpack_from('<Q', self._mmap, BOOK_HEADER.size + index * BOOK_RECORD.size)[0]
+
+    def probe_key(self, key):
+        """
+        Mencari entri dengan `key` menggunakan binary search.
+
+        Returns:
+            tuple or None: (best_move, score) dalam orientasi kanonik, atau None.
+        """
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.size and self._key_at(lo) == key:
+            _, best_move, score = BOOK_RECORD.unpack_from(self._mmap, BOOK_HEADER.size + lo * BOOK_RECORD.size)
+            return best_move, score
+        return None
+
+    def lookup(self, game):
+        """
+        Mencari langkah terbaik untuk posisi `game` (AI yang akan melangkah).
+        Posisi yang merupakan cerminan dari entri book juga ditemukan.
+
+        Returns:
+            tuple or None: (kolom, skor) atau None jika posisi tidak ada di book.
+        """
+        # Book hanya berisi posisi papan default
+        if game.geometry is not DEFAULT_GEOMETRY or sum(game.heights) > self.max_ply:
+            return None
+        key, mirrored = game.canonical_hash()
+        result = self.probe_key(key)
+        if result is None:
+            return None
+        best_move, score = result
+        if mirrored:
+            best_move = mirror_column(best_move)
+        if not 0 <= best_move < COLUMN_COUNT or not game.is_valid_location(best_move):
+            return None
+        return best_move, score
+
+    def close(self):
+        """
+        Menutup memory map.
+        """
+        self._mmap.close()
+
+    def __len__(self):
+        return self.size
+
+
+# Book yang sudah dibuka, per path, agar file hanya di-mmap sekali per proses.
+# Lock mencegah dua pencarian di thread berbeda membuka file yang sama dua kali.
+_open_books = {}
+_open_books_lock = threading.Lock()
+
+def load_book(path=DEFAULT_BOOK_PATH):
+    """
+    Mengembalikan OpeningBook untuk `path`, atau None jika file tidak ada
+    atau tidak valid. Hasilnya di-cache per path.
+    """
+    with _open_books_lock:
+        if path not in _open_books:
+            try:
+                _open_books[path] = OpeningBook(path)
+            except (OSError, ValueError):
+                _open_books[path] = None
+        return _open_books[path]
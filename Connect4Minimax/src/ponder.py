@@ -0,0 +1,155 @@
+# src/ponder.py
+
+"""
+Modul ini berisi kelas `Ponderer`, yaitu pencarian di latar belakang selama
+giliran manusia (pondering).
+
+Setelah AI melangkah, waktu berpikir manusia biasanya terbuang. Ponderer
+memakai waktu tersebut untuk mencari jawaban AI atas balasan-balasan manusia
+yang paling mungkin:
+1. Balasan manusia diurutkan: balasan terbaik menurut pencarian dangkal
+   dari sudut pandang manusia lebih dulu, lalu sisanya dari tengah ke tepi.
+2. Untuk setiap balasan, get_best_move dijalankan dengan opsi yang sama
+   persis dengan langkah AI sebenarnya, lalu hasilnya disimpan. Karena
+   ponder=True, semua pencarian ini berbagi satu generasi TT milik
+   EngineState.
+3. Ketika manusia melangkah, pondering dihentikan. Jika balasan tersebut
+   sudah selesai dicari dengan opsi yang sama, AI langsung menjawab dari
+   hasil pondering tanpa mencari lagi. Jika balasan tersebut sedang dicari,
+   pencarian itu dibiarkan selesai; pencarian balasan lain dibatalkan.
+   Karena itu `take` bisa menunggu lama dan harus dipanggil dari thread
+   pencarian AI, bukan dari thread UI.
+
+Semua pencarian pondering memakai satu SearchContext sehingga bisa
+dibatalkan kapan saja dari thread UI.
+"""
+
+import threading
+from math import inf
+
+from .game_logic import PLAYER_PIECE
+from .bitboard import BitboardGame
+from .minimax import get_best_move, search_position
+from .analyzer import PerformanceAnalyzer
+from .search_context import SearchContext, SearchCancelled
+
+# Depth pencarian dangkal untuk menebak balasan manusia yang paling mungkin
+PREDICT_DEPTH = 4
+
+
+def predict_replies(game, depth=PREDICT_DEPTH, ctx=None):
+    """
+    Mengurutkan balasan manusia dari yang paling mungkin.
+
+    Returns:
+        list: Kolom valid, dengan balasan terbaik untuk manusia di depan.
+    """
+    replies = [col for col in game.geometry.center_order if game.is_valid_location(col)]
+    if len(replies) > 1:
+        search_game = BitboardGame.from_game(game)
+        best = search_position(search_game, depth, -inf, inf, False, ctx=ctx)[0]
+        if best in replies:
+            replies.remove(best)
+            replies.insert(0, best)
+    return replies
+
+
+class Ponderer:
+    """
+    Menjalankan pondering di thread latar belakang dan menyimpan hasilnya
+    per balasan manusia.
+    """
+    def __init__(self):
+        self._thread = None
+        self._ctx = None
+        self._options = None
+        self._results = {} # kolom balasan manusia -> (kolom AI, analyzer)
+        self._current_reply = None # Balasan yang sedang dicari
+        self._finish_current = threading.Event() # Selesaikan balasan saat ini lalu berhenti
+        self._lock = threading.Lock()
+
+    def start(self, game, options):
+        """
+        Mulai pondering pada salinan `game` (giliran manusia).
+
+        Args:
+            game (Connect4Game): Posisi saat ini.
+            options (dict): Argumen get_best_move yang akan dipakai AI.
+        """
+        self.stop()
+        self._ctx = SearchContext()
+        self._options = dict(options)
+        self._results = {}
+        self._current_reply = None
+        self._finish_current = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(game.copy(), self._ctx, self._options),
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Membatalkan pondering yang sedang berjalan dan menunggu thread-nya selesai.
+        """
+        if self._ctx is not None:
+            self._ctx.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def take(self, col, options):
+        """
+        Menghentikan pondering lalu mengambil hasil untuk balasan `col`.
+        Jika balasan ini sedang dicari dengan `options` yang sama, pencarian
+        tersebut ditunggu sampai selesai alih-alih dibatalkan, jadi jangan
+        panggil fungsi ini dari thread UI.
+
+        Returns:
+            tuple or None: (kolom AI, analyzer pencarian tersebut) jika balasan
+            ini sudah selesai dicari dengan `options` yang sama, selain itu None.
+        """
+        same_options = self._options == dict(options)
+        thread = self._thread # stop() dari thread lain bisa mengosongkan self._thread
+        with self._lock:
+            finishing = same_options and self._current_reply == col and col not in self._results
+            if finishing:
+                self._finish_current.set()
+        if finishing and thread is not None:
+            thread.join()
+        self.stop()
+        with self._lock:
+            result = self._results.get(col) if same_options else None
+            self._results = {}
+        return result
+
+    def _run(self, game, ctx, options):
+        """
+        Isi thread pondering: mencari jawaban AI untuk setiap balasan manusia.
+        """
+        try:
+            replies = predict_replies(game, ctx=ctx)
+        except SearchCancelled:
+            return
+        for reply in replies:
+            with self._lock:
+                if ctx.cancelled or self._finish_current.is_set():
+                    return
+                self._current_reply = reply
+            position = game.copy()
+            row = position.get_next_open_row(reply)
+            position.drop_piece(row, reply, PLAYER_PIECE)
+            if position.winning_move_at(row, reply, PLAYER_PIECE) or position.is_board_full():
+                continue # Permainan selesai, AI tidak perlu menjawab
+            analyzer = PerformanceAnalyzer()
+            move = get_best_move(position, analyzer, ctx=ctx, verbose=False, ponder=True, **options)
+            if move is None:
+                return # Dibatalkan
+            with self._lock:
+                self._results[reply] = (move, analyzer)
+                self._current_reply = None
+
+    def pondered_replies(self):
+        """
+        Balasan manusia yang jawabannya sudah selesai dicari.
+        """
+        with self._lock:
+            return list(self._results)
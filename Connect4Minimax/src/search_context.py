@@ -0,0 +1,136 @@
+# src/search_context.py
+
+"""
+Modul ini berisi kelas `SearchContext`, yaitu semua keadaan milik satu
+pencarian yang dibawa turun ke seluruh rekursi Minimax.
+
+Sebelumnya penghitung node dan batas waktu disimpan di variabel global
+modul minimax, sehingga dua pencarian yang berjalan bersamaan dalam satu
+proses (misalnya dua permainan yang dilayani dari thread berbeda) saling
+merusak metriknya. Dengan SearchContext setiap pencarian memiliki:
+
+1. Penghitung: jumlah node, jumlah daun, node dan cutoff per ply.
+2. Batas: batas waktu (deadline) dan batas jumlah node.
+3. Pembatalan: sebuah threading.Event yang bisa di-set dari thread lain.
+4. Instrumentasi opsional: callback `on_node` dan `on_cutoff`. Jika tidak
+   diisi, yang dibayar per node hanya satu pengecekan None.
+
+Batas dan pembatalan hanya diperiksa setiap TIME_CHECK_INTERVAL node agar murah.
+"""
+
+import threading
+import time
+
+from .geometry import MAX_ROWS, MAX_COLUMNS
+
+# Batas waktu dan pembatalan hanya diperiksa setiap sekian node
+TIME_CHECK_INTERVAL = 512
+
+# Jumlah ply maksimum dalam satu permainan pada papan terbesar yang didukung
+# (+1 untuk posisi akar kosong)
+MAX_PLY = MAX_ROWS * MAX_COLUMNS + 1
+
+
+class SearchTimeout(Exception):
+    """
+    Dilempar dari dalam rekursi ketika batas waktu pencarian terlampaui.
+    """
+    pass
+
+
+class SearchCancelled(SearchTimeout):
+    """
+    Dilempar dari dalam rekursi ketika pencarian dibatalkan lewat
+    SearchContext.cancel(). Turunan SearchTimeout, sehingga iterative
+    deepening tetap mengembalikan hasil depth terakhir yang selesai.
+    """
+    pass
+
+
+class SearchContext:
+    """
+    Penghitung, batas, status pembatalan, dan callback instrumentasi
+    untuk satu pencarian.
+    """
+    def __init__(self, deadline=None, max_nodes=None, cancel_event=None, on_node=None, on_cutoff=None):
+        """
+        Args:
+            deadline (float or None): Batas waktu (time.time()) pencarian.
+            max_nodes (int or None): Batas jumlah node.
+            cancel_event (threading.Event or None): Event pembatalan; bisa
+                dipakai bersama beberapa pencarian. Default: Event baru.
+            on_node (callable or None): Dipanggil sebagai on_node(game, depth)
+                di setiap node.
+            on_cutoff (callable or None): Dipanggil sebagai
+                on_cutoff(ply, col, move_index) di setiap beta cutoff.
+        """
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self.on_node = on_node
+        self.on_cutoff = on_cutoff
+        self.reset()
+
+    def reset(self):
+        """
+        Mereset semua penghitung node sebelum pencarian baru.
+        """
+        self.nodes = 0
+        self.leaf_nodes = 0
+        # Diindeks dengan ply absolut (jumlah bidak di papan) sehingga cukup
+        # satu increment per node; lihat ply_metrics untuk ply relatif.
+        self.nodes_per_ply = [0] * MAX_PLY
+        self.cutoffs_per_ply = [0] * MAX_PLY
+
+    def cancel(self):
+        """
+        Meminta pencarian berhenti. Aman dipanggil dari thread lain.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_limits(self):
+        """
+        Melempar SearchCancelled atau SearchTimeout jika pencarian harus berhenti.
+        """
+        if self.cancel_event.is_set():
+            raise SearchCancelled()
+        if self.deadline is not None and time.time() >= self.deadline:
+            raise SearchTimeout()
+        if self.max_nodes is not None and self.nodes >= self.max_nodes:
+            raise SearchTimeout()
+
+    def counters(self):
+        """
+        Penghitung dalam bentuk yang bisa dikirim antar proses.
+
+        Returns:
+            tuple: (node, daun, node per ply, cutoff per ply).
+        """
+        return self.nodes, self.leaf_nodes, self.nodes_per_ply, self.cutoffs_per_ply
+
+    def merge(self, counters):
+        """
+        Menambahkan penghitung pencarian lain (hasil counters()), misalnya
+        dari proses worker pencarian paralel.
+        """
+        nodes, leaf_nodes, nodes_per_ply, cutoffs_per_ply = counters
+        self.nodes += nodes
+        self.leaf_nodes += leaf_nodes
+        for ply in range(MAX_PLY):
+            self.nodes_per_ply[ply] += nodes_per_ply[ply]
+            self.cutoffs_per_ply[ply] += cutoffs_per_ply[ply]
+
+    def ply_metrics(self, root_ply):
+        """
+        Memotong penghitung per ply absolut menjadi list relatif terhadap akar,
+        tanpa ekor nol.
+
+        Returns:
+            tuple: (node per ply, cutoff per ply).
+        """
+        last = max((i for i, n in enumerate(self.nodes_per_ply) if n), default=root_ply - 1)
+        return self.nodes_per_ply[root_ply:last + 1], self.cutoffs_per_ply[root_ply:last + 1]
@@ -0,0 +1,144 @@
+# src/transposition.py
+
+"""
+Modul ini berisi Transposition Table (TT) untuk algoritma Minimax.
+
+Connect-Four memiliki sangat banyak transposisi: urutan langkah yang berbeda
+bisa menghasilkan posisi yang sama persis. Tanpa TT, setiap transposisi akan
+dicari ulang dari nol. TT menyimpan hasil pencarian setiap posisi (diindeks
+dengan Zobrist hash) sehingga hasil tersebut bisa dipakai kembali.
+
+Karena Alpha-Beta Pruning sering memotong pencarian, skor yang tersimpan
+belum tentu nilai pasti. Setiap entri karena itu diberi tipe batas:
+- EXACT       : skor adalah nilai minimax yang sebenarnya.
+- LOWER_BOUND : pencarian terpotong karena skor >= beta (nilai asli >= skor).
+- UPPER_BOUND : semua langkah gagal melewati alpha (nilai asli <= skor).
+"""
+
+# --- Tipe Batas Entri ---
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Jumlah entri default (slot) untuk pencarian sekali jalan. Slot baru
+# dialokasikan saat pertama kali diisi, jadi membuat tabel selalu murah; batas
+# ini hanya membatasi memori maksimum (sekitar 60 MB jika semua slot terisi).
+DEFAULT_TT_SIZE = 1 << 18
+
+# Kebijakan penggantian entri ketika dua posisi berebut slot yang sama:
+# - 'depth'  : entri lama hanya diganti jika entri baru dicari sama dalam atau
+#              lebih dalam, atau jika entri lama berasal dari generasi sebelumnya.
+# - 'always' : entri lama selalu diganti dengan yang terbaru.
+REPLACEMENT_POLICIES = ('depth', 'always')
+
+# Perkiraan atas memori satu slot yang terisi (byte): entri di dua dict
+# (slot dan generasi) termasuk cadangan saat dict membesar, objek int indeks,
+# tuple 5 elemen, serta objek int untuk key 64-bit dan skor.
+ENTRY_BYTES = 240
+
+
+class TranspositionTable:
+    """
+    Tabel hash dengan `max_entries` slot. Setiap slot menyimpan satu entri
+    berupa tuple (key, depth, score, flag, best_move). Slot disimpan dalam
+    dict yang diisi saat dibutuhkan, sehingga membuat tabel tidak perlu
+    mengalokasikan semua slot di awal, sedangkan jumlah slot yang terisi
+    (dan memorinya) tetap tidak pernah melebihi `max_entries`.
+
+    Tabel bisa dipakai ulang oleh beberapa pencarian berturut-turut. Setiap
+    pencarian baru memanggil new_generation(); entri dari generasi lama tetap
+    bisa dibaca, tetapi selalu boleh ditimpa (aging) sehingga tidak menghalangi
+    entri baru meskipun depth-nya lebih besar.
+    """
+    def __init__(self, max_entries=DEFAULT_TT_SIZE, replacement='depth'):
+        """
+        Args:
+            max_entries (int): Jumlah slot maksimum di dalam tabel.
+            replacement (str): Kebijakan penggantian, lihat REPLACEMENT_POLICIES.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries harus bernilai positif.")
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Kebijakan penggantian tidak dikenal: {replacement!r}")
+        self.max_entries = max_entries
+        self.replacement = replacement
+        self._slots = {} # indeks slot -> entri
+        self._ages = {} # indeks slot -> generasi terakhir slot dipakai
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Mereset statistik pemakaian tabel.
+        """
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+
+    def clear(self):
+        """
+        Menghapus semua entri dan statistik.
+        """
+        self._slots = {}
+        self._ages = {}
+        self.generation = 0
+        self.reset_stats()
+
+    def new_generation(self):
+        """
+        Menandai awal pencarian baru: semua entri yang ada menjadi entri lama,
+        dan statistik pemakaian direset.
+        """
+        self.generation = (self.generation + 1) % 256
+        self.reset_stats()
+
+    def probe(self, key):
+        """
+        Mencari entri untuk posisi dengan hash `key`.
+
+        Returns:
+            tuple or None: (key, depth, score, flag, best_move) atau None jika tidak ada.
+        """
+        self.probes += 1
+        index = key % self.max_entries
+        entry = self._slots.get(index)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            self._ages[index] = self.generation # Entri yang masih terpakai tidak menua
+            return entry
+        return None
+
+    def peek(self, key):
+        """
+        Seperti probe, tetapi tanpa mengubah statistik atau generasi entri.
+        """
+        entry = self._slots.get(key % self.max_entries)
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        """
+        Menyimpan hasil pencarian sebuah posisi sesuai kebijakan penggantian.
+        """
+        index = key % self.max_entries
+        if self.replacement == 'depth':
+            old = self._slots.get(index)
+            if old is not None and old[0] != key and old[1] > depth and self._ages[index] == self.generation:
+                return
+        self._slots[index] = (key, depth, score, flag, best_move)
+        self._ages[index] = self.generation
+        self.stores += 1
+
+    def memory_bytes(self):
+        """
+        Perkiraan atas memori tabel dalam byte jika semua slot terisi.
+        """
+        return self.max_entries * ENTRY_BYTES
+
+    def __len__(self):
+        """
+        Mengembalikan jumlah slot yang sedang terisi.
+        """
+        return len(self._slots)
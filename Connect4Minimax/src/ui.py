@@ -4,6 +4,8 @@
 Modul ini bertanggung jawab untuk membangun dan mengelola Antarmuka
 Pengguna Grafis (GUI) dari aplikasi menggunakan library CustomTkinter.
 Versi final dengan tema Neon, pop-up kustom, dan highlight kemenangan.
+Papan digambar oleh BoardView (retained mode, lihat board_view.py), dan
+ukuran canvas mengikuti ukuran papan permainan (game.geometry).
 """
 
 import tkinter
@@ -13,15 +15,27 @@ import math
 import threading
 
 # Impor dari modul lain dalam proyek
-from .game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from .game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
 from .minimax import get_best_move, DEFAULT_DEPTH # DEFAULT_DEPTH masih digunakan untuk inisialisasi slider
 from .analyzer import PerformanceAnalyzer
+from .search_context import SearchContext
+from .ponder import Ponderer
+from .engine_state import EngineState
+from .board_view import BoardView
+
+# --- Pengaturan Mode "Waktu Berpikir" ---
+# Pada mode ini AI memakai iterative deepening dengan batas waktu per langkah,
+# sehingga waktu respons terjamin berapa pun kompleksitas posisinya.
+MODE_DEPTH = "Depth"
+MODE_TIME = "Waktu"
+MIN_THINK_TIME_MS = 250
+MAX_THINK_TIME_MS = 5000
+DEFAULT_THINK_TIME_MS = 1000
 
 # --- Konstanta Tampilan ---
+# Lebar canvas = kolom * SQUARESIZE, tinggi = (baris + 1) * SQUARESIZE (baris teratas untuk disk hover)
 SQUARESIZE = 100
 RADIUS = int(SQUARESIZE / 2 - 5)
-WIDTH = COLUMN_COUNT * SQUARESIZE
-HEIGHT = (ROW_COUNT + 1) * SQUARESIZE
 
 # --- Skema Warna "Neon" (Red & Blue) ---
 COLOR_BACKGROUND = "#B3B2B5"      # Hitam pekat
@@ -33,6 +47,10 @@ COLOR_TEXT = "#EAEAEA"
 COLOR_HIGHLIGHT = "#FFFF00"      # Kuning Neon untuk sorotan garis
 COLOR_POPUP_BG = "#1F232A"
 
+# Disk hover diperbarui paling sering sekali per frame (~60 fps); event
+# <Motion> di antaranya digabung sehingga hanya posisi terakhir yang dipakai
+HOVER_FRAME_MS = 16
+
 class App(ctk.CTk):
     def __init__(self, game, analyzer):
         super().__init__()
@@ -41,9 +59,18 @@ class App(ctk.CTk):
         self.analyzer = analyzer
         self.turn = PLAYER_PIECE
         self.is_ai_thinking = False
-
+        # Konteks pencarian AI yang sedang berjalan; dibatalkan saat restart
+        self.search_ctx = None
+        # Pencarian latar belakang selama giliran manusia
+        self.ponderer = Ponderer()
+        # Data pencarian (TT, history, PV) yang bertahan antar langkah; diganti baru saat restart
+        self.engine = EngineState(geometry=game.geometry)
+
+        board = game.geometry
+        width = board.columns * SQUARESIZE
+        height = (board.rows + 1) * SQUARESIZE
         self.title("Connect-Four AI | Neon Edition (Red & Blue)")
-        self.geometry(f"{WIDTH + 350}x{HEIGHT + 50}")
+        self.geometry(f"{width + 350}x{height + 50}")
         ctk.set_appearance_mode("Dark")
 
         self.grid_columnconfigure(0, weight=1)
@@ -53,18 +80,25 @@ class App(ctk.CTk):
         self.board_frame = ctk.CTkFrame(self, fg_color=COLOR_BACKGROUND)
         self.board_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         
-        self.canvas = ctk.CTkCanvas(self.board_frame, width=WIDTH, height=HEIGHT, bg=COLOR_BACKGROUND, highlightthickness=0)
+        self.canvas = ctk.CTkCanvas(self.board_frame, width=width, height=height, bg=COLOR_BACKGROUND, highlightthickness=0)
         self.canvas.pack(expand=True)
         self.canvas.bind("<Motion>", self.handle_mouse_move)
         self.canvas.bind("<Button-1>", self.handle_mouse_click)
+        # Item canvas dibuat sekali; setelah itu hanya diperbarui di tempat
+        self.board_view = BoardView(self.canvas, SQUARESIZE, RADIUS,
+                                    {'board': COLOR_BOARD, 'empty': COLOR_EMPTY, 'highlight': COLOR_HIGHLIGHT,
+                                     PLAYER_PIECE: COLOR_PLAYER1, AI_PIECE: COLOR_PLAYER2},
+                                    rows=board.rows, columns=board.columns)
+        self._hover_x = None # Posisi x event <Motion> terakhir yang belum digambar
+        self._hover_job = None
 
         self.control_panel = ctk.CTkFrame(self, width=300, fg_color=COLOR_BACKGROUND)
         self.control_panel.grid(row=0, column=1, sticky="ns", padx=(0, 20), pady=20)
         
         self.create_control_widgets()
         
-        self.draw_board()
         self.update_status_label()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def create_control_widgets(self):
         title_frame = ctk.CTkFrame(self.control_panel, fg_color=COLOR_BACKGROUND)
@@ -79,14 +113,20 @@ class App(ctk.CTk):
         analysis_frame = ctk.CTkFrame(self.control_panel)
         analysis_frame.pack(pady=10, padx=10, fill="x")
         ctk.CTkLabel(analysis_frame, text="Statistik Langkah AI Terakhir:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
-        self.analysis_label = ctk.CTkLabel(analysis_frame, text="Waktu Eksekusi: -\nJumlah Node: -\nDepth Pencarian: -\nMemori Puncak: -",
+        self.analysis_label = ctk.CTkLabel(analysis_frame, text="Waktu Eksekusi: -\nJumlah Node: -\nDepth Pencarian: -\nMemori: -\nTT Hit: -\nCutoff Langkah Pertama: -\nNPS: -",
                                            font=ctk.CTkFont(size=12), justify="left")
         self.analysis_label.pack(anchor="w", padx=10, pady=(0, 10))
         
         # --- Slider untuk mengatur kedalaman AI ---
         difficulty_frame = ctk.CTkFrame(self.control_panel)
         difficulty_frame.pack(pady=10, padx=10, fill="x")
-        ctk.CTkLabel(difficulty_frame, text="Tingkat Kesulitan AI (Depth):", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+        ctk.CTkLabel(difficulty_frame, text="Tingkat Kesulitan AI:", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+
+        # Pilihan mode: depth tetap atau batas waktu berpikir
+        self.search_mode = ctk.CTkSegmentedButton(difficulty_frame, values=[MODE_DEPTH, MODE_TIME],
+                                                  command=self.update_search_mode)
+        self.search_mode.set(MODE_DEPTH)
+        self.search_mode.pack(fill="x", padx=10, pady=(0, 5))
         
         self.depth_slider = ctk.CTkSlider(difficulty_frame, from_=2, to=6, number_of_steps=4,
                                           command=self.update_depth_label)
@@ -94,7 +134,17 @@ class App(ctk.CTk):
         self.depth_slider.pack(fill="x", padx=10)
         
         self.depth_label = ctk.CTkLabel(difficulty_frame, text=f"Depth: {int(self.depth_slider.get())}", font=ctk.CTkFont(size=12, slant="italic"))
-        self.depth_label.pack(anchor="w", padx=10, pady=(0, 10))
+        self.depth_label.pack(anchor="w", padx=10, pady=(0, 5))
+
+        self.time_slider = ctk.CTkSlider(difficulty_frame, from_=MIN_THINK_TIME_MS, to=MAX_THINK_TIME_MS,
+                                         number_of_steps=(MAX_THINK_TIME_MS - MIN_THINK_TIME_MS) // 250,
+                                         command=self.update_time_label)
+        self.time_slider.set(DEFAULT_THINK_TIME_MS)
+        self.time_slider.pack(fill="x", padx=10)
+
+        self.time_label = ctk.CTkLabel(difficulty_frame, text=f"Waktu Berpikir: {int(self.time_slider.get())} ms", font=ctk.CTkFont(size=12, slant="italic"))
+        self.time_label.pack(anchor="w", padx=10, pady=(0, 10))
+        self.update_search_mode(MODE_DEPTH)
 
         complexity_frame = ctk.CTkFrame(self.control_panel)
         complexity_frame.pack(pady=10, padx=10, fill="x")
@@ -110,48 +160,40 @@ class App(ctk.CTk):
         """Memperbarui teks label depth sesuai dengan nilai slider."""
         self.depth_label.configure(text=f"Depth: {int(value)}")
 
-    def draw_board(self, highlight_col=None):
-        self.canvas.delete("all")
-        if self.turn == PLAYER_PIECE and not self.game.game_over and highlight_col is not None:
-             self.canvas.create_oval(highlight_col * SQUARESIZE + 5, SQUARESIZE - 2*RADIUS - 5,
-                                    highlight_col * SQUARESIZE + SQUARESIZE - 5, SQUARESIZE - 5,
-                                    fill=COLOR_PLAYER1, outline="")
-        for c in range(COLUMN_COUNT):
-            for r in range(ROW_COUNT):
-                x1 = c * SQUARESIZE
-                y1 = (ROW_COUNT - r) * SQUARESIZE
-                x2 = x1 + SQUARESIZE
-                y2 = y1 + SQUARESIZE
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=COLOR_BOARD, outline="black")
-                center_x, center_y = (x1 + x2) / 2, (y1 + y2) / 2
-                piece = self.game.board[r][c]
-                color = COLOR_EMPTY
-                if piece == PLAYER_PIECE: color = COLOR_PLAYER1
-                elif piece == AI_PIECE: color = COLOR_PLAYER2
-                self.canvas.create_oval(center_x - RADIUS, center_y - RADIUS, center_x + RADIUS, center_y + RADIUS, fill=color, outline="")
-
-    def highlight_winning_pieces(self, winning_coords):
-        """Menggambar garis sorotan di atas bidak-bidak yang menang."""
-        if not winning_coords: return
-
-        # Dapatkan koordinat tengah dari bidak pertama dan terakhir yang menang
-        r1, c1 = winning_coords[0]
-        r4, c4 = winning_coords[3] # Ambil bidak keempat untuk garis
-
-        start_x = c1 * SQUARESIZE + SQUARESIZE / 2
-        start_y = (ROW_COUNT - r1) * SQUARESIZE + SQUARESIZE / 2
-        end_x = c4 * SQUARESIZE + SQUARESIZE / 2
-        end_y = (ROW_COUNT - r4) * SQUARESIZE + SQUARESIZE / 2
-
-        self.canvas.create_line(start_x, start_y, end_x, end_y,
-                                fill=COLOR_HIGHLIGHT, width=8, tags="winning_line")
+    def update_time_label(self, value):
+        """Memperbarui teks label waktu berpikir sesuai dengan nilai slider."""
+        self.time_label.configure(text=f"Waktu Berpikir: {int(value)} ms")
 
+    def update_search_mode(self, mode):
+        """Mengaktifkan slider yang sesuai dengan mode pencarian yang dipilih."""
+        if self.is_ai_thinking:
+            return
+        self.depth_slider.configure(state="normal" if mode == MODE_DEPTH else "disabled")
+        self.time_slider.configure(state="normal" if mode == MODE_TIME else "disabled")
+
+    def set_difficulty_controls_enabled(self, enabled):
+        """Mengaktifkan atau menonaktifkan semua kontrol tingkat kesulitan."""
+        if enabled:
+            self.search_mode.configure(state="normal")
+            self.update_search_mode(self.search_mode.get())
+        else:
+            self.search_mode.configure(state="disabled")
+            self.depth_slider.configure(state="disabled")
+            self.time_slider.configure(state="disabled")
 
     def handle_mouse_move(self, event):
+        """Mencatat posisi mouse; disk hover digambar paling sering sekali per frame."""
+        self._hover_x = event.x
+        if self._hover_job is None:
+            self._hover_job = self.after(HOVER_FRAME_MS, self._flush_hover)
+
+    def _flush_hover(self):
+        """Memindahkan disk hover ke kolom dari event <Motion> terakhir."""
+        self._hover_job = None
         if self.turn == PLAYER_PIECE and not self.game.game_over and not self.is_ai_thinking:
-            col = math.floor(event.x / SQUARESIZE)
-            if 0 <= col < COLUMN_COUNT:
-                self.draw_board(highlight_col=col)
+            col = math.floor(self._hover_x / SQUARESIZE)
+            if 0 <= col < self.game.geometry.columns:
+                self.board_view.set_hover(col)
 
     def handle_mouse_click(self, event):
         if self.turn != PLAYER_PIECE or self.game.game_over or self.is_ai_thinking:
@@ -161,14 +203,15 @@ class App(ctk.CTk):
         if self.game.is_valid_location(col):
             row = self.game.get_next_open_row(col)
             self.game.drop_piece(row, col, PLAYER_PIECE)
-            self.draw_board()
+            self.board_view.set_cell(row, col, PLAYER_PIECE)
+            self.board_view.set_hover(None)
             
-            winning_coords = self.game.winning_move(PLAYER_PIECE)
+            winning_coords = self.game.winning_move_at(row, col, PLAYER_PIECE)
             if winning_coords:
                 self.game.game_over = True
                 self.game.winner = PLAYER_PIECE
                 self.update_status_label()
-                self.highlight_winning_pieces(winning_coords)
+                self.board_view.show_winning_line(winning_coords)
                 self._show_endgame_dialog("Permainan Selesai", "Selamat, Anda Menang!")
                 return
             
@@ -181,28 +224,51 @@ class App(ctk.CTk):
             self.turn = AI_PIECE
             self.update_status_label()
             self.is_ai_thinking = True
-            self.depth_slider.configure(state="disabled") # Nonaktifkan slider saat AI berpikir
+            self.set_difficulty_controls_enabled(False) # Nonaktifkan slider saat AI berpikir
             
-            threading.Thread(target=self._run_ai_calculation, daemon=True).start()
-
-    def _run_ai_calculation(self):
-        current_depth = int(self.depth_slider.get()) # Dapatkan depth dari slider
-        col = get_best_move(self.game, self.analyzer, depth=current_depth)
-        self.after(0, self._ai_move_callback, col)
+            self.search_ctx = SearchContext()
+            threading.Thread(target=self._run_ai_calculation, args=(self.search_ctx, self._search_options(), col),
+                             daemon=True).start()
+
+    def _search_options(self):
+        """Argumen get_best_move sesuai mode dan slider tingkat kesulitan."""
+        if self.search_mode.get() == MODE_TIME:
+            return {'time_limit_ms': int(self.time_slider.get()), 'engine': self.engine} # Batas waktu dari slider
+        return {'depth': int(self.depth_slider.get()), 'engine': self.engine} # Depth dari slider
+
+    def _run_ai_calculation(self, ctx, options, reply):
+        # take() bisa menunggu pencarian pondering untuk balasan ini selesai,
+        # jadi dipanggil di thread ini agar jendela tidak membeku
+        pondered = self.ponderer.take(reply, options)
+        if ctx.cancelled:
+            return
+        if pondered is not None:
+            # Balasan ini sudah dicari selama giliran manusia: jawab langsung
+            col, pondered_analyzer = pondered
+            self.analyzer.adopt_search(pondered_analyzer)
+            print(f"[AI] Memilih kolom {col} dari hasil pondering.")
+            self.after(0, self._ai_move_callback, col, ctx)
+            return
+        col = get_best_move(self.game, self.analyzer, ctx=ctx, **options)
+        if col is None: # Dibatalkan (misalnya karena restart)
+            return
+        self.after(0, self._ai_move_callback, col, ctx)
 
-    def _ai_move_callback(self, col):
+    def _ai_move_callback(self, col, ctx):
+        if ctx is not self.search_ctx or ctx.cancelled:
+            return # Hasil pencarian dari permainan sebelum restart
         if col is not None and self.game.is_valid_location(col):
             row = self.game.get_next_open_row(col)
             self.game.drop_piece(row, col, AI_PIECE)
-            self.draw_board()
+            self.board_view.set_cell(row, col, AI_PIECE)
             self.analysis_label.configure(text=self.analyzer.get_stats_string())
 
-            winning_coords = self.game.winning_move(AI_PIECE)
+            winning_coords = self.game.winning_move_at(row, col, AI_PIECE)
             if winning_coords:
                 self.game.game_over = True
                 self.game.winner = AI_PIECE
                 self.update_status_label()
-                self.highlight_winning_pieces(winning_coords)
+                self.board_view.show_winning_line(winning_coords)
                 self._show_endgame_dialog("Permainan Selesai", "AI Menang!")
                 return
 
@@ -215,7 +281,8 @@ class App(ctk.CTk):
         self.turn = PLAYER_PIECE
         self.update_status_label()
         self.is_ai_thinking = False
-        self.depth_slider.configure(state="normal") # Aktifkan kembali slider
+        self.set_difficulty_controls_enabled(True) # Aktifkan kembali slider
+        self.ponderer.start(self.game, self._search_options())
         
     def _show_endgame_dialog(self, title, message):
         dialog = ctk.CTkToplevel(self)
@@ -252,16 +319,41 @@ class App(ctk.CTk):
             else: self.status_label.configure(text="AI Sedang Berpikir...", text_color=COLOR_PLAYER2)
 
     def restart_game(self):
+        # Hentikan pencarian AI dan pondering yang masih berjalan
+        if self.search_ctx is not None:
+            self.search_ctx.cancel()
+            self.search_ctx = None
+        self.ponderer.stop()
+        # Pencarian AI yang dibatalkan bisa saja masih memakai EngineState lama
+        # sesaat; permainan baru memakai EngineState baru, yang lama dibiarkan
+        self.engine = EngineState(geometry=self.game.geometry)
         self.game.reset_game()
         self.analyzer.reset()
         self.turn = PLAYER_PIECE
         self.is_ai_thinking = False
         
-        self.analysis_label.configure(text="Waktu Eksekusi: -\nJumlah Node: -\nDepth Pencarian: -\nMemori Puncak: -")
+        self.analysis_label.configure(text="Waktu Eksekusi: -\nJumlah Node: -\nDepth Pencarian: -\nMemori: -\nTT Hit: -\nCutoff Langkah Pertama: -\nNPS: -")
         self.update_status_label()
         
-        self.draw_board()
-        self.depth_slider.configure(state="normal") # Pastikan slider aktif saat game restart
+        self.board_view.sync(self.game.board)
+        self.board_view.set_hover(None)
+        self.board_view.hide_winning_line()
+        self.set_difficulty_controls_enabled(True) # Pastikan slider aktif saat game restart
+        self._print_frame_stats()
+
+    def _print_frame_stats(self):
+        """Mencetak statistik waktu frame papan ke konsol."""
+        stats = self.board_view.timer.get_stats_string()
+        if stats:
+            print(f"[UI] Statistik frame papan ({self.board_view.items_created} item canvas dibuat):\n{stats}")
+
+    def on_close(self):
+        """Menghentikan pencarian latar belakang lalu menutup jendela."""
+        if self.search_ctx is not None:
+            self.search_ctx.cancel()
+        self.ponderer.stop()
+        self._print_frame_stats()
+        self.destroy()
 
 if __name__ == '__main__':
     game_instance = Connect4Game()
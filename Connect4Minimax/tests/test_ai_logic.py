@@ -13,6 +13,8 @@ permainan. Dengan adanya tes ini, kita dapat lebih yakin bahwa implementasi
 algoritma Minimax berfungsi sesuai harapan.
 """
 import unittest
+import time
+import random
 import numpy as np
 import sys
 import os
@@ -20,10 +22,35 @@ import os
 # Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
-from src.minimax import get_best_move
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from math import inf
+from src.minimax import get_best_move, score_position, score_positions, evaluate_window, IncrementalEvaluator, shutdown_process_pools
+from src.minimax import minimax_alpha_beta, search_position, tactical_moves
+from src.transposition import TranspositionTable
+from src import minimax
+from src.move_ordering import MoveOrderer
+from src.bitboard import BitboardGame
 from src.analyzer import PerformanceAnalyzer
 
+
+def reference_score_position(board, piece):
+    """
+    Implementasi score_position versi awal (loop per window) yang dipakai
+    sebagai acuan untuk versi vektorisasi.
+    """
+    score = [int(i) for i in list(board[:, COLUMN_COUNT // 2])].count(piece) * 6
+    for r in range(ROW_COUNT):
+        for c in range(COLUMN_COUNT - 3):
+            score += evaluate_window([int(board[r][c + i]) for i in range(4)], piece)
+    for c in range(COLUMN_COUNT):
+        for r in range(ROW_COUNT - 3):
+            score += evaluate_window([int(board[r + i][c]) for i in range(4)], piece)
+    for r in range(ROW_COUNT - 3):
+        for c in range(COLUMN_COUNT - 3):
+            score += evaluate_window([int(board[r + i][c + i]) for i in range(4)], piece)
+            score += evaluate_window([int(board[r + 3 - i][c + i]) for i in range(4)], piece)
+    return score
+
 class TestAILogic(unittest.TestCase):
     """
     Kumpulan tes untuk verifikasi logika strategis algoritma Minimax.
@@ -84,6 +111,172 @@ class TestAILogic(unittest.TestCase):
         
         self.assertEqual(best_move_col, 2, "AI gagal memblokir langkah kemenangan lawan.")
 
+    def test_time_limited_search(self):
+        """
+        Tes 3: Mode batas waktu (iterative deepening) harus selesai mendekati
+        batas waktu, melaporkan depth yang benar-benar selesai, dan tetap
+        mengambil langkah kemenangan.
+        """
+        print("\nMenjalankan Tes AI: Batas Waktu...")
+        self.game.board[0][1] = AI_PIECE
+        self.game.board[0][2] = AI_PIECE
+        self.game.board[0][4] = AI_PIECE
+        self.game.board[0][0] = PLAYER_PIECE
+
+        start = time.time()
+        best_move_col = get_best_move(self.game, self.analyzer, time_limit_ms=200)
+        elapsed_ms = (time.time() - start) * 1000
+
+        self.assertEqual(best_move_col, 3, "AI gagal memilih langkah kemenangan dalam mode waktu.")
+        self.assertGreaterEqual(self.analyzer.search_depth, 1)
+        self.assertLess(elapsed_ms, 1000, "Pencarian melewati batas waktu terlalu jauh.")
+
+    def test_vectorized_score_matches_reference(self):
+        """
+        Tes 4: score_position versi vektorisasi harus memberikan skor yang
+        sama persis dengan implementasi loop awal, untuk kedua pemain.
+        """
+        rng = random.Random(2024)
+        for _ in range(200):
+            board = np.zeros((ROW_COUNT, COLUMN_COUNT), dtype=int)
+            for c in range(COLUMN_COUNT):
+                for r in range(rng.randint(0, ROW_COUNT)):
+                    board[r][c] = rng.choice([PLAYER_PIECE, AI_PIECE])
+            for piece in (AI_PIECE, PLAYER_PIECE):
+                self.assertEqual(score_position(board, piece), reference_score_position(board, piece))
+
+    def test_incremental_evaluator_tracks_play_and_undo(self):
+        """
+        Tes 5: IncrementalEvaluator harus selalu sama dengan score_position
+        setelah setiap play() dan undo(), untuk kedua representasi papan.
+        """
+        rng = random.Random(8)
+        for game in (Connect4Game(), BitboardGame()):
+            game.attach_evaluator(IncrementalEvaluator(game.board))
+            for _ in range(300):
+                valid = game.get_valid_locations()
+                if valid and (not game.move_history or rng.random() < 0.6):
+                    game.play(rng.choice(valid), rng.choice([PLAYER_PIECE, AI_PIECE]))
+                else:
+                    game.undo()
+                self.assertEqual(game.evaluator.current_score(), score_position(game.board, AI_PIECE))
+
+    def test_batched_scores_and_search(self):
+        """
+        Tes 6: score_positions harus sama dengan score_position per papan, dan
+        pencarian dengan batch_leaves harus memilih langkah yang sama dengan
+        jumlah node yang sama.
+        """
+        rng = random.Random(9)
+        boards = np.zeros((20, ROW_COUNT, COLUMN_COUNT), dtype=int)
+        for board in boards:
+            for c in range(COLUMN_COUNT):
+                for r in range(rng.randint(0, ROW_COUNT)):
+                    board[r][c] = rng.choice([PLAYER_PIECE, AI_PIECE])
+        self.assertEqual(score_positions(boards, AI_PIECE).tolist(),
+                         [score_position(board, AI_PIECE) for board in boards])
+
+        self.game.drop_piece(0, 3, PLAYER_PIECE)
+        self.game.drop_piece(0, 4, AI_PIECE)
+        self.game.drop_piece(1, 3, PLAYER_PIECE)
+        serial_col = get_best_move(self.game, self.analyzer, depth=4)
+        serial_nodes = self.analyzer.nodes_evaluated
+        batched_col = get_best_move(self.game, self.analyzer, depth=4, batch_leaves=True)
+        self.assertEqual(serial_col, batched_col)
+        self.assertEqual(serial_nodes, self.analyzer.nodes_evaluated)
+
+    def test_parallel_root_search_matches_serial(self):
+        """
+        Tes 7: Pencarian paralel di akar harus memilih langkah yang sama
+        dengan pencarian serial.
+        """
+        self.game.drop_piece(0, 3, PLAYER_PIECE)
+        self.game.drop_piece(0, 2, AI_PIECE)
+        self.game.drop_piece(1, 3, PLAYER_PIECE)
+        try:
+            serial_col = get_best_move(self.game, self.analyzer, depth=5)
+            parallel_col = get_best_move(self.game, self.analyzer, depth=5, workers=2)
+            # Pencarian kedua memakai TT worker yang sudah terisi
+            repeated_col = get_best_move(self.game, self.analyzer, depth=5, workers=2)
+        finally:
+            shutdown_process_pools()
+        self.assertEqual(serial_col, parallel_col)
+        self.assertEqual(serial_col, repeated_col)
+
+        # TT worker dipakai ulang antar tugas; pencarian berikutnya hanya menuakannya
+        options = {'tt_size': 1 << 10, 'tt_replacement': 'depth'}
+        tt = minimax._worker_table(options, 1)
+        self.assertIs(minimax._worker_table(options, 1), tt)
+        self.assertEqual(tt.generation, 0)
+        self.assertIs(minimax._worker_table(options, 2), tt)
+        self.assertEqual(tt.generation, 1)
+        self.assertIsNot(minimax._worker_table(dict(options, tt_size=1 << 11), 3), tt)
+        minimax._worker_tt = minimax._worker_search = None # Proses utama bukan worker
+
+    def test_pvs_matches_minimax(self):
+        """
+        Tes 8: Negamax + PVS harus memilih langkah dan skor yang sama dengan
+        Minimax biasa pada posisi acak, dengan maupun tanpa Transposition Table.
+        """
+        rng = random.Random(5)
+        for _ in range(20):
+            game = BitboardGame()
+            piece = PLAYER_PIECE
+            for _ in range(rng.randint(0, 16)):
+                col = rng.choice(game.get_valid_locations())
+                row = game.play(col, piece)
+                if game.winning_move_at(row, col, piece):
+                    game.undo()
+                    break
+                piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+            for tt in (None, TranspositionTable(1 << 12)):
+                expected = minimax_alpha_beta(game, 4, -inf, inf, True, tt=tt, orderer=MoveOrderer())
+                if tt is not None:
+                    tt.clear()
+                actual = search_position(game, 4, -inf, inf, True, tt=tt, orderer=MoveOrderer(), search='pvs')
+                self.assertEqual(actual, expected)
+
+    def test_tactics_at_depth_one(self):
+        """
+        Tes 9: Dengan lapisan taktis, depth 1 sudah cukup untuk mengambil
+        kemenangan langsung dan memblokir tiga bidak vertikal lawan.
+        """
+        self.game.board[0][1] = AI_PIECE
+        self.game.board[0][2] = AI_PIECE
+        self.game.board[0][4] = AI_PIECE
+        self.assertEqual(get_best_move(self.game, self.analyzer, depth=1), 3)
+
+        self.game.reset_game()
+        self.game.board[0][2] = PLAYER_PIECE
+        self.game.board[1][2] = PLAYER_PIECE
+        self.game.board[2][2] = PLAYER_PIECE
+        self.game.board[0][5] = AI_PIECE
+        self.assertEqual(get_best_move(self.game, self.analyzer, depth=1), 2)
+        self.assertEqual(self.analyzer.nodes_evaluated, 0)
+
+    def test_tactical_moves_match_across_backends(self):
+        """
+        Tes 10: tactical_moves memberi hasil yang sama pada Connect4Game dan
+        BitboardGame, dan pruning taktis di dalam pohon tidak mengubah skor.
+        """
+        rng = random.Random(3)
+        for _ in range(40):
+            game = Connect4Game()
+            piece = PLAYER_PIECE
+            for _ in range(rng.randint(0, 26)):
+                col = rng.choice(game.get_valid_locations())
+                row = game.play(col, piece)
+                if game.winning_move_at(row, col, piece):
+                    game.undo()
+                    break
+                piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+            bitboard_game = BitboardGame.from_game(game)
+            self.assertEqual(tactical_moves(game, piece), tactical_moves(bitboard_game, piece))
+
+            plain = search_position(bitboard_game, 4, -inf, inf, piece == AI_PIECE)[1]
+            tactical = search_position(bitboard_game, 4, -inf, inf, piece == AI_PIECE, tactics=True)[1]
+            self.assertEqual(plain, tactical)
+
 
 if __name__ == '__main__':
     print("Menjalankan unit tests untuk Logika AI...")
@@ -0,0 +1,90 @@
+# tests/test_analyzer.py
+
+"""
+Unit tests untuk modul analyzer.py: rincian node per ply, memori puncak,
+riwayat langkah yang bisa diekspor sebagai JSON, dan persentil.
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import tempfile
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer, percentile
+
+
+class TestPerformanceAnalyzer(unittest.TestCase):
+    """
+    Kumpulan tes untuk metrik PerformanceAnalyzer.
+    """
+
+    def setUp(self):
+        """Posisi tengah permainan yang tidak dipaksa taktik, giliran AI."""
+        self.game = Connect4Game.from_moves("132112346512342")
+        self.analyzer = PerformanceAnalyzer()
+
+    def search(self, **options):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return get_best_move(self.game, self.analyzer, opening_book=False, **options)
+
+    def test_ply_breakdown_adds_up(self):
+        """Tes 1: Node per ply, daun, dan interior konsisten dengan total node."""
+        for options in ({'depth': 5}, {'depth': 5, 'search': 'pvs'}, {'depth': 5, 'batch_leaves': True}):
+            self.search(**options)
+            a = self.analyzer
+            self.assertEqual(sum(a.nodes_per_ply), a.nodes_evaluated, options)
+            self.assertEqual(a.nodes_per_ply[0], 1) # Akar
+            self.assertEqual(len(a.nodes_per_ply), 6)
+            self.assertEqual(a.leaf_nodes + a.get_interior_nodes(), a.nodes_evaluated)
+            self.assertEqual(sum(a.cutoffs_per_ply), a.beta_cutoffs)
+            self.assertGreater(a.get_nodes_per_second(), 0)
+
+    def test_tracemalloc_peak_memory(self):
+        """Tes 2: track_memory memakai tracemalloc; selisih RSS tidak pernah dilaporkan sebagai memori puncak."""
+        self.search(depth=3, track_memory=True)
+        self.assertEqual(self.analyzer.memory_source, 'tracemalloc')
+        self.assertGreater(self.analyzer.memory_usage_mb, 0.0)
+        self.assertIn("Memori Puncak", self.analyzer.get_stats_string())
+        self.search(depth=3)
+        self.assertEqual(self.analyzer.memory_source, 'rss')
+        self.assertEqual(self.analyzer.memory_usage_mb, 0.0)
+        self.assertGreaterEqual(self.analyzer.rss_growth_mb, 0.0)
+        self.assertNotIn("Memori Puncak", self.analyzer.get_stats_string())
+        self.assertIn("Pertumbuhan RSS", self.analyzer.get_stats_string())
+
+    def test_history_export_json(self):
+        """Tes 3: Setiap langkah tercatat di riwayat dan bisa diekspor lalu dibaca kembali."""
+        first = self.search(depth=3)
+        second = self.search(depth=4)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'history.json')
+            text = self.analyzer.export_history_json(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), json.loads(text))
+        moves = json.loads(text)['moves']
+        self.assertEqual([m['col'] for m in moves], [first, second])
+        self.assertEqual([m['search_depth'] for m in moves], [3, 4])
+        self.assertEqual(moves[1]['source'], 'search')
+        self.assertEqual(len(self.analyzer.get_stats_string().splitlines()), 7)
+        self.analyzer.reset()
+        self.assertEqual(self.analyzer.history, [])
+
+    def test_percentile(self):
+        """Tes 4: Persentil nearest-rank."""
+        values = list(range(1, 21))
+        self.assertEqual(percentile(values, 0.95), 19)
+        self.assertEqual(percentile(values, 0.5), 10)
+        self.assertEqual(percentile([7.0], 0.95), 7.0)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Performance Analyzer...")
+    unittest.main()
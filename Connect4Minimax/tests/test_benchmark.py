@@ -0,0 +1,86 @@
+# tests/test_benchmark.py
+
+"""
+Unit tests untuk skrip benchmark.py (benchmark standar dan baseline).
+"""
+
+import unittest
+import copy
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
+from src.minimax import tactical_moves
+from benchmark import (BENCHMARK_SUITE, RESULT_FIELDS, SCALING_FIELDS, run_benchmark,
+                       compare_with_baseline, run_scaling, scaling_positions)
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Kumpulan tes untuk benchmark suite.
+    """
+
+    def test_suite_positions_are_searchable(self):
+        """Tes 1: Setiap posisi suite valid, giliran AI, dan tidak dipaksa oleh taktik."""
+        for phase, positions in BENCHMARK_SUITE['positions'].items():
+            for moves in positions:
+                game = Connect4Game.from_moves(moves)
+                self.assertEqual(len(moves) % 2, 1 if moves else 0, f"Bukan giliran AI: {moves}")
+                self.assertIsNone(game.winning_move(PLAYER_PIECE))
+                self.assertIsNone(game.winning_move(AI_PIECE))
+                winning, blocking, _ = tactical_moves(game, AI_PIECE)
+                self.assertEqual((winning, blocking), ([], []), f"Posisi {phase} dipaksa: {moves}")
+
+    def test_run_and_compare_with_baseline(self):
+        """Tes 2: Hasil benchmark lengkap dan regresi di atas ambang terdeteksi."""
+        report = run_benchmark([1, 2], trials=2, warmup=0, phases=['pembukaan'])
+        self.assertEqual(len(report['results']), 2)
+        for row in report['results']:
+            self.assertEqual(set(row), set(RESULT_FIELDS))
+            self.assertGreater(row['nodes'], 0)
+        self.assertEqual(compare_with_baseline(report, report), [])
+
+        faster_baseline = copy.deepcopy(report)
+        faster_baseline['results'][1]['median_ms'] = report['results'][1]['median_ms'] / 2
+        regressions = compare_with_baseline(report, faster_baseline, threshold=0.10)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('median_ms', regressions[0])
+
+        # Mesin yang dua kali lebih lambat (kalibrasi juga dua kali lebih lama) bukan regresi
+        slower_machine = copy.deepcopy(report)
+        slower_machine['calibration_ms'] = report['calibration_ms'] * 2
+        for row in slower_machine['results']:
+            row['median_ms'] *= 2
+        self.assertEqual(compare_with_baseline(slower_machine, report, threshold=0.10), [])
+        self.assertEqual(compare_with_baseline(report, faster_baseline, metrics=('nodes',)), [])
+
+        faster_baseline['suite_version'] += 1
+        with self.assertRaises(ValueError):
+            compare_with_baseline(report, faster_baseline)
+
+    def test_scaling_report(self):
+        """Tes 3: Benchmark skala memakai posisi giliran AI dan melaporkan setiap geometri."""
+        positions = scaling_positions(7, 9, 5)
+        self.assertEqual(positions, scaling_positions(7, 9, 5)) # Seed tetap
+        for moves in positions:
+            self.assertEqual(len(moves) % 2, 0 if not moves else 1)
+            game = Connect4Game.from_moves(moves, rows=7, columns=9, connect=5)
+            self.assertFalse(game.winning_move(PLAYER_PIECE) or game.winning_move(AI_PIECE))
+
+        report = run_scaling([1], trials=1, warmup=0, geometries=((6, 7, 4), (7, 9, 5)))
+        self.assertEqual(len(report['results']), 2)
+        small, large = report['results']
+        for row in report['results']:
+            self.assertEqual(set(row), set(SCALING_FIELDS))
+            self.assertGreater(row['nodes'], 0)
+        self.assertEqual((small['bitboard_bits'], small['windows']), (49, 69))
+        self.assertEqual(large['bitboard_bits'], 72)
+        self.assertGreater(large['table_kb'], 0)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Benchmark...")
+    unittest.main()
@@ -0,0 +1,122 @@
+# tests/test_bitboard.py
+
+"""
+Unit tests untuk modul bitboard.py.
+
+Memastikan bahwa BitboardGame berperilaku identik dengan Connect4Game
+(representasi NumPy), baik untuk aturan permainan maupun fungsi evaluasi
+heuristik yang digunakan oleh Minimax.
+"""
+
+import unittest
+import random
+import numpy as np
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
+from src.bitboard import BitboardGame
+from src.minimax import score_position, evaluate_game, get_best_move
+from src.analyzer import PerformanceAnalyzer
+
+
+def random_game(rng, max_moves):
+    """Membuat Connect4Game acak yang belum berakhir."""
+    game = Connect4Game()
+    for _ in range(rng.randint(0, max_moves)):
+        valid = game.get_valid_locations()
+        if not valid or game.winning_move(PLAYER_PIECE) or game.winning_move(AI_PIECE):
+            break
+        col = rng.choice(valid)
+        game.drop_piece(game.get_next_open_row(col), col, rng.choice([PLAYER_PIECE, AI_PIECE]))
+    return game
+
+
+class TestBitboard(unittest.TestCase):
+    """
+    Kumpulan tes untuk kelas BitboardGame.
+    """
+
+    def test_round_trip_board(self):
+        """Tes 1: Konversi NumPy -> bitboard -> NumPy tidak mengubah papan."""
+        rng = random.Random(7)
+        for _ in range(50):
+            game = random_game(rng, 30)
+            bitboard_game = BitboardGame.from_board(game.board)
+            self.assertTrue(np.array_equal(bitboard_game.to_board(), game.board))
+            self.assertEqual(bitboard_game.get_valid_locations(), game.get_valid_locations())
+
+    def test_winning_move_coordinates(self):
+        """Tes 2: Koordinat kemenangan sama dengan Connect4Game."""
+        game = Connect4Game()
+        for i in range(4):
+            game.drop_piece(i, i, PLAYER_PIECE)
+        bitboard_game = BitboardGame.from_board(game.board)
+        self.assertEqual(bitboard_game.winning_move(PLAYER_PIECE), game.winning_move(PLAYER_PIECE))
+        self.assertIsNone(bitboard_game.winning_move(AI_PIECE))
+
+    def test_winning_move_at_matches_full_scan(self):
+        """Tes 3: winning_move_at() sama dengan winning_move() setelah setiap langkah acak."""
+        rng = random.Random(3)
+        for _ in range(50):
+            game = BitboardGame()
+            piece = PLAYER_PIECE
+            while game.get_valid_locations():
+                col = rng.choice(game.get_valid_locations())
+                row = game.get_next_open_row(col)
+                game.drop_piece(row, col, piece)
+                result = game.winning_move_at(row, col, piece)
+                self.assertEqual(result is not None, game.winning_move(piece) is not None)
+                if result is not None:
+                    self.assertIn((row, col), result)
+                    break
+                piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+
+    def test_drop_piece_and_full_column(self):
+        """Tes 4: drop_piece, get_next_open_row, dan validasi kolom penuh."""
+        game = BitboardGame()
+        for r in range(6):
+            self.assertEqual(game.get_next_open_row(0), r)
+            game.drop_piece(r, 0, AI_PIECE)
+        self.assertFalse(game.is_valid_location(0))
+        self.assertIsNone(game.get_next_open_row(0))
+        self.assertNotIn(0, game.get_valid_locations())
+
+    def test_play_and_undo_restore_position(self):
+        """Tes 5: Rangkaian play() lalu undo() mengembalikan bitboard ke posisi awal."""
+        game = BitboardGame()
+        for col in [3, 3, 2, 4, 3, 1]:
+            game.play(col, PLAYER_PIECE if len(game.move_history) % 2 == 0 else AI_PIECE)
+        snapshot = (dict(game.bitboards), game.mask, list(game.heights))
+        game.play(5, PLAYER_PIECE)
+        game.play(3, AI_PIECE)
+        game.undo()
+        game.undo()
+        self.assertEqual((game.bitboards, game.mask, game.heights), snapshot)
+
+    def test_evaluation_matches_score_position(self):
+        """Tes 6: Evaluasi heuristik bitboard sama persis dengan score_position."""
+        rng = random.Random(11)
+        for _ in range(100):
+            game = random_game(rng, 35)
+            bitboard_game = BitboardGame.from_board(game.board)
+            self.assertEqual(evaluate_game(bitboard_game), score_position(game.board, AI_PIECE))
+
+    def test_search_backends_agree(self):
+        """Tes 7: Minimax memilih langkah dan jumlah node yang sama di kedua backend."""
+        game = Connect4Game()
+        game.drop_piece(0, 3, PLAYER_PIECE)
+        game.drop_piece(0, 2, AI_PIECE)
+        numpy_analyzer, bitboard_analyzer = PerformanceAnalyzer(), PerformanceAnalyzer()
+        numpy_col = get_best_move(game, numpy_analyzer, depth=3, backend='numpy')
+        bitboard_col = get_best_move(game, bitboard_analyzer, depth=3, backend='bitboard')
+        self.assertEqual(numpy_col, bitboard_col)
+        self.assertEqual(numpy_analyzer.nodes_evaluated, bitboard_analyzer.nodes_evaluated)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Bitboard...")
+    unittest.main()
@@ -0,0 +1,114 @@
+# tests/test_board_view.py
+
+"""
+Unit tests untuk modul board_view.py.
+
+BoardView diuji dengan canvas tiruan yang hanya mencatat perintah canvas,
+sehingga tes tidak membutuhkan layar. Yang dipastikan adalah bahwa item
+dibuat sekali saja, dan setiap pembaruan hanya menyentuh item yang berubah.
+"""
+
+import unittest
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from src.board_view import BoardView
+
+COLORS = {'board': 'board', 'empty': 'empty', 'highlight': 'highlight', PLAYER_PIECE: 'red', AI_PIECE: 'blue'}
+
+
+class RecordingCanvas:
+    """Canvas tiruan dengan API tkinter.Canvas yang mencatat setiap perintah."""
+    def __init__(self):
+        self.calls = []
+        self.items = {}
+
+    def _create(self, kind, coords, options):
+        item = len(self.items) + 1
+        self.items[item] = dict(options, kind=kind, coords=coords)
+        self.calls.append(('create', kind))
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create('oval', coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, options)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+        self.calls.append(('itemconfigure', item))
+
+    def coords(self, item, *coords):
+        self.items[item]['coords'] = coords
+        self.calls.append(('coords', item))
+
+
+class TestBoardView(unittest.TestCase):
+    """
+    Kumpulan tes untuk BoardView dan FrameTimer.
+    """
+
+    def setUp(self):
+        self.canvas = RecordingCanvas()
+        self.view = BoardView(self.canvas, 100, 45, COLORS)
+        self.canvas.calls = []
+
+    def test_hover_moves_only_when_column_changes(self):
+        """Tes 1: Disk hover hanya dipindahkan saat kolom berubah, tanpa membuat item baru."""
+        self.assertEqual(self.view.items_created, 2 * ROW_COUNT * COLUMN_COUNT + 2)
+        for col in [3, 3, 3, 4, 4, 3]:
+            self.view.set_hover(col)
+        # Tampil + pindah ke 3, pindah ke 4, pindah ke 3
+        self.assertEqual(self.canvas.calls, [('coords', self.view.hover_disc), ('itemconfigure', self.view.hover_disc),
+                                             ('coords', self.view.hover_disc), ('coords', self.view.hover_disc)])
+        self.view.set_hover(None)
+        self.assertEqual(self.canvas.items[self.view.hover_disc]['state'], 'hidden')
+        self.assertEqual(self.view.items_created, 2 * ROW_COUNT * COLUMN_COUNT + 2)
+        self.assertEqual(self.view.timer.counts['hover'], 4)
+
+    def test_only_changed_cells_are_updated(self):
+        """Tes 2: set_cell dan sync hanya mengubah slot yang berbeda."""
+        game = Connect4Game.from_moves("3342")
+        self.view.set_cell(0, 3, PLAYER_PIECE)
+        self.view.set_cell(0, 3, PLAYER_PIECE) # Tidak berubah: tidak ada perintah
+        self.assertEqual(len(self.canvas.calls), 1)
+        self.assertEqual(self.canvas.items[self.view.discs[0][3]]['fill'], 'red')
+
+        self.canvas.calls = []
+        self.view.sync(game.board) # Tiga slot lain berubah
+        self.assertEqual(len(self.canvas.calls), 3)
+        self.assertEqual(self.canvas.items[self.view.discs[1][3]]['fill'], 'blue')
+
+        self.canvas.calls = []
+        self.view.sync(Connect4Game().board) # Restart: empat slot dikosongkan
+        self.assertEqual(len(self.canvas.calls), 4)
+        self.assertTrue(all(c[0] == 'itemconfigure' for c in self.canvas.calls))
+
+    def test_winning_line_and_frame_stats(self):
+        """Tes 3: Garis kemenangan memakai item tetap, dan FrameTimer meringkas setiap jenis frame."""
+        self.view.show_winning_line(((0, 0), (1, 1), (2, 2), (3, 3)))
+        line = self.canvas.items[self.view.winning_line]
+        self.assertEqual(line['state'], 'normal')
+        self.assertEqual(line['coords'], (50.0, 650.0, 350.0, 350.0))
+        self.view.hide_winning_line()
+        self.assertEqual(line['state'], 'hidden')
+
+        self.view.set_cell(0, 0, AI_PIECE)
+        summary = self.view.timer.summary()
+        self.assertEqual(summary['build']['frames'], 1)
+        self.assertEqual(summary['cell']['frames'], 1)
+        self.assertLessEqual(summary['cell']['mean_ms'], summary['cell']['max_ms'])
+        self.assertIn('cell: 1 frame', self.view.timer.get_stats_string())
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Board View...")
+    unittest.main()
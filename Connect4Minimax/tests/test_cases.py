@@ -96,6 +96,41 @@ class TestGameLogic(unittest.TestCase):
         self.assertIsNone(self.game.winning_move(PLAYER_PIECE))
         self.assertIsNone(self.game.winning_move(AI_PIECE))
 
+    def test_winning_move_at_matches_full_scan(self):
+        """Tes 10: winning_move_at() setelah setiap langkah sama dengan winning_move()."""
+        # Urutan langkah (kolom, bidak) yang diakhiri kemenangan diagonal (/) AI
+        moves = [(0, AI_PIECE), (1, PLAYER_PIECE), (1, AI_PIECE), (2, PLAYER_PIECE), (2, PLAYER_PIECE),
+                 (2, AI_PIECE), (3, PLAYER_PIECE), (3, AI_PIECE), (3, PLAYER_PIECE), (3, AI_PIECE)]
+        for col, piece in moves:
+            row = self.game.get_next_open_row(col)
+            self.game.drop_piece(row, col, piece)
+            self.assertEqual(self.game.winning_move_at(row, col, piece), self.game.winning_move(piece))
+        self.assertEqual(self.game.winning_move_at(3, 3, AI_PIECE), ((0, 0), (1, 1), (2, 2), (3, 3)))
+        self.assertIsNone(self.game.winning_move_at(2, 3, PLAYER_PIECE))
+
+    def test_play_and_undo(self):
+        """Tes 11: play() dan undo() mengubah papan in-place dan bisa dibatalkan."""
+        row = self.game.play(4, PLAYER_PIECE)
+        self.assertEqual(row, 0)
+        self.assertEqual(self.game.play(4, AI_PIECE), 1)
+        self.assertEqual(self.game.heights[4], 2)
+        self.assertEqual(self.game.undo(), (1, 4, AI_PIECE))
+        self.assertEqual(self.game.board[1][4], 0)
+        self.assertEqual(self.game.get_next_open_row(4), 1)
+        self.game.undo()
+        expected_board = np.zeros((ROW_COUNT, COLUMN_COUNT), dtype=int)
+        self.assertTrue(np.array_equal(self.game.board, expected_board))
+        self.assertEqual(self.game.move_history, [])
+
+    def test_copy_recomputes_heights(self):
+        """Tes 12: copy() menghitung ulang tinggi kolom dari papan yang diubah langsung."""
+        self.game.board[0][2] = PLAYER_PIECE
+        self.game.board[1][2] = AI_PIECE
+        clone = self.game.copy()
+        self.assertEqual(clone.heights[2], 2)
+        clone.play(2, PLAYER_PIECE)
+        self.assertEqual(self.game.board[2][2], 0, "Salinan seharusnya independen.")
+
 if __name__ == '__main__':
     # Menjalankan semua tes yang ada di dalam kelas ini
     print("Menjalankan unit tests untuk Game Logic...")
@@ -0,0 +1,106 @@
+# tests/test_endgame.py
+
+"""
+Unit tests untuk modul endgame.py.
+
+Memastikan bahwa solver endgame menghasilkan nilai pasti yang sama dengan
+pencarian brute force sampai akhir permainan, dan bahwa get_best_move
+beralih ke solver ketika slot kosong tinggal sedikit.
+"""
+
+import unittest
+import random
+import sys
+import os
+from math import inf
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
+from src.bitboard import BitboardGame
+from src.endgame import WIN_SCORE, solve_endgame
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+
+
+def brute_force_value(game, piece, empty):
+    """Nilai pasti posisi dengan mencoba semua kemungkinan sampai akhir."""
+    if empty == 0:
+        return 0
+    best = -inf
+    for col in game.get_valid_locations():
+        row = game.play(col, piece)
+        if game.winning_move_at(row, col, piece):
+            value = WIN_SCORE + empty - 1
+        else:
+            value = -brute_force_value(game, AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE, empty - 1)
+        game.undo()
+        best = max(best, value)
+    return best
+
+
+def random_endgame(rng, empty):
+    """Membuat BitboardGame acak yang belum berakhir dengan `empty` slot kosong."""
+    while True:
+        game = BitboardGame()
+        piece = PLAYER_PIECE
+        finished = False
+        while len(game.move_history) < 42 - empty:
+            col = rng.choice(game.get_valid_locations())
+            row = game.play(col, piece)
+            if game.winning_move_at(row, col, piece):
+                finished = True
+                break
+            piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+        if not finished:
+            return game, piece
+
+
+class TestEndgame(unittest.TestCase):
+    """
+    Kumpulan tes untuk solver endgame.
+    """
+
+    def test_solver_matches_brute_force(self):
+        """Tes 1: Skor solver dan nilai langkah yang dipilih sama dengan brute force."""
+        rng = random.Random(2)
+        for _ in range(30):
+            game, piece = random_endgame(rng, rng.randint(1, 8))
+            empty = 42 - len(game.move_history)
+            col, score, _ = solve_endgame(game, piece)
+            self.assertEqual(score, brute_force_value(game, piece, empty))
+
+            row = game.play(col, piece)
+            if game.winning_move_at(row, col, piece):
+                chosen_value = WIN_SCORE + empty - 1
+            else:
+                chosen_value = -brute_force_value(game, AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE, empty - 1)
+            game.undo()
+            self.assertEqual(chosen_value, score)
+
+    def test_score_encodes_distance(self):
+        """Tes 2: Kemenangan langsung bernilai lebih tinggi daripada kemenangan yang tertunda."""
+        game = BitboardGame()
+        for col in (0, 6, 1, 6, 2):
+            game.play(col, AI_PIECE if col != 6 else PLAYER_PIECE)
+        col, score, _ = solve_endgame(game, AI_PIECE)
+        self.assertEqual(col, 3)
+        self.assertEqual(score, WIN_SCORE + 42 - 5 - 1)
+
+    def test_get_best_move_switches_to_solver(self):
+        """Tes 3: get_best_move memakai solver di bawah batas slot kosong."""
+        game, piece = random_endgame(random.Random(6), 10)
+        numpy_game = Connect4Game()
+        for row, col, p in game.move_history:
+            numpy_game.play(col, p if piece == AI_PIECE else (AI_PIECE if p == PLAYER_PIECE else PLAYER_PIECE))
+        analyzer = PerformanceAnalyzer()
+        col = get_best_move(numpy_game, analyzer, depth=2, endgame_threshold=12, tactics=False)
+        self.assertEqual(analyzer.search_depth, 10)
+        expected_col, _, _ = solve_endgame(numpy_game, AI_PIECE)
+        self.assertEqual(col, expected_col)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Solver Endgame...")
+    unittest.main()
@@ -0,0 +1,73 @@
+# tests/test_engine_cli.py
+
+"""
+Unit tests untuk skrip engine_cli.py (engine headless) dan benchmark
+cold start-nya.
+
+Memastikan bahwa protokol teks menjawab sama dengan get_best_move, bahwa
+perintah yang salah tidak menghentikan engine, dan bahwa engine start
+dalam batas waktu tanpa mengimpor NumPy, psutil, atau GUI.
+"""
+
+import unittest
+import io
+import time
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, AI_PIECE, PLAYER_PIECE
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+from engine_cli import run
+from benchmark import measure_cold_start, COLD_START_BUDGET_MS
+
+
+def run_commands(commands):
+    """Menjalankan perintah di engine headless dan mengembalikan baris balasannya."""
+    out = io.StringIO()
+    run(io.StringIO(commands), out, opening_book=False)
+    return out.getvalue().splitlines()
+
+
+class TestEngineCli(unittest.TestCase):
+    """
+    Kumpulan tes untuk engine headless.
+    """
+
+    def test_go_depth_matches_get_best_move(self):
+        """Tes 1: 'go depth N' menjawab sama dengan get_best_move untuk pemain yang mendapat giliran."""
+        for moves in ("", "3342", "15421"):
+            lines = run_commands(f"isready\nposition {moves}\ngo depth 5\nquit\n")
+            self.assertEqual(lines[0], 'readyok')
+            self.assertTrue(lines[1].startswith('info depth 5 '))
+            first = AI_PIECE if len(moves) % 2 == 0 else PLAYER_PIECE
+            game = Connect4Game.from_moves(moves, first_piece=first)
+            expected = get_best_move(game, PerformanceAnalyzer(), depth=5, opening_book=False, verbose=False)
+            self.assertEqual(lines[2], f"bestmove {expected}")
+
+    def test_movetime_finished_games_and_errors(self):
+        """Tes 2: 'go movetime' menghormati waktu, posisi selesai dibalas 'none', dan perintah salah tidak fatal."""
+        start = time.perf_counter()
+        lines = run_commands("position startpos moves 3 3\ngo movetime 100\n")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIn(lines[-1], [f"bestmove {c}" for c in range(7)])
+
+        lines = run_commands("position 0101010\ngo depth 4\nposition 9\nfoo\ngo depth\nposition 0\ngo depth 2\nquit\ngo\n")
+        self.assertEqual(lines[0], 'bestmove none')
+        self.assertTrue(all(line.startswith('info string') for line in lines[1:4]))
+        self.assertTrue(lines[-1].startswith('bestmove '))
+        self.assertEqual(len(lines), 6) # Tidak ada balasan setelah 'quit'
+
+    def test_cold_start_within_budget(self):
+        """Tes 3: Engine headless start dalam batas waktu dan tidak mengimpor modul berat."""
+        result = measure_cold_start(trials=3)
+        self.assertEqual(result['heavy_modules'], [])
+        self.assertLess(result['median_ms'], COLD_START_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Engine CLI...")
+    unittest.main()
@@ -0,0 +1,131 @@
+# tests/test_engine_server.py
+
+"""
+Unit tests untuk skrip engine_server.py.
+
+Menjalankan layanan engine di localhost (port dipilih sistem atau Unix
+socket), lalu memastikan bahwa permintaan dari banyak sesi dilayani,
+backpressure menolak permintaan saat antrean penuh, anggaran waktu
+dihormati, dan statistik latensi/throughput dilaporkan.
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import COLUMN_COUNT
+from engine_server import EngineService, parse_position, RequestError
+
+# Opsi engine yang dipakai tes: tanpa opening book agar hasil tidak bergantung pada file
+ENGINE_OPTIONS = {'opening_book': False}
+
+
+async def exchange(reader, writer, requests):
+    """Mengirim semua permintaan sekaligus lalu membaca balasannya, diurutkan per id."""
+    for request in requests:
+        writer.write(json.dumps(request).encode() + b'\n')
+    await writer.drain()
+    replies = [json.loads(await reader.readline()) for _ in requests]
+    return sorted(replies, key=lambda reply: reply['id'])
+
+
+def run_with_service(scenario, unix_path=None, **kwargs):
+    """Menjalankan `scenario(service, reader, writer)` terhadap layanan yang baru dibuka."""
+    async def main():
+        service = EngineService(engine_options=ENGINE_OPTIONS, **kwargs)
+        await service.start('127.0.0.1', 0, unix_path=unix_path)
+        try:
+            if unix_path is not None:
+                reader, writer = await asyncio.open_unix_connection(unix_path)
+            else:
+                reader, writer = await asyncio.open_connection(*service.address[:2])
+            try:
+                return await scenario(service, reader, writer)
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+class TestEngineServer(unittest.TestCase):
+    """
+    Kumpulan tes untuk layanan engine asyncio.
+    """
+
+    def test_many_sessions_and_stats(self):
+        """Tes 1: Permintaan dari beberapa sesi dijawab dengan langkah valid, lalu stats melaporkannya."""
+        positions = ["", "3", "3342", "15421"]
+        requests = [{'id': i, 'op': 'move', 'session': f"g{i}", 'moves': moves, 'depth': 4}
+                    for i, moves in enumerate(positions)]
+        requests.append({'id': len(positions), 'op': 'ping'})
+
+        async def scenario(service, reader, writer):
+            replies = await exchange(reader, writer, requests)
+            stats = (await exchange(reader, writer, [{'id': 99, 'op': 'stats'}]))[0]['stats']
+            return replies, stats
+
+        replies, stats = run_with_service(scenario, workers=2)
+        for moves, reply in zip(positions, replies):
+            self.assertNotIn('error', reply)
+            self.assertIn(reply['move'], range(COLUMN_COUNT))
+            parse_position(moves + str(reply['move'])) # Langkah legal
+            self.assertGreaterEqual(reply['latency_ms'], reply['queue_ms'])
+        self.assertTrue(replies[-1]['pong'])
+        self.assertEqual(stats['completed'], len(positions))
+        self.assertEqual(stats['sessions'], len(positions))
+        self.assertLessEqual(stats['latency_p50_ms'], stats['latency_p99_ms'])
+        self.assertGreater(stats['throughput_rps'], 0)
+
+    def test_backpressure_rejects_when_queue_full(self):
+        """Tes 2: Dengan 1 worker dan antrean 1, permintaan berlebih ditolak 'busy' sementara sisanya selesai."""
+        requests = [{'id': 0, 'moves': "", 'time_ms': 400}]
+        requests += [{'id': i, 'moves': "3", 'depth': 2} for i in range(1, 5)]
+
+        async def scenario(service, reader, writer):
+            replies = await exchange(reader, writer, requests)
+            stats = (await exchange(reader, writer, [{'id': 99, 'op': 'stats'}]))[0]['stats']
+            return replies, stats
+
+        replies, stats = run_with_service(scenario, workers=1, max_queue=1)
+        errors = [reply.get('error') for reply in replies]
+        self.assertIsNone(errors[0])
+        self.assertIsNone(errors[1]) # Menunggu di antrean lalu dilayani
+        self.assertEqual(errors[2:], ['busy'] * 3)
+        self.assertEqual(stats['rejected'], 3)
+        self.assertEqual(stats['completed'], 2)
+
+    def test_budgets_and_bad_requests_over_unix_socket(self):
+        """Tes 3: Anggaran waktu yang terlampaui dibalas 'timeout', permintaan salah dibalas 'bad_request'."""
+        requests = [
+            {'id': 0, 'moves': "", 'depth': 16, 'budget_ms': 100},
+            {'id': 1, 'moves': "0000000"}, # Kolom penuh
+            {'id': 2, 'moves': "", 'depth': 0},
+            {'id': 3, 'op': 'unknown'},
+        ]
+
+        async def scenario(service, reader, writer):
+            replies = await exchange(reader, writer, requests)
+            writer.write(b"bukan json\n")
+            await writer.drain()
+            replies.append(json.loads(await reader.readline()))
+            return replies
+
+        with tempfile.TemporaryDirectory() as folder:
+            replies = run_with_service(scenario, unix_path=os.path.join(folder, 'engine.sock'), workers=1)
+        self.assertEqual([reply['error'] for reply in replies],
+                         ['timeout', 'bad_request', 'bad_request', 'bad_request', 'bad_request'])
+        with self.assertRaises(RequestError):
+            parse_position("3333333")
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Engine Server...")
+    unittest.main()
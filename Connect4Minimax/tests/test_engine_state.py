@@ -0,0 +1,109 @@
+# tests/test_engine_state.py
+
+"""
+Unit tests untuk modul engine_state.py.
+
+Memastikan bahwa data pencarian yang disimpan antar langkah dituakan
+(bukan dihapus), bahwa Transposition Table-nya tidak melebihi batas
+memori, dan bahwa pencarian berikutnya benar-benar lebih murah.
+"""
+
+import unittest
+import random
+import tracemalloc
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE
+from src.bitboard import BitboardGame
+from src.transposition import TranspositionTable, EXACT
+from src.move_ordering import MoveOrderer
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+from src.engine_state import EngineState
+
+# Opsi pencarian tes: tanpa opening book, solver endgame, dan taktik paksa
+OPTIONS = {'depth': 7, 'opening_book': False, 'endgame_threshold': None, 'verbose': False}
+
+
+class TestEngineState(unittest.TestCase):
+    """
+    Kumpulan tes untuk EngineState dan aging data pencarian.
+    """
+
+    def test_tt_and_orderer_aging(self):
+        """Tes 1: Entri generasi lama tetap terbaca tetapi boleh ditimpa; history dibagi dua dan killer digeser."""
+        tt = TranspositionTable(max_entries=8)
+        tt.store(1, 9, 10, EXACT, 0)
+        tt.store(9, 2, 20, EXACT, 1) # Slot sama, entri dalam di generasi yang sama dipertahankan
+        self.assertIsNotNone(tt.probe(1))
+        tt.new_generation()
+        self.assertIsNotNone(tt.probe(1)) # Masih bisa dipakai
+        self.assertEqual(tt.probes, 1)
+        tt.new_generation()
+        tt.store(9, 2, 20, EXACT, 1) # Entri lama yang dalam boleh ditimpa
+        self.assertIsNotNone(tt.probe(9))
+
+        orderer = MoveOrderer()
+        orderer.record_cutoff(4, ply=2, depth=3, piece=AI_PIECE, move_index=1)
+        orderer.age(2)
+        self.assertEqual(orderer.history[AI_PIECE][4], 4)
+        self.assertEqual(orderer.killers[0][0], 4)
+        self.assertEqual((orderer.cutoffs, orderer.first_move_cutoffs), (0, 0))
+
+    def test_memory_ceiling(self):
+        """Tes 2: Transposition Table yang penuh tetap di bawah batas memori EngineState."""
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            engine = EngineState(max_memory_mb=2)
+            rng = random.Random(1)
+            for _ in range(engine.tt.max_entries * 4):
+                engine.tt.store(rng.getrandbits(64), rng.randint(0, 9), rng.randint(-10 ** 6, 10 ** 6), EXACT, 3)
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertLessEqual(used, 2 * 1024 * 1024)
+        self.assertLessEqual(engine.memory_bytes(), 2 * 1024 * 1024)
+
+    def test_next_move_reuses_search(self):
+        """Tes 3: Setelah balasan yang diperkirakan, PV dipakai dan pencarian butuh lebih sedikit node."""
+        game = Connect4Game.from_moves("323")
+        engine, analyzer = EngineState(), PerformanceAnalyzer()
+        col = get_best_move(game, analyzer, engine=engine, **OPTIONS)
+        self.assertEqual(engine.pv[0], col)
+        self.assertGreater(len(engine.pv), 2)
+
+        game.play(engine.pv[0], AI_PIECE)
+        game.play(engine.pv[1], PLAYER_PIECE)
+        self.assertEqual(engine.preferred_move(BitboardGame.from_game(game)), engine.pv[2])
+        fresh = PerformanceAnalyzer()
+        get_best_move(game, fresh, **OPTIONS)
+        get_best_move(game, analyzer, engine=engine, **OPTIONS)
+        self.assertLess(analyzer.nodes_evaluated, fresh.nodes_evaluated)
+        self.assertEqual(engine.searches, 2)
+
+        engine.reset()
+        self.assertEqual((len(engine.tt), engine.pv, engine.searches), (0, [], 0))
+
+    def test_ponder_searches_share_generation(self):
+        """Tes 4: Pencarian pondering berturut-turut hanya memulai satu generasi TT baru."""
+        engine = EngineState()
+        game = BitboardGame.from_game(Connect4Game.from_moves("3"))
+        engine.new_search(game) # Langkah AI
+        self.assertEqual(engine.tt.generation, 1)
+        for _ in range(5): # Lima balasan manusia dipondering
+            engine.new_search(game, ponder=True)
+        self.assertEqual(engine.tt.generation, 2)
+        engine.new_search(game) # Langkah AI berikutnya
+        engine.new_search(game, ponder=True)
+        self.assertEqual(engine.tt.generation, 4)
+        self.assertEqual(engine.searches, 8)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Engine State...")
+    unittest.main()
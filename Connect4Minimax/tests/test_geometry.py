@@ -0,0 +1,107 @@
+# tests/test_geometry.py
+
+"""
+Unit tests untuk modul geometry.py.
+
+Memastikan bahwa tabel geometri default sama dengan konstanta yang dipakai
+sebelumnya, dan bahwa papan dengan ukuran serta panjang garis lain (termasuk
+bitboard yang lebih dari 64 bit) berperilaku sama di semua representasi.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import (Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT,
+                            CONNECT_LENGTH, ZOBRIST_KEYS)
+from src.geometry import get_geometry
+from src.bitboard import BitboardGame, WINDOW_MASKS
+from src.minimax import (score_position, score_bitboard, IncrementalEvaluator, get_best_move, search_position,
+                         WINDOW_INDICES)
+from src.analyzer import PerformanceAnalyzer
+
+
+class TestGeometry(unittest.TestCase):
+    """
+    Kumpulan tes untuk BoardGeometry dan papan non-default.
+    """
+
+    def test_default_geometry_matches_constants(self):
+        """Tes 1: Geometri default di-cache dan tabelnya sama dengan konstanta modul."""
+        geometry = get_geometry(ROW_COUNT, COLUMN_COUNT, CONNECT_LENGTH)
+        self.assertIs(geometry, get_geometry(ROW_COUNT, COLUMN_COUNT, CONNECT_LENGTH))
+        self.assertIs(Connect4Game().geometry, geometry)
+        self.assertEqual(len(geometry.windows), 69)
+        self.assertEqual(max(len(w) for w in geometry.cell_windows), 13)
+        self.assertEqual(geometry.window_masks, WINDOW_MASKS)
+        self.assertEqual(geometry.window_indices, WINDOW_INDICES)
+        self.assertIs(Connect4Game().zobrist_keys, ZOBRIST_KEYS)
+        with self.assertRaises(ValueError):
+            Connect4Game(rows=6, columns=7, connect=8)
+        with self.assertRaises(ValueError):
+            Connect4Game(rows=11, columns=7)
+
+    def test_connect_five_on_large_board(self):
+        """Tes 2: Kemenangan lima bidak pada papan 7x9 (72 bit) terdeteksi di kedua representasi."""
+        for game in (Connect4Game(rows=7, columns=9, connect=5), BitboardGame(7, 9, 5)):
+            for col in range(4):
+                game.drop_piece(0, col, PLAYER_PIECE)
+            self.assertFalse(game.winning_move(PLAYER_PIECE)) # Empat belum cukup
+            game.drop_piece(0, 8, PLAYER_PIECE)
+            game.drop_piece(0, 4, PLAYER_PIECE)
+            self.assertTrue(game.winning_move(PLAYER_PIECE))
+            self.assertEqual(game.winning_move_at(0, 4, PLAYER_PIECE), tuple((0, c) for c in range(5)))
+            # Garis vertikal di kolom paling kanan (bit di atas 64)
+            for row in range(1, 6):
+                game.drop_piece(row, 8, AI_PIECE)
+            self.assertEqual(game.winning_move_at(5, 8, AI_PIECE), tuple((r, 8) for r in range(1, 6)))
+
+    def test_representations_agree_on_random_positions(self):
+        """Tes 3: Skor NumPy, bitboard, dan inkremental sama pada papan 9x7 dan 7x9 connect-5."""
+        rng = random.Random(3)
+        for rows, columns, connect in [(9, 7, 4), (7, 9, 5)]:
+            for _ in range(20):
+                game = Connect4Game(rows=rows, columns=columns, connect=connect)
+                evaluator = IncrementalEvaluator(geometry=game.geometry)
+                for _ in range(rng.randint(0, 30)):
+                    col = rng.choice(game.get_valid_locations())
+                    row, piece = game.get_next_open_row(col), rng.choice([PLAYER_PIECE, AI_PIECE])
+                    game.drop_piece(row, col, piece)
+                    evaluator.add_piece(row, col, piece)
+                bitboard = BitboardGame.from_game(game)
+                expected = score_position(game.board, AI_PIECE, game.geometry)
+                self.assertEqual(score_bitboard(bitboard.bitboards[AI_PIECE], bitboard.bitboards[PLAYER_PIECE],
+                                                game.geometry), expected)
+                self.assertEqual(evaluator.current_score(), expected)
+                self.assertEqual(bitboard.winning_move(AI_PIECE), game.winning_move(AI_PIECE))
+
+        game = Connect4Game.from_moves("44", rows=7, columns=9, connect=5)
+        col = get_best_move(game, PerformanceAnalyzer(), depth=4, opening_book=False, verbose=False)
+        self.assertIn(col, range(9))
+
+    def test_even_width_is_mirror_symmetric(self):
+        """Tes 4: Pada papan 6x8 kedua kolom tengah bernilai sama, dan simetri tidak mengubah hasil pencarian."""
+        geometry = get_geometry(6, 8, 4)
+        self.assertEqual(geometry.center_columns, (3, 4))
+        self.assertEqual(geometry.center_order, (3, 4, 2, 5, 1, 6, 0, 7))
+        self.assertTrue(geometry.mirror_symmetric)
+        for col in range(8):
+            game, mirrored = Connect4Game(rows=6, columns=8), Connect4Game(rows=6, columns=8)
+            game.drop_piece(0, col, AI_PIECE)
+            mirrored.drop_piece(0, geometry.mirror_column(col), AI_PIECE)
+            self.assertEqual(score_position(game.board, AI_PIECE, geometry),
+                             score_position(mirrored.board, AI_PIECE, geometry))
+
+        for depth in (1, 4, 5):
+            results = [search_position(BitboardGame(6, 8), depth, -float('inf'), float('inf'), True,
+                                       symmetry=symmetry) for symmetry in (True, False)]
+            self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Geometry...")
+    unittest.main()
@@ -0,0 +1,66 @@
+# tests/test_move_ordering.py
+
+"""
+Unit tests untuk modul move_ordering.py.
+
+Memverifikasi urutan langkah yang dihasilkan setiap heuristik, dan bahwa
+pengurutan langkah hanya mempercepat pencarian tanpa mengubah skor Minimax.
+"""
+
+import unittest
+import sys
+import os
+from math import inf
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import PLAYER_PIECE, AI_PIECE
+from src.bitboard import BitboardGame
+from src.move_ordering import MoveOrderer, CENTER_ORDER
+from src import minimax
+from src.search_context import SearchContext
+
+
+class TestMoveOrdering(unittest.TestCase):
+    """
+    Kumpulan tes untuk kelas MoveOrderer.
+    """
+
+    def test_center_first_order(self):
+        """Tes 1: Tanpa data lain, kolom diurutkan dari tengah ke tepi."""
+        orderer = MoveOrderer()
+        self.assertEqual(CENTER_ORDER, [3, 2, 4, 1, 5, 0, 6])
+        self.assertEqual(orderer.order_moves([0, 1, 2, 4, 5, 6], 0, AI_PIECE), [2, 4, 1, 5, 0, 6])
+
+    def test_hash_move_then_killers_then_history(self):
+        """Tes 2: Hash move paling depan, lalu killer move, lalu urutan history."""
+        orderer = MoveOrderer()
+        orderer.record_cutoff(6, ply=4, depth=1, piece=AI_PIECE, move_index=2)
+        orderer.record_cutoff(0, ply=2, depth=5, piece=AI_PIECE, move_index=0)
+        ordered = orderer.order_moves(list(range(7)), 4, AI_PIECE, hash_move=5)
+        self.assertEqual(ordered[:4], [5, 6, 0, 3])
+        self.assertEqual((orderer.cutoffs, orderer.first_move_cutoffs), (2, 1))
+
+    def test_disabled_heuristics_keep_left_to_right(self):
+        """Tes 3: Semua heuristik dimatikan berarti urutan kiri ke kanan."""
+        orderer = MoveOrderer(center_first=False, use_hash_move=False, use_killers=False, use_history=False)
+        orderer.record_cutoff(6, ply=0, depth=3, piece=PLAYER_PIECE, move_index=1)
+        self.assertEqual(orderer.order_moves([0, 1, 5, 6], 0, PLAYER_PIECE, hash_move=6), [0, 1, 5, 6])
+
+    def test_ordering_preserves_minimax_score(self):
+        """Tes 4: Skor Minimax dengan pengurutan langkah sama dengan tanpa pengurutan."""
+        game = BitboardGame()
+        for ply, col in enumerate([3, 3, 2, 4, 4]):
+            game.play(col, PLAYER_PIECE if ply % 2 == 0 else AI_PIECE)
+        plain_ctx, ordered_ctx = SearchContext(), SearchContext()
+        _, plain_score = minimax.minimax_alpha_beta(game.copy(), 5, -inf, inf, True, ctx=plain_ctx)
+        _, ordered_score = minimax.minimax_alpha_beta(game.copy(), 5, -inf, inf, True, orderer=MoveOrderer(),
+                                                      ctx=ordered_ctx)
+        self.assertEqual(plain_score, ordered_score)
+        self.assertLess(ordered_ctx.nodes, plain_ctx.nodes)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Move Ordering...")
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/test_opening_book.py
+
+"""
+Unit tests untuk modul opening_book.py dan skrip book_generator.py.
+
+Memastikan bahwa file book yang ditulis bisa dibaca kembali lewat binary
+search, bahwa posisi cerminan ikut ditemukan, dan bahwa get_best_move
+memakai book sebelum mencari.
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, mirror_column
+from src.opening_book import OpeningBook, enumerate_book_positions, write_book
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+from book_generator import search_book_position
+
+
+class TestOpeningBook(unittest.TestCase):
+    """
+    Kumpulan tes untuk opening book.
+    """
+
+    def setUp(self):
+        """Membuat book kecil (ply <= 2, depth 4) di direktori sementara."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'book.bin')
+        self.positions = enumerate_book_positions(2)
+        self.entries = [search_book_position(moves, 4) for moves in self.positions]
+        write_book(self.path, self.entries, 4, 2)
+        self.book = OpeningBook(self.path)
+
+    def tearDown(self):
+        self.book.close()
+        self.tmpdir.cleanup()
+
+    def test_enumerated_positions_are_unique(self):
+        """Tes 1: Posisi book tidak memuat cerminan ganda (1 + 4 + 25 posisi sampai ply 2)."""
+        self.assertEqual(len(self.positions), 1 + 4 + 25)
+        self.assertEqual(len(self.book), len(self.positions))
+
+    def test_probe_finds_every_entry(self):
+        """Tes 2: Setiap entri yang ditulis ditemukan kembali dengan binary search."""
+        for key, best_move, score in self.entries:
+            self.assertEqual(self.book.probe_key(key), (best_move, score))
+        self.assertIsNone(self.book.probe_key(12345))
+
+    def test_mirrored_position_gets_mirrored_move(self):
+        """Tes 3: Posisi cerminan menghasilkan langkah yang dicerminkan."""
+        for col in range(7):
+            game, mirrored = Connect4Game(), Connect4Game()
+            game.play(col, PLAYER_PIECE)
+            mirrored.play(mirror_column(col), PLAYER_PIECE)
+            move, score = self.book.lookup(game)
+            mirrored_move, mirrored_score = self.book.lookup(mirrored)
+            self.assertEqual(score, mirrored_score)
+            if col != mirror_column(col):
+                self.assertEqual(mirrored_move, mirror_column(move))
+
+    def test_get_best_move_uses_book(self):
+        """Tes 4: get_best_move mengembalikan langkah book tanpa mengevaluasi node."""
+        game = Connect4Game()
+        game.play(3, PLAYER_PIECE)
+        game.play(2, AI_PIECE)
+        game.play(2, PLAYER_PIECE)
+        analyzer = PerformanceAnalyzer()
+        self.assertIsNone(self.book.lookup(game)) # Ply 3 di luar book
+
+        game.undo()
+        expected = self.book.lookup(game)[0]
+        self.assertEqual(get_best_move(game, analyzer, depth=4, opening_book=self.path), expected)
+        self.assertEqual(analyzer.nodes_evaluated, 0)
+        # Book lebih dangkal daripada depth yang diminta: tetap mencari
+        get_best_move(game, analyzer, depth=5, opening_book=self.path)
+        self.assertGreater(analyzer.nodes_evaluated, 0)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Opening Book...")
+    unittest.main()
@@ -0,0 +1,113 @@
+# tests/test_ponder.py
+
+"""
+Unit tests untuk pembatalan get_best_move dan modul ponder.py.
+
+Memastikan bahwa pencarian bisa dibatalkan dari thread lain tanpa mengubah
+analyzer, dan bahwa hasil pondering sama dengan pencarian biasa.
+"""
+
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+from src.search_context import SearchContext
+from src.ponder import Ponderer, predict_replies
+
+# Opsi pencarian yang dipakai tes: tanpa opening book agar hasil tidak bergantung pada file
+OPTIONS = {'depth': 4, 'opening_book': False}
+
+
+class CancelledAfterStart(SearchContext):
+    """SearchContext yang dibatalkan tepat setelah pengecekan pertama get_best_move."""
+    checks = 0
+
+    @property
+    def cancelled(self):
+        self.checks += 1
+        return self.checks > 1
+
+
+def wait_for_replies(ponderer, count, timeout=30):
+    """Menunggu sampai `count` balasan selesai dipondering."""
+    end = time.time() + timeout
+    while len(ponderer.pondered_replies()) < count and time.time() < end:
+        time.sleep(0.01)
+
+
+class TestCancellationAndPondering(unittest.TestCase):
+    """
+    Kumpulan tes untuk pembatalan dan pondering.
+    """
+
+    def test_cancel_from_another_thread(self):
+        """Tes 1: ctx.cancel() menghentikan pencarian dalam; get_best_move mengembalikan None."""
+        for options in ({'depth': 14}, {'time_limit_ms': 10000}):
+            analyzer = PerformanceAnalyzer()
+            ctx = SearchContext()
+            timer = threading.Timer(0.1, ctx.cancel)
+            timer.start()
+            start = time.time()
+            col = get_best_move(Connect4Game(), analyzer, opening_book=False, ctx=ctx, verbose=False, **options)
+            timer.join()
+            self.assertIsNone(col)
+            self.assertLess(time.time() - start, 2.0)
+            self.assertEqual(analyzer.history, []) # Analyzer tidak diubah
+
+    def test_pondered_move_matches_normal_search(self):
+        """Tes 2: Jawaban dari pondering sama dengan get_best_move pada posisi setelah balasan."""
+        game = Connect4Game.from_moves("3342") # Giliran manusia
+        ponderer = Ponderer()
+        ponderer.start(game, OPTIONS)
+        wait_for_replies(ponderer, 2)
+        replies = ponderer.pondered_replies()
+        self.assertEqual(replies[0], predict_replies(game)[0])
+
+        reply = replies[1]
+        result = ponderer.take(reply, OPTIONS)
+        self.assertIsNotNone(result)
+        position = game.copy()
+        position.drop_piece(position.get_next_open_row(reply), reply, PLAYER_PIECE)
+        expected = get_best_move(position, PerformanceAnalyzer(), verbose=False, **OPTIONS)
+        self.assertEqual(result[0], expected)
+        self.assertGreater(result[1].nodes_evaluated, 0)
+
+        analyzer = PerformanceAnalyzer()
+        analyzer.adopt_search(result[1])
+        self.assertEqual(analyzer.nodes_evaluated, result[1].nodes_evaluated)
+        self.assertTrue(analyzer.history[0]['pondered'])
+
+    def test_take_with_other_options_discards_results(self):
+        """Tes 3: Jika opsi pencarian berubah, hasil pondering tidak dipakai."""
+        game = Connect4Game.from_moves("3")
+        ponderer = Ponderer()
+        ponderer.start(game, OPTIONS)
+        wait_for_replies(ponderer, 1)
+        reply = ponderer.pondered_replies()[0]
+        self.assertIsNone(ponderer.take(reply, dict(OPTIONS, depth=5)))
+        self.assertIsNone(ponderer.take(reply, OPTIONS)) # Hasil sudah dibuang
+
+    def test_cancelled_shortcuts_leave_analyzer_untouched(self):
+        """Tes 4: Langkah taktis dan solver endgame tidak menulis ke analyzer jika ctx sudah dibatalkan."""
+        cases = [("33445", {}), # Blok wajib di kolom 2 atau 6
+                 ("054302053014515035524214112201462", {'endgame_threshold': 10})]
+        for moves, options in cases:
+            analyzer = PerformanceAnalyzer()
+            col = get_best_move(Connect4Game.from_moves(moves), analyzer, ctx=CancelledAfterStart(),
+                                verbose=False, **dict(OPTIONS, **options))
+            self.assertIsNone(col)
+            self.assertEqual(analyzer.history, [])
+            self.assertEqual(analyzer.to_dict(), PerformanceAnalyzer().to_dict())
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Pondering...")
+    unittest.main()
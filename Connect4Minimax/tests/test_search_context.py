@@ -0,0 +1,105 @@
+# tests/test_search_context.py
+
+"""
+Unit tests untuk modul search_context.py.
+
+Memastikan bahwa beberapa pencarian yang berjalan bersamaan di thread
+berbeda tetap memiliki statistik yang benar, dan bahwa batas, pembatalan,
+serta callback instrumentasi bekerja lewat SearchContext.
+"""
+
+import unittest
+import contextlib
+import io
+import threading
+import time
+import sys
+import os
+from math import inf
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game
+from src.bitboard import BitboardGame
+from src.minimax import get_best_move, search_position
+from src.analyzer import PerformanceAnalyzer
+from src.search_context import SearchContext, SearchTimeout, SearchCancelled
+
+# Posisi yang tidak dipaksa taktik, giliran AI (sama dengan benchmark suite)
+POSITIONS = ["", "15421", "132112346512342", "4520020100564"]
+
+
+def run_search(moves, depth, ctx=None):
+    analyzer = PerformanceAnalyzer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        col = get_best_move(Connect4Game.from_moves(moves), analyzer, depth=depth, opening_book=False, ctx=ctx)
+    return col, analyzer.nodes_evaluated, analyzer.nodes_per_ply
+
+
+class TestSearchContext(unittest.TestCase):
+    """
+    Kumpulan tes untuk SearchContext.
+    """
+
+    def test_concurrent_searches_keep_own_statistics(self):
+        """Tes 1: Pencarian bersamaan di beberapa thread memberi hasil dan jumlah node yang sama dengan serial."""
+        expected = {moves: run_search(moves, 6) for moves in POSITIONS}
+        results = {}
+        barrier = threading.Barrier(len(POSITIONS))
+
+        def worker(moves):
+            barrier.wait()
+            results[moves] = run_search(moves, 6)
+
+        threads = [threading.Thread(target=worker, args=(moves,)) for moves in POSITIONS]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, expected)
+
+    def test_instrumentation_callbacks(self):
+        """Tes 2: Callback on_node dan on_cutoff dipanggil sekali per node dan per cutoff."""
+        calls = {'nodes': 0, 'cutoffs': 0}
+
+        def on_node(game, depth):
+            calls['nodes'] += 1
+
+        def on_cutoff(ply, col, move_index):
+            calls['cutoffs'] += 1
+
+        ctx = SearchContext(on_node=on_node, on_cutoff=on_cutoff)
+        search_position(BitboardGame.from_game(Connect4Game.from_moves("15421")), 5, -inf, inf, True, ctx=ctx)
+        self.assertEqual(calls['nodes'], ctx.nodes)
+        self.assertEqual(calls['cutoffs'], sum(ctx.cutoffs_per_ply))
+        self.assertGreater(calls['cutoffs'], 0)
+
+    def test_limits_and_cancellation(self):
+        """Tes 3: Batas node melempar SearchTimeout, pembatalan melempar SearchCancelled."""
+        ctx = SearchContext(max_nodes=1000)
+        with self.assertRaises(SearchTimeout):
+            search_position(BitboardGame(), 10, -inf, inf, True, ctx=ctx)
+        self.assertLess(ctx.nodes, 1000 + 512) # Batas diperiksa setiap TIME_CHECK_INTERVAL node
+
+        ctx = SearchContext()
+        ctx.cancel()
+        self.assertTrue(ctx.cancelled)
+        with self.assertRaises(SearchCancelled):
+            search_position(BitboardGame(), 10, -inf, inf, True, ctx=ctx)
+
+    def test_movetime_respects_existing_deadline(self):
+        """Tes 4: Iterative deepening memakai deadline yang lebih awal dan memulihkan deadline pemanggil."""
+        options = {'opening_book': False, 'endgame_threshold': None, 'verbose': False}
+        deadline = time.time() + 0.2
+        ctx = SearchContext(deadline=deadline)
+        start = time.time()
+        col = get_best_move(BitboardGame(), PerformanceAnalyzer(), time_limit_ms=10000, ctx=ctx, **options)
+        self.assertIsNotNone(col)
+        self.assertLess(time.time() - start, 2.0) # Bukan 10 detik batas waktu langkah
+        self.assertEqual(ctx.deadline, deadline)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Search Context...")
+    unittest.main()
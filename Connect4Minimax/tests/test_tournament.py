@@ -0,0 +1,56 @@
+# tests/test_tournament.py
+
+"""
+Unit tests untuk skrip tournament.py (turnamen self-play tanpa GUI).
+"""
+
+import unittest
+import tempfile
+import json
+import sys
+import os
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tournament import parse_engine_spec, play_game, run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    """
+    Kumpulan tes untuk turnamen self-play.
+    """
+
+    def test_parse_engine_spec(self):
+        """Tes 1: Spesifikasi engine diubah menjadi argumen get_best_move dengan tipe yang benar."""
+        config = parse_engine_spec("depth=5, search=pvs, time_limit_ms=150.5, tactics=False, name=pvs5")
+        self.assertEqual(config, {'depth': 5, 'search': 'pvs', 'time_limit_ms': 150.5,
+                                  'tactics': False, 'name': 'pvs5'})
+
+    def test_play_game_is_reproducible(self):
+        """Tes 2: Permainan dengan seed yang sama menghasilkan urutan langkah yang sama."""
+        engines = ({'depth': 2}, {'depth': 3, 'name': 'b'})
+        first = play_game(0, 42, engines)
+        second = play_game(0, 42, engines)
+        self.assertEqual(first['moves'], second['moves'])
+        self.assertEqual(first['winner'], second['winner'])
+        self.assertIn(first['winner'], ('a', 'b', 'draw'))
+
+    def test_run_tournament_streams_jsonl(self):
+        """Tes 3: Setiap permainan ditulis ke JSONL dan ringkasannya konsisten."""
+        engines = ({'depth': 1}, {'depth': 2})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'results.jsonl')
+            summary = run_tournament(engines, games=4, workers=2, seed=1, output=output)
+            with open(output) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 4)
+        self.assertEqual(sorted(r['game'] for r in records), [0, 1, 2, 3])
+        self.assertEqual(summary['wins_a'] + summary['draws'] + summary['wins_b'], 4)
+        self.assertGreater(summary['games_per_sec'], 0)
+        self.assertGreater(summary['avg_move_ms_a'], 0)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Turnamen Self-Play...")
+    unittest.main()
@@ -0,0 +1,136 @@
+# tests/test_transposition.py
+
+"""
+Unit tests untuk modul transposition.py dan Zobrist hashing.
+
+Memastikan bahwa hash posisi diperbarui dengan benar secara inkremental,
+bahwa TranspositionTable menghormati batas ukuran dan kebijakan
+penggantiannya, serta bahwa Minimax dengan TT (termasuk kunci kanonik untuk
+simetri kiri-kanan) menghasilkan skor yang sama dengan Minimax biasa.
+"""
+
+import unittest
+import random
+import sys
+import os
+from math import inf
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, mirror_column
+from src.bitboard import BitboardGame
+from src.transposition import TranspositionTable, EXACT, LOWER_BOUND
+from src.minimax import minimax_alpha_beta
+
+
+class TestTransposition(unittest.TestCase):
+    """
+    Kumpulan tes untuk Zobrist hashing dan TranspositionTable.
+    """
+
+    def test_hash_is_incremental_and_order_independent(self):
+        """Tes 1: Hash sama untuk transposisi dan kembali ke nol setelah undo."""
+        game_a, game_b = Connect4Game(), Connect4Game()
+        for col, piece in [(3, PLAYER_PIECE), (2, AI_PIECE), (4, PLAYER_PIECE), (5, AI_PIECE)]:
+            game_a.play(col, piece)
+        for col, piece in [(4, PLAYER_PIECE), (5, AI_PIECE), (3, PLAYER_PIECE), (2, AI_PIECE)]:
+            game_b.play(col, piece)
+        self.assertEqual(game_a.hash, game_b.hash)
+        self.assertEqual(game_a.hash, game_a.compute_hash())
+        self.assertEqual(BitboardGame.from_board(game_a.board).hash, game_a.hash)
+        for _ in range(4):
+            game_a.undo()
+        self.assertEqual(game_a.hash, 0)
+
+    def test_store_and_probe(self):
+        """Tes 2: Entri yang disimpan bisa ditemukan kembali dan statistik tercatat."""
+        tt = TranspositionTable(max_entries=16)
+        tt.store(12345, 3, 42, EXACT, 4)
+        self.assertEqual(tt.probe(12345), (12345, 3, 42, EXACT, 4))
+        self.assertIsNone(tt.probe(99999))
+        self.assertEqual((tt.probes, tt.hits), (2, 1))
+
+    def test_replacement_policy(self):
+        """Tes 3: Kebijakan 'depth' mempertahankan entri yang lebih dalam, 'always' tidak."""
+        for policy, expected_key in (('depth', 1), ('always', 9)):
+            tt = TranspositionTable(max_entries=8, replacement=policy)
+            tt.store(1, 5, 10, EXACT, 0)
+            tt.store(9, 2, 20, LOWER_BOUND, 1) # 9 % 8 == 1, slot yang sama
+            self.assertIsNotNone(tt.probe(expected_key), f"Kebijakan {policy} salah.")
+            self.assertEqual(len(tt), 1)
+
+    def test_search_with_tt_matches_plain_search(self):
+        """Tes 4: Minimax dengan TT menghasilkan langkah dan skor yang sama."""
+        rng = random.Random(5)
+        for _ in range(10):
+            game = BitboardGame()
+            for ply in range(rng.randint(0, 10)):
+                game.play(rng.choice(game.get_valid_locations()), PLAYER_PIECE if ply % 2 == 0 else AI_PIECE)
+                if game.winning_move(PLAYER_PIECE) or game.winning_move(AI_PIECE):
+                    game.undo()
+                    break
+            plain = minimax_alpha_beta(game.copy(), 4, -inf, inf, True)
+            with_tt = minimax_alpha_beta(game.copy(), 4, -inf, inf, True, tt=TranspositionTable(1 << 12))
+            self.assertEqual(plain, with_tt)
+
+    def test_mirrored_positions_share_canonical_hash(self):
+        """Tes 5: Posisi dan cerminannya mendapat hash kanonik yang sama di kedua backend."""
+        rng = random.Random(8)
+        for _ in range(30):
+            moves = [rng.randrange(7) for _ in range(rng.randint(0, 12))]
+            games = [Connect4Game(), BitboardGame()]
+            mirrored_games = [Connect4Game(), BitboardGame()]
+            for ply, col in enumerate(moves):
+                piece = PLAYER_PIECE if ply % 2 == 0 else AI_PIECE
+                for game in games:
+                    if game.is_valid_location(col):
+                        game.play(col, piece)
+                for game in mirrored_games:
+                    if game.is_valid_location(mirror_column(col)):
+                        game.play(mirror_column(col), piece)
+            for game, mirrored in zip(games, mirrored_games):
+                self.assertEqual(game.mirror_hash, mirrored.hash)
+                self.assertEqual(game.canonical_hash()[0], mirrored.canonical_hash()[0])
+            self.assertEqual(games[0].mirror_hash, games[0].compute_hash(mirrored=True))
+            self.assertEqual(games[0].is_symmetric(), games[1].is_symmetric())
+
+    def test_symmetric_search_matches_plain_search(self):
+        """Tes 6: Pencarian dengan simetri menghasilkan langkah dan skor yang sama, juga untuk cerminannya (7 dan 8 kolom)."""
+        rng = random.Random(13)
+        for rows, columns in [(6, 7), (6, 8)] * 5:
+            game = BitboardGame(rows, columns)
+            for ply in range(rng.choice([0, 1, 2, rng.randint(0, 10)])):
+                game.play(rng.choice(game.get_valid_locations()), PLAYER_PIECE if ply % 2 == 0 else AI_PIECE)
+                if game.winning_move(PLAYER_PIECE) or game.winning_move(AI_PIECE):
+                    game.undo()
+                    break
+            plain = minimax_alpha_beta(game.copy(), 4, -inf, inf, True, tt=TranspositionTable(1 << 12))
+            tt = TranspositionTable(1 << 12)
+            symmetric = minimax_alpha_beta(game.copy(), 4, -inf, inf, True, tt=tt, symmetry=True)
+            self.assertEqual(plain, symmetric)
+
+            # Cerminan posisi dicari dengan TT yang sama: skor sama, langkah ikut dicerminkan
+            mirrored = BitboardGame(rows, columns)
+            for row, col, piece in game.move_history:
+                mirrored.play(game.geometry.mirror_column(col), piece)
+            mirrored_col, mirrored_score = minimax_alpha_beta(mirrored, 4, -inf, inf, True, tt=tt, symmetry=True)
+            self.assertEqual(mirrored_score, symmetric[1])
+            if not game.is_symmetric():
+                self.assertEqual(mirrored_col, game.geometry.mirror_column(symmetric[0]))
+
+    def test_slots_are_allocated_lazily(self):
+        """Tes 7: Tabel baru belum berisi slot, dan slot terisi tidak pernah melebihi max_entries."""
+        self.assertEqual(len(TranspositionTable(1 << 30)), 0)
+        tt = TranspositionTable(max_entries=8)
+        rng = random.Random(5)
+        for _ in range(100):
+            tt.store(rng.getrandbits(64), rng.randint(0, 9), 0, EXACT, None)
+        self.assertEqual(len(tt), 8)
+        tt.clear()
+        self.assertEqual(len(tt), 0)
+
+
+if __name__ == '__main__':
+    print("Menjalankan unit tests untuk Transposition Table...")
+    unittest.main()
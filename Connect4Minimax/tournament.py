@@ -0,0 +1,227 @@
+"""
+Skrip Turnamen Self-Play Tanpa GUI.
+
+Skrip ini dijalankan secara terpisah dari aplikasi utama (GUI), sama seperti
+`report_generator.py`. Dua konfigurasi engine (misalnya depth, batas waktu,
+atau mode pencarian yang berbeda) saling bertanding ribuan kali secara
+paralel, sehingga perubahan pada engine bisa divalidasi dengan volume
+permainan yang besar.
+
+Proses yang dilakukan:
+1. Setiap permainan memakai seed sendiri (turunan dari `--seed`) untuk
+   beberapa langkah pembuka acak, sehingga permainan bervariasi tetapi
+   tetap bisa diulang. Setiap pembukaan dimainkan dua kali dengan warna
+   yang ditukar agar adil.
+2. Permainan dijalankan paralel di ProcessPoolExecutor.
+3. Hasil setiap permainan ditulis ke file JSONL begitu selesai.
+4. Di akhir, ringkasan menang/seri/kalah, rata-rata latensi langkah, dan
+   jumlah permainan per detik dicetak.
+
+Contoh:
+    python tournament.py --games 1000 --workers 4 --engine-a depth=4 --engine-b depth=5,search=pvs
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Menambahkan direktori root proyek ke path agar bisa mengimpor 'src'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from src.game_logic import Connect4Game, PLAYER_PIECE, AI_PIECE, ROW_COUNT, COLUMN_COUNT
+from src.minimax import get_best_move
+from src.analyzer import PerformanceAnalyzer
+
+# Jumlah langkah pembuka acak default di setiap permainan
+DEFAULT_RANDOM_PLIES = 4
+
+def parse_engine_spec(spec):
+    """
+    Mengubah spesifikasi engine seperti "depth=4,search=pvs,time_limit_ms=200"
+    menjadi dict argumen untuk get_best_move. Kunci 'name' dipakai sebagai
+    nama engine di laporan.
+    """
+    config = {}
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        key, _, value = part.partition('=')
+        if value in ('True', 'False', 'None'):
+            value = {'True': True, 'False': False, 'None': None}[value]
+        else:
+            for cast in (int, float):
+                try:
+                    value = cast(value)
+                    break
+                except ValueError:
+                    pass
+        config[key.strip()] = value
+    return config
+
+def engine_name(config):
+    """
+    Nama engine untuk laporan: 'name' jika ada, atau ringkasan konfigurasinya.
+    """
+    if 'name' in config:
+        return str(config['name'])
+    return ','.join(f"{k}={v}" for k, v in sorted(config.items())) or 'default'
+
+def _position_for(moves, mover_first):
+    """
+    Membuat Connect4Game dari urutan kolom dengan engine yang akan melangkah
+    sebagai AI_PIECE, karena get_best_move selalu mencari untuk AI.
+    """
+    game = Connect4Game()
+    piece = AI_PIECE if mover_first else PLAYER_PIECE
+    for col in moves:
+        game.play(col, piece)
+        piece = AI_PIECE if piece == PLAYER_PIECE else PLAYER_PIECE
+    return game
+
+def _quiet_moves(game, piece):
+    """
+    Langkah valid yang tidak langsung memenangkan permainan, untuk pembukaan acak.
+    """
+    quiet = []
+    for col in game.get_valid_locations():
+        row = game.play(col, piece)
+        if game.winning_move_at(row, col, piece) is None:
+            quiet.append(col)
+        game.undo()
+    return quiet or game.get_valid_locations()
+
+def play_game(index, seed, engines, random_plies=DEFAULT_RANDOM_PLIES):
+    """
+    Memainkan satu permainan engine-vs-engine tanpa GUI.
+
+    Args:
+        index (int): Nomor permainan; permainan ganjil menukar warna.
+        seed (int): Seed untuk pembukaan acak dan tie-break acak di Minimax.
+        engines (tuple): (konfigurasi engine A, konfigurasi engine B).
+        random_plies (int): Jumlah langkah pembuka acak.
+
+    Returns:
+        dict: Catatan permainan (siap ditulis sebagai satu baris JSON).
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    first = index % 2 # 0: engine A melangkah pertama, 1: engine B
+    game = Connect4Game()
+    moves = []
+    latencies = ([], [])
+    winner = 'draw'
+    analyzer = PerformanceAnalyzer()
+
+    while len(moves) < ROW_COUNT * COLUMN_COUNT:
+        turn = (first + len(moves)) % 2
+        piece = PLAYER_PIECE if len(moves) % 2 == 0 else AI_PIECE
+        if len(moves) < random_plies:
+            col = rng.choice(_quiet_moves(game, piece))
+        else:
+            position = _position_for(moves, mover_first=len(moves) % 2 == 0)
+            options = {key: value for key, value in engines[turn].items() if key != 'name'}
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                col = get_best_move(position, analyzer, **options)
+            latencies[turn].append(round((time.perf_counter() - start) * 1000, 3))
+        row = game.play(col, piece)
+        moves.append(col)
+        if game.winning_move_at(row, col, piece) is not None:
+            winner = 'a' if turn == 0 else 'b'
+            break
+    return {
+        'game': index,
+        'seed': seed,
+        'first': 'a' if first == 0 else 'b',
+        'moves': ''.join(str(col) for col in moves),
+        'winner': winner,
+        'latency_ms': {'a': latencies[0], 'b': latencies[1]},
+    }
+
+def _game_seed(base_seed, index):
+    # Dua permainan berturut-turut memakai pembukaan yang sama dengan warna ditukar
+    return base_seed * 1000003 + index // 2
+
+def summarize(records, engines, elapsed_s):
+    """
+    Menghitung ringkasan turnamen dari catatan permainan.
+
+    Returns:
+        dict: Hasil menang/seri/kalah dari sudut pandang engine A, rata-rata
+        latensi langkah per engine (ms), dan jumlah permainan per detik.
+    """
+    wins = sum(1 for r in records if r['winner'] == 'a')
+    losses = sum(1 for r in records if r['winner'] == 'b')
+    draws = len(records) - wins - losses
+    summary = {
+        'engine_a': engine_name(engines[0]),
+        'engine_b': engine_name(engines[1]),
+        'games': len(records),
+        'wins_a': wins,
+        'draws': draws,
+        'wins_b': losses,
+        'elapsed_s': elapsed_s,
+        'games_per_sec': len(records) / elapsed_s if elapsed_s > 0 else 0.0,
+    }
+    for side in ('a', 'b'):
+        latencies = [ms for r in records for ms in r['latency_ms'][side]]
+        summary[f'avg_move_ms_{side}'] = sum(latencies) / len(latencies) if latencies else 0.0
+    return summary
+
+def run_tournament(engines, games, workers, seed=0, output=None, random_plies=DEFAULT_RANDOM_PLIES):
+    """
+    Menjalankan `games` permainan secara paralel dan menulis setiap hasil ke
+    file JSONL `output` (jika diisi) segera setelah permainan selesai.
+
+    Returns:
+        dict: Ringkasan turnamen (lihat summarize).
+    """
+    start_time = time.time()
+    records = []
+    out = open(output, 'w') if output else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_game, i, _game_seed(seed, i), engines, random_plies)
+                       for i in range(games)]
+            for future in as_completed(futures):
+                record = future.result()
+                records.append(record)
+                if out is not None:
+                    out.write(json.dumps(record) + '\n')
+                    out.flush()
+    finally:
+        if out is not None:
+            out.close()
+    return summarize(records, engines, time.time() - start_time)
+
+def print_summary(summary):
+    """
+    Mencetak ringkasan turnamen.
+    """
+    print(f"Engine A: {summary['engine_a']}")
+    print(f"Engine B: {summary['engine_b']}")
+    print(f"Permainan: {summary['games']} (A menang {summary['wins_a']}, seri {summary['draws']}, "
+          f"B menang {summary['wins_b']})")
+    print(f"Rata-rata latensi langkah: A {summary['avg_move_ms_a']:.2f} ms, B {summary['avg_move_ms_b']:.2f} ms")
+    print(f"Throughput: {summary['games_per_sec']:.2f} permainan/detik ({summary['elapsed_s']:.1f} s)")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Turnamen self-play Connect-Four tanpa GUI.")
+    parser.add_argument('--games', type=int, default=100, help="Jumlah permainan.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Jumlah proses worker.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed dasar untuk pembukaan acak.")
+    parser.add_argument('--random-plies', type=int, default=DEFAULT_RANDOM_PLIES,
+                        help="Jumlah langkah pembuka acak di setiap permainan.")
+    parser.add_argument('--engine-a', default='depth=4', help="Konfigurasi engine A, misalnya 'depth=4,search=pvs'.")
+    parser.add_argument('--engine-b', default='depth=4', help="Konfigurasi engine B.")
+    parser.add_argument('--output', default='tournament_results.jsonl', help="File JSONL untuk hasil setiap permainan.")
+    args = parser.parse_args()
+
+    engines = (parse_engine_spec(args.engine_a), parse_engine_spec(args.engine_b))
+    print(f"Menjalankan {args.games} permainan dengan {args.workers} worker...")
+    summary = run_tournament(engines, args.games, args.workers, args.seed, args.output, args.random_plies)
+    print_summary(summary)